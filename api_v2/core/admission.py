@@ -0,0 +1,179 @@
+"""
+Admission control for Claude calls.
+
+At most `limit` calls run at once per process. Callers beyond that wait in
+one bounded queue ordered by priority class (interactive chat first, then
+readings, then weekly readings, then background work), each with a deadline
+for getting a slot. When the queue is full a higher-priority arrival evicts
+the lowest-priority waiter; otherwise the arrival is rejected. Rejections
+raise AdmissionRejected with a Retry-After estimate, which the API turns
+into a 503 (see main.py) instead of piling more requests onto the upstream
+and getting its 429s back.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+
+logger = logging.getLogger(__name__)
+
+# Lower is more urgent
+PRIORITY_CLASSES = ('interactive', 'reading', 'weekly', 'background')
+ENDPOINT_PRIORITIES = {
+    'chat': 0,
+    'translate': 0,
+    'test': 0,
+    'daily': 1,
+    'three_card': 1,
+    'trial_three_card': 1,
+    'weekly': 2,
+    'chat_summary': 3,
+    'pregenerate': 3,
+    'trial_pool': 3,
+    'welcome_catalog': 3,
+    'numerology_catalog': 3,
+}
+DEFAULT_PRIORITY = 1
+# Longest wait for a slot per priority class, seconds
+QUEUE_DEADLINES = (5.0, 15.0, 20.0, 120.0)
+
+
+class AdmissionRejected(Exception):
+    """No slot for this call - shed it (reason: queue_full, deadline or evicted)"""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"Claude calls over capacity ({reason}), retry after {retry_after}s")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Global concurrency limit with a bounded priority wait queue"""
+
+    def __init__(self, limit: int, max_queue: int, deadlines=QUEUE_DEADLINES):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.deadlines = deadlines
+        self.active = 0
+        self.queued = 0
+        # (priority, arrival, future) - cancelled/evicted entries are skipped lazily
+        self._waiters = []
+        self._arrivals = itertools.count()
+        # Moving average of how long a call holds its slot, for Retry-After
+        self.hold_seconds = 5.0
+        self.counters = {
+            'admitted': 0,
+            'queued': 0,
+            'rejected_queue_full': 0,
+            'rejected_deadline': 0,
+            'evicted': 0
+        }
+        self.waits = {name: {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0} for name in PRIORITY_CLASSES}
+
+    def retry_after(self) -> int:
+        """Rough seconds until the queue ahead of a new arrival drains"""
+        return max(1, min(60, math.ceil(self.hold_seconds * (self.queued + 1) / self.limit)))
+
+    def _reject(self, reason: str) -> AdmissionRejected:
+        self.counters[f"rejected_{reason}"] += 1
+        return AdmissionRejected(reason, self.retry_after())
+
+    def _evict_below(self, priority: int) -> bool:
+        """Make room by rejecting the newest waiter of the lowest class below `priority`"""
+        pending = [entry for entry in self._waiters if not entry[2].done()]
+        victim = max(pending, default=None)
+        if victim is None or victim[0] <= priority:
+            return False
+        victim[2].set_exception(AdmissionRejected('evicted', self.retry_after()))
+        self.queued -= 1
+        self.counters['evicted'] += 1
+        logger.warning(f"Admission queue full - evicted a queued {PRIORITY_CLASSES[victim[0]]} call")
+        return True
+
+    async def _acquire(self, priority: int):
+        if self.active < self.limit and not self.queued:
+            self.active += 1
+            return
+        if self.queued >= self.max_queue and not self._evict_below(priority):
+            raise self._reject('queue_full')
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._arrivals), waiter))
+        self.queued += 1
+        self.counters['queued'] += 1
+        try:
+            # shield: a timeout must not cancel a slot that is being handed over
+            await asyncio.wait_for(asyncio.shield(waiter), self.deadlines[priority])
+        except asyncio.TimeoutError:
+            if self._abandon(waiter):
+                return
+            raise self._reject('deadline')
+        except asyncio.CancelledError:
+            if self._abandon(waiter):
+                self._release()
+            raise
+
+    def _abandon(self, waiter: asyncio.Future) -> bool:
+        """A waiter is giving up - True if it was handed a slot meanwhile"""
+        if waiter.done():
+            return not waiter.cancelled() and waiter.exception() is None
+        waiter.cancel()
+        self.queued -= 1
+        return False
+
+    def _release(self):
+        """Hand the slot to the most urgent waiter, or free it"""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                self.queued -= 1
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    @asynccontextmanager
+    async def slot(self, endpoint: str) -> AsyncIterator[None]:
+        """Hold one of the `limit` slots for the duration of the block"""
+        priority = ENDPOINT_PRIORITIES.get(endpoint, DEFAULT_PRIORITY)
+        start = time.monotonic()
+        await self._acquire(priority)
+        admitted = time.monotonic()
+
+        waited = admitted - start
+        waits = self.waits[PRIORITY_CLASSES[priority]]
+        waits['count'] += 1
+        waits['total_seconds'] += waited
+        waits['max_seconds'] = max(waits['max_seconds'], waited)
+        self.counters['admitted'] += 1
+        try:
+            yield
+        finally:
+            self.hold_seconds = 0.8 * self.hold_seconds + 0.2 * (time.monotonic() - admitted)
+            self._release()
+
+    def stats(self) -> Dict:
+        queued_by_class = dict.fromkeys(PRIORITY_CLASSES, 0)
+        for priority, _, waiter in self._waiters:
+            if not waiter.done():
+                queued_by_class[PRIORITY_CLASSES[priority]] += 1
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queue_depth": self.queued,
+            "queue_capacity": self.max_queue,
+            "queued_by_class": queued_by_class,
+            "avg_hold_seconds": round(self.hold_seconds, 3),
+            **self.counters,
+            "wait_seconds": {
+                name: {
+                    "count": waits['count'],
+                    "avg": round(waits['total_seconds'] / waits['count'], 4) if waits['count'] else 0.0,
+                    "max": round(waits['max_seconds'], 4)
+                }
+                for name, waits in self.waits.items()
+            }
+        }
@@ -13,6 +13,72 @@ class Settings(BaseSettings):
     ANTHROPIC_API_KEY: str = os.getenv('ANTHROPIC_API_KEY', '')
     ADMIN_KEY: str = os.getenv('ADMIN_KEY', '29isthenewOne')
     
+    # Firestore I/O runs on a bounded thread pool (see core/repository.py)
+    FIRESTORE_MAX_WORKERS: int = 16
+    
+    # Cross-worker dedup of reading generation (see core/single_flight.py)
+    GENERATION_LEASE_ENABLED: bool = False
+    GENERATION_LEASE_SECONDS: int = 90
+    
+    # nfc_users profile cache (see core/profile_cache.py)
+    PROFILE_CACHE_MAX_SIZE: int = 1024
+    PROFILE_CACHE_TTL_SECONDS: int = 60
+    
+    # Chat history (chat_sessions/{id}/messages, see services/chat_service.py)
+    CHAT_CONTEXT_MESSAGES: int = 20
+    CHAT_HISTORY_PAGE_SIZE: int = 50
+    
+    # Chat context window (see utils/chat_context.py)
+    CHAT_INPUT_TOKEN_BUDGET: int = 6000
+    CHAT_VERBATIM_TURNS: int = 4
+    CHAT_SUMMARY_MIN_MESSAGES: int = 4
+    
+    # Card draws seeded per (nfc_id, day, spread) - every worker redraws the
+    # same cards, so a lost cached reading regenerates with the same spread.
+    # Needs CARD_DRAW_SECRET, so draws can't be precomputed; without it
+    # ReadingService logs an error and draws at random.
+    SEEDED_CARD_DRAWS: bool = True
+    CARD_DRAW_SECRET: str = os.getenv('CARD_DRAW_SECRET', '')
+    
+    # Claude calls go through core/llm_gateway.py: one shared client,
+    # per-endpoint timeouts, jittered retries and a circuit breaker
+    LLM_TIMEOUT_SECONDS: float = 60.0
+    LLM_MAX_RETRIES: int = 3
+    LLM_RETRY_BASE_SECONDS: float = 0.5
+    LLM_RETRY_MAX_SECONDS: float = 8.0
+    LLM_BREAKER_FAILURES: int = 5
+    LLM_BREAKER_RESET_SECONDS: float = 30.0
+    # Admission control (core/admission.py): concurrent Claude calls per
+    # process and how many may wait for a slot before requests get a 503
+    LLM_CONCURRENCY_LIMIT: int = 8
+    LLM_QUEUE_SIZE: int = 32
+    # Latency SLOs for on-demand readings (seconds, 0 = always wait): past
+    # it the user gets a quick reading of the same cards while the full one
+    # finishes in the background and fills the cache for the next tap
+    DAILY_READING_SLO_SECONDS: float = 20.0
+    THREE_CARD_READING_SLO_SECONDS: float = 25.0
+    
+    # Ready anonymous trial readings per worker (core/reading_pool.py, 0 = off),
+    # refilled in the background once the pool is down to the low watermark
+    TRIAL_POOL_SIZE: int = 8
+    TRIAL_POOL_LOW_WATERMARK: int = 3
+    TRIAL_POOL_CONCURRENCY: int = 2
+    
+    # Nightly pre-generation (jobs/pregenerate_daily.py): Message Batches
+    # expire after 24h; a batch still running after this long is canceled
+    # and its missing readings are generated live on the first tap
+    PREGENERATION_BATCH_MAX_WAIT_SECONDS: float = 6 * 3600
+    
+    # Content-addressed cache of pure Claude results (core/llm_cache.py):
+    # in-memory LRU in front of Firestore llm_cache/{hash} - give that
+    # collection a TTL policy on expires_at
+    LLM_CACHE_MEMORY_SIZE: int = 512
+    LLM_CACHE_PERSISTENT: bool = True
+    
+    # Serve the React page and /static from this app instead of the Flask
+    # front end (see routes/frontend.py)
+    SERVE_FRONTEND: bool = False
+    
     # Configure Pydantic to ignore extra fields from .env
     model_config = ConfigDict(
         env_file=".env",
@@ -7,6 +7,10 @@ import json
 import firebase_admin
 from firebase_admin import credentials, firestore
 
+from api_v2.core.config import settings
+from api_v2.core.repository import FirestoreRepository
+from api_v2.core.profile_cache import UserProfileCache
+
 def get_firebase_app():
     """Initialize and return Firebase app."""
     try:
@@ -54,4 +58,14 @@ def get_db():
         raise
 
 # Initialize database connection at module level
-db = get_db()
\ No newline at end of file
+db = get_db()
+
+# Async repository - services go through this instead of calling db directly
+repository = FirestoreRepository(db, max_workers=settings.FIRESTORE_MAX_WORKERS)
+
+# Shared nfc_users cache - services invalidate it after writing a user
+profile_cache = UserProfileCache(
+    repository,
+    max_size=settings.PROFILE_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PROFILE_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,170 @@
+"""
+Content-addressed cache for Claude results that are pure functions of their
+prompt (translations and anonymous trial interpretations).
+
+The key is a SHA-256 of the request parameters - model, max_tokens,
+temperature, system and messages - with every string normalised (Unicode
+NFC, line endings, trailing whitespace), so the same prompt hits the same
+entry from any call site. Entries live in two tiers:
+  memory     - TTLCache (LRU) per process
+  persistent - Firestore llm_cache/{key}; expires_at is checked on read and
+               is meant to carry a Firestore TTL policy that deletes
+               expired documents
+Call sites opt in with get_or_create(endpoint, params, generate, ttl) and
+only ever cache successful generations. Hits, misses and the generation
+time each hit saved are counted per endpoint for /metrics.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+import unicodedata
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from api_v2.core.cache import TTLCache
+from api_v2.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def normalise(value: Any) -> Any:
+    """Strings in NFC with \\n line endings and no trailing whitespace, recursively"""
+    if isinstance(value, str):
+        text = unicodedata.normalize('NFC', value).replace('\r\n', '\n')
+        return '\n'.join(line.rstrip() for line in text.split('\n')).strip()
+    if isinstance(value, dict):
+        return {key: normalise(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalise(item) for item in value]
+    return value
+
+
+def cache_key(params: Dict) -> str:
+    """Content address of a messages.create request"""
+    canonical = json.dumps(normalise(params), sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class FirestoreResultStore:
+    """Persistent tier: one llm_cache/{key} document per result"""
+
+    COLLECTION = 'llm_cache'
+
+    def __init__(self, repository):
+        self.repo = repository
+
+    async def get(self, key: str) -> Optional[Dict]:
+        entry = await self.repo.get_dict(self.repo.document(self.COLLECTION, key))
+        if entry is None or entry['expires_at'] <= datetime.now(timezone.utc):
+            return None
+        return entry
+
+    async def set(self, key: str, entry: Dict):
+        await self.repo.set(self.repo.document(self.COLLECTION, key), entry)
+
+
+class LLMResultCache:
+    """Two-tier memoisation of Claude text results"""
+
+    def __init__(self, memory_size: int, store: Optional[FirestoreResultStore] = None):
+        self.memory = TTLCache(max_size=memory_size, ttl_seconds=3600)
+        self.store = store
+        self._endpoints: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _count(self, endpoint: str, outcome: str, saved_seconds: float = 0.0):
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, {
+                'memory_hits': 0,
+                'store_hits': 0,
+                'misses': 0,
+                'saved_seconds': 0.0
+            })
+            stats[outcome] += 1
+            stats['saved_seconds'] += saved_seconds
+
+    async def _lookup(self, key: str) -> Optional[Dict]:
+        entry = self.memory.get(key)
+        if entry is not None:
+            return {**entry, 'tier': 'memory'}
+        if self.store is None:
+            return None
+        try:
+            entry = await self.store.get(key)
+        except Exception as e:
+            logger.error(f"LLM cache read failed: {e}")
+            return None
+        if entry is None:
+            return None
+        # Promote for the rest of its lifetime
+        remaining = (entry['expires_at'] - datetime.now(timezone.utc)).total_seconds()
+        self.memory.set(key, {'text': entry['text'], 'seconds': entry['seconds']}, ttl_seconds=remaining)
+        return {**entry, 'tier': 'store'}
+
+    async def _save(self, key: str, endpoint: str, entry: Dict, ttl_seconds: float):
+        self.memory.set(key, entry, ttl_seconds=ttl_seconds)
+        if self.store is None:
+            return
+        try:
+            await self.store.set(key, {
+                **entry,
+                'endpoint': endpoint,
+                'created_at': datetime.now(timezone.utc),
+                'expires_at': datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+            })
+        except Exception as e:
+            logger.error(f"LLM cache write failed: {e}")
+
+    async def get_or_create(
+        self,
+        endpoint: str,
+        params: Dict,
+        generate: Callable[[], Awaitable[str]],
+        ttl_seconds: float
+    ) -> str:
+        """The cached text for params, or generate() it and cache it"""
+        start = time.perf_counter()
+        key = cache_key(params)
+        entry = await self._lookup(key)
+        if entry is not None:
+            saved = max(entry['seconds'] - (time.perf_counter() - start), 0.0)
+            self._count(endpoint, f"{entry['tier']}_hits", saved)
+            return entry['text']
+
+        text = await generate()
+        self._count(endpoint, 'misses')
+        await self._save(key, endpoint, {'text': text, 'seconds': time.perf_counter() - start}, ttl_seconds)
+        return text
+
+    def stats(self) -> Dict:
+        with self._lock:
+            endpoints = {name: dict(stats) for name, stats in self._endpoints.items()}
+
+        totals = {'hits': 0, 'misses': 0, 'saved_seconds': 0.0}
+        for stats in endpoints.values():
+            hits = stats['memory_hits'] + stats['store_hits']
+            lookups = hits + stats['misses']
+            stats['hit_ratio'] = round(hits / lookups, 3) if lookups else 0.0
+            stats['saved_seconds'] = round(stats['saved_seconds'], 2)
+            totals['hits'] += hits
+            totals['misses'] += stats['misses']
+            totals['saved_seconds'] += stats['saved_seconds']
+
+        lookups = totals['hits'] + totals['misses']
+        return {
+            "persistent": self.store is not None,
+            "memory": self.memory.stats(),
+            "hit_ratio": round(totals['hits'] / lookups, 3) if lookups else 0.0,
+            "saved_seconds": round(totals['saved_seconds'], 2),
+            "endpoints": endpoints
+        }
+
+
+@lru_cache(maxsize=None)
+def get_llm_cache(repository=None) -> LLMResultCache:
+    """The process-wide result cache; with a repository it gets the Firestore tier"""
+    store = FirestoreResultStore(repository) if repository is not None and settings.LLM_CACHE_PERSISTENT else None
+    return LLMResultCache(settings.LLM_CACHE_MEMORY_SIZE, store)
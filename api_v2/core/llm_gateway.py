@@ -0,0 +1,362 @@
+"""
+LLM gateway - the one way the app talks to Claude.
+
+Owns a single Anthropic client per process (so one shared HTTP connection
+pool with keep-alive instead of a pool per service or per request),
+applies per-endpoint timeouts, retries transient failures (429, 5xx/529
+overloaded, connection errors and timeouts) with jittered exponential backoff
+that honours Retry-After, and trips a circuit breaker when the upstream keeps
+failing. While the breaker is open calls raise CircuitOpenError at once, so
+callers drop straight to their fallback readings instead of queueing on a
+degraded API. The SDK's own retries are disabled so every attempt is seen
+here. Async calls also pass through admission control (core/admission.py):
+a process-wide concurrency limit with a priority wait queue that sheds load
+with AdmissionRejected.
+
+SyncLLMGateway is the same policy for the legacy Flask code (static/src/api).
+"""
+import asyncio
+import logging
+import random
+import threading
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Optional
+
+import anthropic
+
+from api_v2.core.admission import AdmissionController
+from api_v2.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds per endpoint (the whole request); anything unlisted uses
+# settings.LLM_TIMEOUT_SECONDS. Readings stream for a while, chat is short.
+ENDPOINT_TIMEOUTS = {
+    'chat': 30.0,
+    'chat_summary': 30.0,
+    'translate': 20.0,
+    'test': 15.0,
+    'pregenerate': 120.0,
+}
+
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling Claude while the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure breaker: `threshold` failed calls in a row open it for
+    `reset_seconds`, then one trial call (half-open) decides whether it closes
+    again or stays open for another period.
+    """
+
+    def __init__(self, threshold: int, reset_seconds: float):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_started: Optional[float] = None
+        self.opened = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return 'half_open'
+        return 'open'
+
+    def before_call(self):
+        """Raise CircuitOpenError unless a call may go through"""
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return
+            # One trial call at a time; a trial that never reported back
+            # (cancelled) stops blocking after another reset period
+            now = time.monotonic()
+            if state == 'half_open' and (
+                self.trial_started is None or now - self.trial_started >= self.reset_seconds
+            ):
+                self.trial_started = now
+                return
+            self.rejected += 1
+        raise CircuitOpenError("Claude API circuit breaker is open")
+
+    def record_success(self):
+        with self._lock:
+            if self.opened_at is not None:
+                logger.info("✅ Claude API recovered - circuit breaker closed")
+            self.failures = 0
+            self.opened_at = None
+            self.trial_started = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            trial = self.trial_started is not None
+            if trial or self.failures >= self.threshold:
+                if self.opened_at is None or trial:
+                    self.opened += 1
+                    logger.error(f"Claude API failing ({self.failures} in a row) - circuit breaker open")
+                self.opened_at = time.monotonic()
+            self.trial_started = None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "times_opened": self.opened,
+                "rejected_calls": self.rejected
+            }
+
+
+def is_retryable(error: BaseException) -> bool:
+    if isinstance(error, anthropic.APIConnectionError):  # includes timeouts
+        return True
+    return isinstance(error, anthropic.APIStatusError) and error.status_code in RETRYABLE_STATUS
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Retry-After (seconds or HTTP date) / retry-after-ms from an error response"""
+    response = getattr(error, 'response', None)
+    if response is None:
+        return None
+    headers = response.headers
+    try:
+        if headers.get('retry-after-ms'):
+            return float(headers['retry-after-ms']) / 1000
+        value = headers.get('retry-after')
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Jittered exponential backoff; the server's Retry-After wins when given"""
+
+    def __init__(self, max_retries: int, base_seconds: float, max_seconds: float):
+        self.max_retries = max_retries
+        self.base_seconds = base_seconds
+        self.max_seconds = max_seconds
+
+    def delay(self, error: BaseException, attempt: int) -> Optional[float]:
+        """Seconds to wait before retry number `attempt` (0-based), or None to give up"""
+        if attempt >= self.max_retries or not is_retryable(error):
+            return None
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            # Waiting longer than we would ever back off is worse than the fallback
+            return retry_after if retry_after <= self.max_seconds else None
+        # Full jitter
+        return random.uniform(0, min(self.max_seconds, self.base_seconds * 2 ** attempt))
+
+
+class GatewayStats:
+    """Per-endpoint attempt counters"""
+
+    def __init__(self):
+        self._endpoints: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def count(self, endpoint: str, outcome: str):
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, {'calls': 0, 'retries': 0, 'failures': 0})
+            stats[outcome] += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._endpoints.items()}
+
+
+def endpoint_timeout(endpoint: str) -> float:
+    return ENDPOINT_TIMEOUTS.get(endpoint, settings.LLM_TIMEOUT_SECONDS)
+
+
+class BaseGateway:
+    """Policy and counters shared by the async and blocking gateways"""
+
+    def __init__(self, retry: RetryPolicy, breaker: CircuitBreaker):
+        self.retry = retry
+        self.breaker = breaker
+        self.counters = GatewayStats()
+
+    def _final_error(self, endpoint: str, error: BaseException):
+        """An error that will be raised to the caller"""
+        if is_retryable(error):
+            self.counters.count(endpoint, 'failures')
+            self.breaker.record_failure()
+        else:
+            # The API answered (e.g. 400) - it is up, the request was wrong
+            self.breaker.record_success()
+
+    def _retry_delay(self, endpoint: str, error: BaseException, attempt: int) -> Optional[float]:
+        """Seconds before the next attempt, or None when the error is final"""
+        delay = self.retry.delay(error, attempt)
+        if delay is None:
+            self._final_error(endpoint, error)
+            return None
+        self.counters.count(endpoint, 'retries')
+        logger.warning(f"Claude {endpoint} call failed ({error.__class__.__name__}), retrying in {delay:.1f}s")
+        return delay
+
+    def stats(self) -> Dict:
+        return {"circuit_breaker": self.breaker.stats(), "endpoints": self.counters.stats()}
+
+
+class LLMGateway(BaseGateway):
+    """Async gateway used by the FastAPI services and jobs"""
+
+    def __init__(
+        self,
+        api_key: str,
+        retry: RetryPolicy,
+        breaker: CircuitBreaker,
+        admission: AdmissionController
+    ):
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            max_retries=0,
+            timeout=endpoint_timeout('')
+        )
+        self.admission = admission
+        super().__init__(retry, breaker)
+
+    def _client_for(self, endpoint: str):
+        return self.client.with_options(timeout=endpoint_timeout(endpoint))
+
+    async def _backoff(self, endpoint: str, error: BaseException, attempt: int) -> bool:
+        """Sleep before the next attempt; False when the error is final"""
+        delay = self._retry_delay(endpoint, error, attempt)
+        if delay is None:
+            return False
+        await asyncio.sleep(delay)
+        return True
+
+    async def create(self, endpoint: str, **params):
+        """messages.create with the gateway's admission, timeout, retry and breaker policy"""
+        self.breaker.before_call()
+        async with self.admission.slot(endpoint):
+            self.counters.count(endpoint, 'calls')
+            client = self._client_for(endpoint)
+            attempt = 0
+            while True:
+                try:
+                    response = await client.messages.create(**params)
+                except Exception as e:
+                    if not await self._backoff(endpoint, e, attempt):
+                        raise
+                    attempt += 1
+                    continue
+                self.breaker.record_success()
+                return response
+
+    @asynccontextmanager
+    async def stream(self, endpoint: str, admitted: bool = False, **params) -> AsyncIterator:
+        """
+        messages.stream as an async context manager. Opening the stream is
+        retried like create(); an error after the first event is not (the
+        caller has already forwarded part of the text). Pass admitted=True
+        when the caller already holds an admission slot for the call.
+        """
+        if not admitted:
+            async with self.admission.slot(endpoint):
+                async with self.stream(endpoint, admitted=True, **params) as stream:
+                    yield stream
+            return
+        
+        self.breaker.before_call()
+        self.counters.count(endpoint, 'calls')
+        client = self._client_for(endpoint)
+        attempt = 0
+        while True:
+            manager = client.messages.stream(**params)
+            try:
+                stream = await manager.__aenter__()
+            except Exception as e:
+                if not await self._backoff(endpoint, e, attempt):
+                    raise
+                attempt += 1
+                continue
+            break
+
+        try:
+            yield stream
+        except BaseException as e:
+            await manager.__aexit__(type(e), e, e.__traceback__)
+            if isinstance(e, Exception):
+                self._final_error(endpoint, e)
+            raise
+        await manager.__aexit__(None, None, None)
+        self.breaker.record_success()
+
+    def stats(self) -> Dict:
+        return {**super().stats(), "admission": self.admission.stats()}
+
+
+class SyncLLMGateway(BaseGateway):
+    """The same policy for blocking callers (legacy Flask routes)"""
+
+    def __init__(self, api_key: str, retry: RetryPolicy, breaker: CircuitBreaker):
+        self.client = anthropic.Anthropic(
+            api_key=api_key,
+            max_retries=0,
+            timeout=endpoint_timeout('')
+        )
+        super().__init__(retry, breaker)
+
+    def create(self, endpoint: str, **params):
+        """messages.create with the gateway's timeout, retry and breaker policy"""
+        self.breaker.before_call()
+        self.counters.count(endpoint, 'calls')
+        client = self.client.with_options(timeout=endpoint_timeout(endpoint))
+        attempt = 0
+        while True:
+            try:
+                response = client.messages.create(**params)
+            except Exception as e:
+                delay = self._retry_delay(endpoint, e, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return response
+
+
+def _policy():
+    return (
+        RetryPolicy(settings.LLM_MAX_RETRIES, settings.LLM_RETRY_BASE_SECONDS, settings.LLM_RETRY_MAX_SECONDS),
+        CircuitBreaker(settings.LLM_BREAKER_FAILURES, settings.LLM_BREAKER_RESET_SECONDS)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_llm_gateway() -> LLMGateway:
+    """The process-wide async gateway"""
+    return LLMGateway(
+        settings.ANTHROPIC_API_KEY,
+        *_policy(),
+        AdmissionController(settings.LLM_CONCURRENCY_LIMIT, settings.LLM_QUEUE_SIZE)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_sync_llm_gateway(api_key: Optional[str] = None) -> SyncLLMGateway:
+    """The process-wide blocking gateway (legacy code passes its own key)"""
+    return SyncLLMGateway(api_key or settings.ANTHROPIC_API_KEY, *_policy())
@@ -0,0 +1,157 @@
+"""
+Claude usage metrics per endpoint.
+Tracks prompt-cache reads vs writes (from response.usage) and latency, so
+the effect of prompt caching on cost and time-to-first-token is visible
+on /metrics. ChatContextMetrics reports what the chat context window saves,
+ReadingFallbackMetrics how often readings fall back instead of waiting.
+"""
+import threading
+from typing import Dict, Optional
+
+# Input token price multipliers relative to uncached input
+CACHE_WRITE_COST = 1.25
+CACHE_READ_COST = 0.1
+
+
+class LLMUsageMetrics:
+    """Per-endpoint token and latency counters"""
+
+    def __init__(self):
+        self._endpoints: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        endpoint: str,
+        usage,
+        seconds: float,
+        first_token_seconds: Optional[float] = None
+    ):
+        """Record one Claude call (usage is the response's usage object)"""
+        cache_read = getattr(usage, 'cache_read_input_tokens', None) or 0
+        cache_write = getattr(usage, 'cache_creation_input_tokens', None) or 0
+
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, {
+                'calls': 0,
+                'cache_hits': 0,
+                'input_tokens': 0,
+                'cache_write_tokens': 0,
+                'cache_read_tokens': 0,
+                'output_tokens': 0,
+                'total_seconds': 0.0,
+                'streamed_calls': 0,
+                'total_first_token_seconds': 0.0
+            })
+            stats['calls'] += 1
+            stats['cache_hits'] += 1 if cache_read else 0
+            stats['input_tokens'] += getattr(usage, 'input_tokens', None) or 0
+            stats['cache_write_tokens'] += cache_write
+            stats['cache_read_tokens'] += cache_read
+            stats['output_tokens'] += getattr(usage, 'output_tokens', None) or 0
+            stats['total_seconds'] += seconds
+            if first_token_seconds is not None:
+                stats['streamed_calls'] += 1
+                stats['total_first_token_seconds'] += first_token_seconds
+
+    def stats(self) -> Dict:
+        """Totals plus derived ratios for every endpoint seen so far"""
+        with self._lock:
+            endpoints = {name: dict(stats) for name, stats in self._endpoints.items()}
+
+        for stats in endpoints.values():
+            uncached = stats['input_tokens']
+            written = stats['cache_write_tokens']
+            read = stats['cache_read_tokens']
+            prompt_tokens = uncached + written + read
+
+            stats['cache_hit_ratio'] = round(stats['cache_hits'] / stats['calls'], 3)
+            # Share of input cost saved vs sending every prompt token uncached
+            stats['input_cost_saving'] = round(
+                1 - (uncached + CACHE_WRITE_COST * written + CACHE_READ_COST * read) / prompt_tokens, 3
+            ) if prompt_tokens else 0.0
+            stats['avg_latency_ms'] = round(stats.pop('total_seconds') / stats['calls'] * 1000, 1)
+            first_token = stats.pop('total_first_token_seconds')
+            stats['avg_first_token_ms'] = (
+                round(first_token / stats['streamed_calls'] * 1000, 1) if stats['streamed_calls'] else None
+            )
+
+        return endpoints
+
+
+class ChatContextMetrics:
+    """Per-turn chat context sizes: what was sent vs the whole history"""
+
+    def __init__(self):
+        self.turns = 0
+        self.estimated_tokens = 0
+        self.tokens_saved = 0
+        self.dropped_messages = 0
+        self.total_seconds = 0.0
+        self.summaries_refreshed = 0
+        self.summary_failures = 0
+        self._lock = threading.Lock()
+
+    def record_turn(self, context: Dict, dropped: int, seconds: float):
+        with self._lock:
+            self.turns += 1
+            self.estimated_tokens += context['estimated_tokens']
+            self.tokens_saved += context['full_tokens'] - context['estimated_tokens']
+            self.dropped_messages += dropped
+            self.total_seconds += seconds
+
+    def record_summary(self, ok: bool):
+        with self._lock:
+            if ok:
+                self.summaries_refreshed += 1
+            else:
+                self.summary_failures += 1
+
+    def stats(self) -> Dict:
+        turns = self.turns or 1
+        return {
+            'turns': self.turns,
+            'avg_input_tokens': round(self.estimated_tokens / turns),
+            'tokens_saved': self.tokens_saved,
+            'avg_tokens_saved': round(self.tokens_saved / turns),
+            'dropped_messages': self.dropped_messages,
+            'avg_turn_latency_ms': round(self.total_seconds / turns * 1000, 1),
+            'summaries_refreshed': self.summaries_refreshed,
+            'summary_failures': self.summary_failures
+        }
+
+
+class ReadingFallbackMetrics:
+    """
+    Per-endpoint reading outcomes: full (or cached) readings in time, quick readings
+    served past the latency SLO, full readings served late because no quick
+    one could be built, fallbacks after errors, and how the background
+    generations behind the quick readings ended
+    """
+
+    OUTCOMES = ('on_time', 'slo_fallbacks', 'late', 'error_fallbacks', 'background_completed', 'background_failed')
+
+    def __init__(self):
+        self._endpoints: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, outcome: str):
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, dict.fromkeys(self.OUTCOMES, 0))
+            stats[outcome] += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            endpoints = {name: dict(stats) for name, stats in self._endpoints.items()}
+
+        for stats in endpoints.values():
+            fallbacks = stats['slo_fallbacks'] + stats['error_fallbacks']
+            served = stats['on_time'] + stats['late'] + fallbacks
+            stats['fallback_ratio'] = round(fallbacks / served, 3) if served else 0.0
+
+        return endpoints
+
+
+llm_metrics = LLMUsageMetrics()
+chat_context_metrics = ChatContextMetrics()
+reading_fallbacks = ReadingFallbackMetrics()
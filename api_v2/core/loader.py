@@ -0,0 +1,165 @@
+"""
+Request-scoped document loader.
+
+Within one HTTP request, services often read the same Firestore documents
+more than once (rate limiter and reading service both want nfc_users/{id})
+and read unrelated documents one after another. DocumentLoader deduplicates
+identical reads and sends every read requested in the same event-loop tick
+as a single get_all round trip.
+
+DocumentLoaderMiddleware opens a loader per request; FirestoreRepository.load
+and .prime use it when one is active and fall back to plain reads otherwise.
+"""
+import asyncio
+import copy
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_current_loader: ContextVar[Optional["DocumentLoader"]] = ContextVar("document_loader", default=None)
+
+# Totals across all requests, for /metrics
+loader_totals = {
+    'requests': 0,
+    'loads': 0,
+    'documents_fetched': 0,
+    'round_trips': 0
+}
+
+
+class DocumentLoader:
+    """Deduplicating, batching document reader for one request"""
+
+    def __init__(self, repository):
+        self.repo = repository
+        self._futures: Dict[str, asyncio.Future] = {}
+        self._pending: Dict[str, object] = {}
+        self._dispatch_scheduled = False
+        self.loads = 0
+        self.documents_fetched = 0
+        self.round_trips = 0
+
+    def prime(self, *refs):
+        """Declare documents the request will need so they join the next batch"""
+        for ref in refs:
+            self._enqueue(ref)
+
+    async def load(self, ref) -> Optional[Dict]:
+        """Get a document's data (None if missing), batched with concurrent loads"""
+        self.loads += 1
+        data = await asyncio.shield(self._enqueue(ref))
+        # Callers may mutate what they get back
+        return copy.deepcopy(data)
+
+    def forget(self, ref):
+        """Drop a memoised document after it has been written"""
+        future = self._futures.get(ref.path)
+        if future is not None and future.done():
+            del self._futures[ref.path]
+
+    def _enqueue(self, ref) -> asyncio.Future:
+        future = self._futures.get(ref.path)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        # Primed documents nobody loads must not log "exception never retrieved"
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._futures[ref.path] = future
+        self._pending[ref.path] = ref
+
+        if not self._dispatch_scheduled:
+            # Let every coroutine started in this tick enqueue its reads first
+            self._dispatch_scheduled = True
+            loop.call_soon(self._dispatch)
+        return future
+
+    def _dispatch(self):
+        self._dispatch_scheduled = False
+        batch, self._pending = self._pending, {}
+        if batch:
+            asyncio.ensure_future(self._fetch(batch))
+
+    async def _fetch(self, batch: Dict[str, object]):
+        futures = {path: self._futures[path] for path in batch}
+        try:
+            snapshots = await self.repo.get_all(batch.values())
+        except Exception as e:
+            logger.error(f"Error loading {len(batch)} documents: {e}")
+            for path, future in futures.items():
+                # Allow a retry on the next load
+                if self._futures.get(path) is future:
+                    del self._futures[path]
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.round_trips += 1
+        self.documents_fetched += len(batch)
+
+        found = {snapshot.reference.path: snapshot for snapshot in snapshots}
+        for path, future in futures.items():
+            snapshot = found.get(path)
+            if not future.done():
+                future.set_result(snapshot.to_dict() if snapshot is not None and snapshot.exists else None)
+
+    def stats(self) -> Dict:
+        return {
+            'loads': self.loads,
+            'documents_fetched': self.documents_fetched,
+            'round_trips': self.round_trips
+        }
+
+
+def current_loader() -> Optional[DocumentLoader]:
+    """The loader of the request being served, if any"""
+    return _current_loader.get()
+
+
+@contextmanager
+def request_scope(repository):
+    """Serve reads in this block from a fresh DocumentLoader"""
+    loader = DocumentLoader(repository)
+    token = _current_loader.set(loader)
+    try:
+        yield loader
+    finally:
+        _current_loader.reset(token)
+        loader_totals['requests'] += 1
+        for key, value in loader.stats().items():
+            loader_totals[key] += value
+
+
+@contextmanager
+def bypass_loader():
+    """Read straight from Firestore, e.g. when polling for another worker's write"""
+    token = _current_loader.set(None)
+    try:
+        yield
+    finally:
+        _current_loader.reset(token)
+
+
+class DocumentLoaderMiddleware:
+    """ASGI middleware giving every HTTP request its own DocumentLoader"""
+
+    def __init__(self, app, repository):
+        self.app = app
+        self.repository = repository
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with request_scope(self.repository) as loader:
+            await self.app(scope, receive, send)
+            if loader.loads:
+                logger.debug(
+                    f"{scope.get('path')}: {loader.loads} loads in "
+                    f"{loader.round_trips} Firestore round trip(s)"
+                )
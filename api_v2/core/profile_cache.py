@@ -0,0 +1,44 @@
+"""
+User profile cache in front of the nfc_users collection.
+One request typically reads the same nfc_users/{nfc_id} document several
+times (rate limiter, reading service, registration); this serves the
+repeats from memory.
+"""
+import copy
+import logging
+from typing import Dict, Optional
+
+from api_v2.core.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class UserProfileCache:
+    """Read-through TTL/LRU cache of nfc_users documents"""
+
+    def __init__(self, repository, max_size: int = 1024, ttl_seconds: float = 60):
+        self.repo = repository
+        self._cache = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    async def get(self, nfc_id: str) -> Optional[Dict]:
+        """
+        Get a user document, or None if it does not exist.
+        Missing users are not cached so a fresh registration is seen at once.
+        """
+        profile = self._cache.get(nfc_id)
+        if profile is None:
+            profile = await self.repo.load(self.repo.document('nfc_users', nfc_id))
+            if profile is None:
+                return None
+            self._cache.set(nfc_id, profile)
+
+        # Callers may mutate what they get back
+        return copy.deepcopy(profile)
+
+    def invalidate(self, nfc_id: str):
+        """Forget a user after writing to their document"""
+        self._cache.invalidate(nfc_id)
+
+    def stats(self) -> Dict:
+        """Hit/miss/eviction counters"""
+        return self._cache.stats()
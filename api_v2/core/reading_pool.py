@@ -0,0 +1,113 @@
+"""
+Pool of ready-made readings that do not depend on who asks.
+
+A ReadingPool keeps up to `size` readings generated for the current context
+(whatever the readings' prompt depends on, e.g. moon phase and season).
+pop() hands one out in O(1); once the pool is at or below `low_watermark`
+it starts background generations (at most `concurrency` at a time) until it
+is full again. Readings made for an earlier context are dropped when the
+context changes, and a failed generation stops the refill until the next
+pop, so an outage does not turn into a retry loop.
+"""
+import asyncio
+import logging
+from collections import deque
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class ReadingPool:
+    """Background-refilled pool of readings for the current context"""
+
+    def __init__(
+        self,
+        generate: Callable[[], Awaitable[Dict]],
+        context_key: Callable[[], Hashable],
+        size: int,
+        low_watermark: int,
+        concurrency: int = 2
+    ):
+        self.generate = generate
+        self.context_key = context_key
+        self.size = size
+        self.low_watermark = low_watermark
+        self.concurrency = concurrency
+        self._readings = deque()
+        self._key: Optional[Hashable] = None
+        self._filling = 0
+        self._tasks: Set[asyncio.Task] = set()
+        self.counters = {
+            'hits': 0,
+            'misses': 0,
+            'generated': 0,
+            'failed': 0,
+            'discarded': 0
+        }
+
+    def _current(self) -> deque:
+        """The pool for the current context (emptied when the context changed)"""
+        key = self.context_key()
+        if key != self._key:
+            if self._readings:
+                logger.info(f"Reading pool context changed to {key} - dropping {len(self._readings)} readings")
+                self.counters['discarded'] += len(self._readings)
+                self._readings.clear()
+            self._key = key
+        return self._readings
+
+    def pop(self) -> Optional[Dict]:
+        """A ready reading, or None when the pool is empty; tops the pool up either way"""
+        readings = self._current()
+        if readings:
+            reading = readings.popleft()
+            self.counters['hits'] += 1
+        else:
+            reading = None
+            self.counters['misses'] += 1
+        self.top_up()
+        return reading
+
+    def top_up(self):
+        """Start refilling if the pool is at or below its low watermark"""
+        if self.size and len(self._current()) + self._filling <= self.low_watermark:
+            self._spawn()
+
+    def _spawn(self):
+        while len(self._readings) + self._filling < self.size and self._filling < self.concurrency:
+            self._filling += 1
+            task = asyncio.ensure_future(self._fill_one(self._key))
+            # The loop only keeps weak references to tasks
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fill_one(self, key: Hashable):
+        try:
+            reading = await self.generate()
+        except Exception as e:
+            logger.error(f"Reading pool generation failed: {e}")
+            self.counters['failed'] += 1
+            return
+        finally:
+            self._filling -= 1
+
+        self.counters['generated'] += 1
+        self._current()
+        if key != self._key:
+            # Generated for a context that has passed
+            self.counters['discarded'] += 1
+            return
+        if len(self._readings) < self.size:
+            self._readings.append(reading)
+        self._spawn()
+
+    def stats(self) -> Dict:
+        served = self.counters['hits'] + self.counters['misses']
+        return {
+            "ready": len(self._readings),
+            "capacity": self.size,
+            "low_watermark": self.low_watermark,
+            "generating": self._filling,
+            **self.counters,
+            "hit_ratio": round(self.counters['hits'] / served, 3) if served else 0.0
+        }
@@ -0,0 +1,133 @@
+"""
+Async repository layer over the synchronous Firestore client.
+Every blocking Firestore round trip runs on a bounded thread pool so the
+event loop keeps serving other requests (e.g. in-flight Claude calls).
+"""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from api_v2.core.loader import current_loader
+
+logger = logging.getLogger(__name__)
+
+
+class FirestoreRepository:
+    """
+    Non-blocking facade over a Firestore client.
+
+    Building references (collection/document/where/order_by) does no I/O and
+    stays synchronous; anything that talks to Firestore is awaited.
+    """
+
+    def __init__(self, database, max_workers: int = 16):
+        self.db = database
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="firestore"
+        )
+
+    # ------------------------------------------------------------------
+    # Reference helpers (no I/O)
+    # ------------------------------------------------------------------
+    def collection(self, name: str):
+        """Get a collection reference"""
+        return self.db.collection(name)
+
+    def document(self, collection: str, doc_id: Optional[str] = None):
+        """Get a document reference (auto-ID when doc_id is None)"""
+        if doc_id is None:
+            return self.db.collection(collection).document()
+        return self.db.collection(collection).document(doc_id)
+
+    # ------------------------------------------------------------------
+    # I/O (runs on the executor)
+    # ------------------------------------------------------------------
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking Firestore call on the bounded executor"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    async def get(self, ref):
+        """Fetch a document snapshot"""
+        return await self.run(ref.get)
+
+    async def get_dict(self, ref) -> Optional[Dict]:
+        """Fetch a document and return its data, or None if missing"""
+        snapshot = await self.get(ref)
+        return snapshot.to_dict() if snapshot.exists else None
+
+    async def load(self, ref) -> Optional[Dict]:
+        """
+        Like get_dict, but inside a request the read is deduplicated and
+        batched with other concurrent loads (see core/loader.py)
+        """
+        loader = current_loader()
+        if loader is None:
+            return await self.get_dict(ref)
+        return await loader.load(ref)
+
+    def prime(self, *refs):
+        """Declare documents the current request will load"""
+        loader = current_loader()
+        if loader is not None:
+            loader.prime(*refs)
+
+    async def set(self, ref, data: Dict, merge: bool = False):
+        """Create or overwrite a document"""
+        result = await self.run(ref.set, data, merge=merge)
+        self._forget(ref)
+        return result
+
+    async def update(self, ref, data: Dict):
+        """Update fields of an existing document"""
+        result = await self.run(ref.update, data)
+        self._forget(ref)
+        return result
+
+    async def set_all(self, writes: Iterable[Tuple[Any, Dict]], merge: bool = False):
+        """Write several documents atomically in a single round trip"""
+        writes = list(writes)
+
+        def _commit():
+            batch = self.db.batch()
+            for ref, data in writes:
+                batch.set(ref, data, merge=merge)
+            return batch.commit()
+
+        result = await self.run(_commit)
+        for ref, _ in writes:
+            self._forget(ref)
+        return result
+
+    async def delete(self, ref):
+        """Delete a document"""
+        result = await self.run(ref.delete)
+        self._forget(ref)
+        return result
+
+    def _forget(self, ref):
+        # Later loads in this request must see the write
+        loader = current_loader()
+        if loader is not None:
+            loader.forget(ref)
+
+    async def query(self, query) -> List[Dict]:
+        """Run a query and return the matching documents as dicts"""
+        def _collect():
+            return [doc.to_dict() for doc in query.stream()]
+        return await self.run(_collect)
+
+    async def get_all(self, refs: Iterable) -> List:
+        """Fetch several documents in a single round trip"""
+        refs = list(refs)
+        if not refs:
+            return []
+        return await self.run(lambda: list(self.db.get_all(refs)))
+
+    def shutdown(self):
+        """Release executor threads"""
+        self._executor.shutdown(wait=False)
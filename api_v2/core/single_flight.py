@@ -0,0 +1,129 @@
+"""
+Request coalescing for expensive per-user generations.
+
+SingleFlight makes concurrent callers with the same key (endpoint, nfc_id, day)
+await one generation inside this process. FirestoreLease extends that across
+workers with a short-lived lease document in generation_leases/{key}.
+"""
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from google.cloud import firestore
+
+from api_v2.core.loader import bypass_loader
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """In-process single-flight registry"""
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._shared: Dict[Hashable, Dict] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn once per key; concurrent callers share its result or exception.
+
+        The generation runs as its own task, so a caller that disconnects
+        (cancellation) does not cancel it for everyone else.
+        """
+        return await asyncio.shield(self.start(key, fn))
+
+    def start(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> "asyncio.Task[T]":
+        """Start fn as the generation for key unless one is in flight; returns that task"""
+        task = self._in_flight.get(key)
+        if task is None:
+            self._shared[key] = {}
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._forget(key))
+        else:
+            logger.info(f"Joining in-flight generation for {key}")
+        return task
+
+    def get(self, key: Hashable) -> Optional[asyncio.Task]:
+        """The in-flight generation for key, if any"""
+        return self._in_flight.get(key)
+
+    def shared(self, key: Hashable) -> Dict:
+        """
+        Scratch dict of the in-flight generation for key, e.g. the cards it
+        drew before calling Claude, for its joiners to read ({} if none)
+        """
+        return self._shared.get(key, {})
+
+    def _forget(self, key: Hashable):
+        self._in_flight.pop(key, None)
+        self._shared.pop(key, None)
+
+
+class FirestoreLease:
+    """
+    Cross-worker lease: whoever creates generation_leases/{key} first generates,
+    the others wait for the result to appear. Leases expire after ttl_seconds
+    so a crashed worker cannot block a user for long.
+    """
+
+    def __init__(self, repository, ttl_seconds: float = 90, poll_interval: float = 1.0):
+        self.repo = repository
+        self.ttl_seconds = ttl_seconds
+        self.poll_interval = poll_interval
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+    async def acquire(self, key: str) -> bool:
+        """Take the lease unless another worker holds an unexpired one"""
+        ref = self.repo.document('generation_leases', key)
+
+        @firestore.transactional
+        def _acquire(transaction) -> bool:
+            snapshot = ref.get(transaction=transaction)
+            if snapshot.exists and snapshot.get('expires_at') > time.time():
+                return False
+            transaction.set(ref, {
+                'owner': self.owner,
+                'expires_at': time.time() + self.ttl_seconds
+            })
+            return True
+
+        try:
+            return await self.repo.run(_acquire, self.repo.db.transaction())
+        except Exception as e:
+            # Never block a reading on the lease itself
+            logger.error(f"Error acquiring lease {key}: {e}")
+            return True
+
+    async def release(self, key: str):
+        """Drop the lease if we still own it"""
+        ref = self.repo.document('generation_leases', key)
+
+        @firestore.transactional
+        def _release(transaction):
+            snapshot = ref.get(transaction=transaction)
+            if snapshot.exists and snapshot.get('owner') == self.owner:
+                transaction.delete(ref)
+
+        try:
+            await self.repo.run(_release, self.repo.db.transaction())
+        except Exception as e:
+            logger.error(f"Error releasing lease {key}: {e}")
+
+    async def wait_for(self, fetch: Callable[[], Awaitable[Optional[T]]]) -> Optional[T]:
+        """Poll fetch until it returns a result or the lease would have expired"""
+        deadline = time.monotonic() + self.ttl_seconds
+        while time.monotonic() < deadline:
+            # Each poll must hit Firestore, not the request's memoised reads
+            with bypass_loader():
+                result = await fetch()
+            if result is not None:
+                return result
+            await asyncio.sleep(self.poll_interval)
+        return None
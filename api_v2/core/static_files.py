@@ -0,0 +1,231 @@
+"""
+Static file layer shared by the Flask front end (app.py) and the
+single-process mount (routes/frontend.py).
+
+Every file under static/ is indexed once at startup: size, content type and a
+strong ETag (content hash), plus the .br/.gz siblings written at deploy by
+`python -m api_v2.jobs.compress_static`. A request then only needs a dict
+lookup to pick the encoding from Accept-Encoding, answer If-None-Match with
+304 without touching the file, or map a Range header onto the file. Files
+added after startup are not served until the next restart.
+"""
+import hashlib
+import logging
+import mimetypes
+import os
+import threading
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+
+from api_v2.utils.card_images import IMMUTABLE_CACHE_CONTROL, is_immutable_asset
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+STATIC_DIR = os.path.join(PROJECT_ROOT, 'static')
+
+# Text formats worth precompressing (images/audio are already compressed)
+COMPRESSIBLE = ('.js', '.css', '.svg', '.json', '.html', '.txt', '.map', '.xml', '.ico', '.webmanifest')
+# Content-Encoding -> sibling suffix, in server preference order
+ENCODINGS = {'br': '.br', 'gzip': '.gz'}
+# Everything else is revalidated with its ETag on each use
+DEFAULT_CACHE_CONTROL = 'no-cache'
+CHUNK_SIZE = 64 * 1024
+
+CONTENT_TYPES = {
+    '.js': 'text/javascript',
+    '.avif': 'image/avif',
+    '.webp': 'image/webp',
+    '.webmanifest': 'application/manifest+json',
+}
+
+# (status, headers, body) - body is (path, offset, length) or None
+StaticResponse = Tuple[int, Dict[str, str], Optional[Tuple[str, int, int]]]
+
+
+def content_type(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    mime = CONTENT_TYPES.get(ext) or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    if mime.startswith('text/') or mime in ('application/json', 'application/manifest+json', 'image/svg+xml'):
+        mime += '; charset=utf-8'
+    return mime
+
+
+def file_etag(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """'br;q=1.0, gzip;q=0.8, *;q=0' -> {'br': 1.0, 'gzip': 0.8, '*': 0.0}"""
+    accepted = {}
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    return accepted
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Single 'bytes=' range -> (start, end) inclusive.
+    None means ignore the header (malformed or multi-range: serve the whole file);
+    (-1, -1) means unsatisfiable (416).
+    """
+    unit, _, spec = header.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in spec:
+        return None
+    first, sep, last = spec.strip().partition('-')
+    if not sep:
+        return None
+    try:
+        if not first:  # suffix: last N bytes
+            length = int(last)
+            if length <= 0:
+                return (-1, -1)
+            return (max(size - length, 0), size - 1)
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        return (-1, -1)
+    if start > end:
+        return None
+    return (start, min(end, size - 1))
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match uses the weak comparison"""
+    if header.strip() == '*':
+        return True
+    return any(tag.strip().removeprefix('W/') == etag for tag in header.split(','))
+
+
+class StaticFileIndex:
+    """Startup index of a static directory with precomputed validators"""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.files: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self.responses: Dict[str, int] = {}
+        self._build()
+
+    def _build(self):
+        total = 0
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                if name.endswith(tuple(ENCODINGS.values())) or name.endswith(('.py', '.pyc')):
+                    continue
+                path = os.path.join(directory, name)
+                relative = os.path.relpath(path, self.root).replace(os.sep, '/')
+                stat = os.stat(path)
+                variants = {'identity': (path, stat.st_size, file_etag(path))}
+                for encoding, suffix in ENCODINGS.items():
+                    sibling = path + suffix
+                    # A sibling older than its source is stale - ignore it
+                    if os.path.exists(sibling) and os.stat(sibling).st_mtime >= stat.st_mtime:
+                        variants[encoding] = (sibling, os.stat(sibling).st_size, file_etag(sibling))
+                self.files[relative] = {
+                    'content_type': content_type(path),
+                    'cache_control': IMMUTABLE_CACHE_CONTROL if is_immutable_asset(relative) else DEFAULT_CACHE_CONTROL,
+                    'variants': variants
+                }
+                total += stat.st_size
+        encoded = sum(len(entry['variants']) > 1 for entry in self.files.values())
+        logger.info(f"✅ Indexed {len(self.files)} static files ({total / 1e6:.1f} MB, {encoded} precompressed)")
+
+    def _choose_encoding(self, variants: Dict, accept_encoding: str) -> str:
+        accepted = parse_accept_encoding(accept_encoding)
+        best, best_q = 'identity', 0.0
+        for encoding in ENCODINGS:
+            q = accepted.get(encoding, accepted.get('*', 0.0))
+            if encoding in variants and q > best_q:
+                best, best_q = encoding, q
+        return best
+
+    def _count(self, status: int, encoding: str):
+        key = f"{status}_{encoding}" if status == 200 else str(status)
+        with self._lock:
+            self.responses[key] = self.responses.get(key, 0) + 1
+
+    def resolve(self, path: str, headers: Mapping[str, str]) -> StaticResponse:
+        """Decide the response for GET/HEAD of `path` (relative to root)"""
+        entry = self.files.get(path.lstrip('/'))
+        if entry is None:
+            self._count(404, '')
+            return 404, {}, None
+
+        variants = entry['variants']
+        range_header = headers.get('Range')
+        # Ranges are only served on the identity representation (audio seeking)
+        encoding = 'identity' if range_header else self._choose_encoding(variants, headers.get('Accept-Encoding', ''))
+        file_path, size, etag = variants[encoding]
+
+        response_headers = {
+            'ETag': etag,
+            'Cache-Control': entry['cache_control'],
+        }
+        if len(variants) > 1:
+            response_headers['Vary'] = 'Accept-Encoding'
+
+        if_none_match = headers.get('If-None-Match')
+        if if_none_match and etag_matches(if_none_match, etag):
+            self._count(304, encoding)
+            return 304, response_headers, None
+
+        response_headers['Content-Type'] = entry['content_type']
+        if encoding == 'identity':
+            response_headers['Accept-Ranges'] = 'bytes'
+        else:
+            response_headers['Content-Encoding'] = encoding
+
+        if_range = headers.get('If-Range')
+        if range_header and (not if_range or if_range.strip() == etag):
+            byte_range = parse_range(range_header, size)
+            if byte_range == (-1, -1):
+                response_headers['Content-Range'] = f"bytes */{size}"
+                self._count(416, encoding)
+                return 416, response_headers, None
+            if byte_range:
+                start, end = byte_range
+                response_headers['Content-Range'] = f"bytes {start}-{end}/{size}"
+                response_headers['Content-Length'] = str(end - start + 1)
+                self._count(206, encoding)
+                return 206, response_headers, (file_path, start, end - start + 1)
+
+        response_headers['Content-Length'] = str(size)
+        self._count(200, encoding)
+        return 200, response_headers, (file_path, 0, size)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            responses = dict(self.responses)
+        return {
+            "files": len(self.files),
+            "precompressed": sum(len(entry['variants']) > 1 for entry in self.files.values()),
+            "responses": responses
+        }
+
+
+def iter_file(path: str, offset: int, length: int) -> Iterator[bytes]:
+    """Read `length` bytes from `offset` in chunks (opened lazily - HEAD never reads)"""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        while length > 0:
+            chunk = f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
@@ -0,0 +1,103 @@
+"""
+Build job - responsive variants of the card art.
+
+For every JPEG in static/images/cards writes AVIF and WebP copies at a few
+widths into static/images/cards/build/ as <name>.<hash>.<width>.<ext>, plus a
+blurred placeholder, and records them in build/manifest.json. The hash covers
+the source bytes and the encoder settings, so unchanged cards keep their URLs
+(and browser caches) across deploys. Runs in the deploy build step:
+    python -m api_v2.jobs.build_card_images
+"""
+import argparse
+import base64
+import hashlib
+import io
+import json
+import logging
+import os
+
+from PIL import Image, ImageFilter
+
+from api_v2.utils.card_images import BUILD_DIR, CARDS_DIR, MANIFEST_PATH
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+WIDTHS = (240, 480, 720, 960)
+# Listed best-first: the browser takes the first <source> type it supports
+FORMATS = {
+    'image/avif': ('avif', {'quality': 50}),
+    'image/webp': ('webp', {'quality': 75, 'method': 6}),
+}
+PLACEHOLDER_WIDTH = 16
+
+
+def content_hash(source: bytes) -> str:
+    settings = json.dumps([WIDTHS, FORMATS, PLACEHOLDER_WIDTH], sort_keys=True).encode()
+    return hashlib.sha256(source + settings).hexdigest()[:10]
+
+
+def resized(image: Image.Image, width: int) -> Image.Image:
+    height = round(image.height * width / image.width)
+    return image.resize((width, height), Image.LANCZOS)
+
+
+def placeholder(image: Image.Image) -> str:
+    """A ~16px blurred WebP as a data: URI, shown while the real image loads"""
+    small = resized(image, PLACEHOLDER_WIDTH).filter(ImageFilter.GaussianBlur(1))
+    buffer = io.BytesIO()
+    small.save(buffer, 'WEBP', quality=30)
+    return f"data:image/webp;base64,{base64.b64encode(buffer.getvalue()).decode()}"
+
+
+def build_card(filename: str, output_dir: str) -> dict:
+    with open(os.path.join(CARDS_DIR, filename), 'rb') as f:
+        source = f.read()
+    stem = os.path.splitext(filename)[0]
+    digest = content_hash(source)
+    image = Image.open(io.BytesIO(source)).convert('RGB')
+
+    variants = {}
+    for mime, (ext, options) in FORMATS.items():
+        variants[mime] = []
+        for width in WIDTHS:
+            if width > image.width:
+                continue
+            name = f"{stem}.{digest}.{width}.{ext}"
+            path = os.path.join(output_dir, name)
+            if not os.path.exists(path):
+                resized(image, width).save(path, ext.upper(), **options)
+            variants[mime].append([width, name])
+
+    return {
+        "width": image.width,
+        "height": image.height,
+        "placeholder": placeholder(image),
+        "variants": variants
+    }
+
+
+def main(args):
+    os.makedirs(args.output_dir, exist_ok=True)
+    manifest = {}
+    for filename in sorted(os.listdir(CARDS_DIR)):
+        if filename.lower().endswith(('.jpg', '.jpeg')):
+            manifest[filename] = build_card(filename, args.output_dir)
+            logger.info(f"✅ {filename}")
+
+    # Drop variants left over from previous sources/settings
+    current = {name for entry in manifest.values() for files in entry['variants'].values() for _, name in files}
+    for name in os.listdir(args.output_dir):
+        if name != os.path.basename(MANIFEST_PATH) and name not in current:
+            os.remove(os.path.join(args.output_dir, name))
+
+    with open(os.path.join(args.output_dir, os.path.basename(MANIFEST_PATH)), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+    print(f"Built {len(current)} variants for {len(manifest)} cards in {args.output_dir}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build responsive card image variants")
+    parser.add_argument('--output-dir', default=BUILD_DIR)
+    main(parser.parse_args())
@@ -0,0 +1,87 @@
+"""
+Build job - precompress static text assets.
+
+Writes a .br (brotli, quality 11) and a .gz (gzip -9) sibling next to every
+JS/CSS/SVG/JSON/... file under static/ so the static layer
+(core/static_files.py) can serve them without compressing per request.
+Siblings that would not be smaller than the source are skipped, and up-to-date
+siblings are left alone. Runs in the deploy build step:
+    python -m api_v2.jobs.compress_static
+"""
+import argparse
+import gzip
+import logging
+import os
+
+from api_v2.core.static_files import COMPRESSIBLE, ENCODINGS, STATIC_DIR
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MIN_SIZE = 256  # Below this the headers outweigh the saving
+
+COMPRESSORS = {
+    'br': (lambda data: brotli.compress(data, quality=11)) if brotli else None,
+    'gzip': lambda data: gzip.compress(data, compresslevel=9, mtime=0),
+}
+
+
+def compress_file(path: str) -> dict:
+    """Write the missing/stale siblings of one file -> {encoding: size}"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    source_mtime = os.stat(path).st_mtime
+
+    sizes = {}
+    for encoding, suffix in ENCODINGS.items():
+        compress = COMPRESSORS[encoding]
+        sibling = path + suffix
+        if compress is None:
+            continue
+        if os.path.exists(sibling) and os.stat(sibling).st_mtime >= source_mtime:
+            sizes[encoding] = os.stat(sibling).st_size
+            continue
+
+        compressed = compress(data)
+        if len(compressed) >= len(data):
+            if os.path.exists(sibling):
+                os.remove(sibling)
+            continue
+        with open(sibling, 'wb') as f:
+            f.write(compressed)
+        sizes[encoding] = len(compressed)
+    return sizes
+
+
+def main(args):
+    if brotli is None:
+        logger.warning("brotli not installed - writing gzip siblings only")
+
+    original = 0
+    compressed = {encoding: 0 for encoding in ENCODINGS}
+    count = 0
+    for directory, _, names in os.walk(args.root):
+        for name in names:
+            path = os.path.join(directory, name)
+            if not name.lower().endswith(COMPRESSIBLE) or os.path.getsize(path) < MIN_SIZE:
+                continue
+            sizes = compress_file(path)
+            size = os.path.getsize(path)
+            original += size
+            for encoding in ENCODINGS:
+                compressed[encoding] += sizes.get(encoding, size)
+            count += 1
+
+    summary = ', '.join(f"{encoding} {total / 1024:.0f} KB" for encoding, total in compressed.items())
+    print(f"Compressed {count} files: {original / 1024:.0f} KB -> {summary}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompress static text assets")
+    parser.add_argument('--root', default=STATIC_DIR)
+    main(parser.parse_args())
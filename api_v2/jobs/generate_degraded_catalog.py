@@ -0,0 +1,90 @@
+"""
+Offline job - (re)generate the quick-reading catalog.
+
+Translates the English quick-reading templates and terms into every language
+in LANGUAGE_NAMES and writes api_v2/data/degraded_readings.json, which
+ReadingService loads at startup. Review the output before committing it:
+    python -m api_v2.jobs.generate_degraded_catalog --only ka ru
+"""
+from dotenv import load_dotenv
+load_dotenv()
+
+import argparse
+import asyncio
+import json
+import logging
+
+from api_v2.core.llm_gateway import get_llm_gateway
+from api_v2.utils.cosmic_utils import LANGUAGE_NAMES
+from api_v2.utils.degraded_readings import (
+    CATALOG_PATH,
+    has_placeholders,
+    load_catalog,
+    source_catalog
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def translate(llm, source: dict, language_name: str) -> dict:
+    response = await llm.create(
+        'degraded_catalog',
+        model="claude-sonnet-4-20250514",
+        max_tokens=4000,
+        messages=[{
+            "role": "user",
+            "content": (
+                f"Translate the string values of this JSON object from a warm tarot reader to {language_name}, "
+                "addressing the seeker the same way throughout. Terms are inserted into the templates as they "
+                "are, so word the templates to take them without inflection:\n"
+                f"{json.dumps(source, ensure_ascii=False, indent=2)}\n\n"
+                "Keep every key and every {placeholder} exactly as written, untranslated. "
+                "Reply with the JSON object only."
+            )
+        }]
+    )
+    return json.loads(response.content[0].text.strip())
+
+
+def is_complete(entry: dict, source: dict) -> bool:
+    """Every source key present and every template's placeholders kept"""
+    try:
+        return (
+            all(has_placeholders(entry['templates'][name], name) for name in source['templates'])
+            and all(entry['terms'][term] for term in source['terms'])
+        )
+    except (KeyError, TypeError):
+        return False
+
+
+async def main(args):
+    llm = get_llm_gateway()
+    source = source_catalog()
+    catalog = load_catalog(args.output)
+    catalog['en'] = source
+
+    languages = args.only or [code for code in LANGUAGE_NAMES if code != 'en']
+    for code in languages:
+        try:
+            entry = await translate(llm, source, LANGUAGE_NAMES[code])
+        except ValueError as e:
+            logger.error(f"{code}: reply was not JSON ({e}), keeping previous entry")
+            continue
+        if not is_complete(entry, source):
+            logger.error(f"{code}: keys or placeholders lost, keeping previous entry")
+            continue
+        catalog[code] = entry
+        logger.info(f"✅ {code}: {entry['templates']['affirmation']}")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    print(f"Wrote {len(catalog)} languages to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the quick-reading catalog")
+    parser.add_argument('--only', nargs='+', choices=sorted(LANGUAGE_NAMES), help="Languages to regenerate")
+    parser.add_argument('--output', default=CATALOG_PATH)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,91 @@
+"""
+Offline job - (re)generate the numerology insight catalog.
+
+Translates the English number meanings and insight templates into every
+language in LANGUAGE_NAMES and writes api_v2/data/numerology_insights.json,
+which the numerology engine loads at startup. Review the output before
+committing it:
+    python -m api_v2.jobs.generate_numerology_catalog --only ka ru
+"""
+from dotenv import load_dotenv
+load_dotenv()
+
+import argparse
+import asyncio
+import json
+import logging
+
+from api_v2.core.llm_gateway import get_llm_gateway
+from api_v2.utils.cosmic_utils import LANGUAGE_NAMES
+from api_v2.utils.numerology import (
+    CATALOG_PATH,
+    has_placeholders,
+    load_catalog,
+    source_catalog
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def translate(llm, source: dict, language_name: str) -> dict:
+    response = await llm.create(
+        'numerology_catalog',
+        model="claude-sonnet-4-20250514",
+        max_tokens=4000,
+        messages=[{
+            "role": "user",
+            "content": (
+                f"Translate the string values of this JSON object from a warm tarot reader to {language_name}, "
+                "addressing the seeker the same way throughout:\n"
+                f"{json.dumps(source, ensure_ascii=False, indent=2)}\n\n"
+                "Keep every key and every {placeholder} exactly as written, untranslated. "
+                "Reply with the JSON object only."
+            )
+        }]
+    )
+    return json.loads(response.content[0].text.strip())
+
+
+def is_complete(entry: dict, source: dict) -> bool:
+    """Every source key present and every template's placeholders kept"""
+    try:
+        return (
+            all(has_placeholders(entry['templates'][name], name) for name in source['templates'])
+            and all(entry['numbers'][key]['keyword'] and entry['numbers'][key]['advice']
+                    for key in source['numbers'])
+        )
+    except (KeyError, TypeError):
+        return False
+
+
+async def main(args):
+    llm = get_llm_gateway()
+    source = source_catalog()
+    catalog = load_catalog(args.output)
+    catalog['en'] = source
+
+    languages = args.only or [code for code in LANGUAGE_NAMES if code != 'en']
+    for code in languages:
+        try:
+            entry = await translate(llm, source, LANGUAGE_NAMES[code])
+        except ValueError as e:
+            logger.error(f"{code}: reply was not JSON ({e}), keeping previous entry")
+            continue
+        if not is_complete(entry, source):
+            logger.error(f"{code}: keys or placeholders lost, keeping previous entry")
+            continue
+        catalog[code] = entry
+        logger.info(f"✅ {code}: {entry['templates']['day']}")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    print(f"Wrote {len(catalog)} languages to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the numerology insight catalog")
+    parser.add_argument('--only', nargs='+', choices=sorted(LANGUAGE_NAMES), help="Languages to regenerate")
+    parser.add_argument('--output', default=CATALOG_PATH)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,75 @@
+"""
+Offline job - (re)generate the chat welcome-message catalog.
+
+Translates the English welcome templates into every language in
+LANGUAGE_NAMES and writes api_v2/data/welcome_messages.json, which
+ChatService loads at startup. Review the output before committing it:
+    python -m api_v2.jobs.generate_welcome_catalog --only ka ru
+"""
+from dotenv import load_dotenv
+load_dotenv()
+
+import argparse
+import asyncio
+import json
+import logging
+
+from api_v2.core.llm_gateway import get_llm_gateway
+from api_v2.utils.cosmic_utils import LANGUAGE_NAMES
+from api_v2.utils.welcome_messages import (
+    CATALOG_PATH,
+    WELCOME_TEMPLATES,
+    has_placeholders,
+    load_catalog
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def translate(llm, template: str, language_name: str) -> str:
+    response = await llm.create(
+        'welcome_catalog',
+        model="claude-sonnet-4-20250514",
+        max_tokens=500,
+        messages=[{
+            "role": "user",
+            "content": (
+                f"Translate this chat greeting from a warm tarot reader to {language_name}: {template}\n\n"
+                "Keep {name} and {card_name} exactly as written, untranslated. "
+                "Reply with the translation only."
+            )
+        }]
+    )
+    return response.content[0].text.strip()
+
+
+async def main(args):
+    llm = get_llm_gateway()
+    catalog = load_catalog(args.output)
+    catalog['en'] = dict(WELCOME_TEMPLATES)
+
+    languages = args.only or [code for code in LANGUAGE_NAMES if code != 'en']
+    for code in languages:
+        entry = {}
+        for kind, template in WELCOME_TEMPLATES.items():
+            translated = await translate(llm, template, LANGUAGE_NAMES[code])
+            if not has_placeholders(translated, kind):
+                logger.error(f"{code}/{kind}: placeholders lost, keeping previous entry")
+                break
+            entry[kind] = translated
+        else:
+            catalog[code] = entry
+            logger.info(f"✅ {code}: {entry['standard']}")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    print(f"Wrote {len(catalog)} languages to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the welcome-message catalog")
+    parser.add_argument('--only', nargs='+', choices=sorted(LANGUAGE_NAMES), help="Languages to regenerate")
+    parser.add_argument('--output', default=CATALOG_PATH)
+    asyncio.run(main(parser.parse_args()))
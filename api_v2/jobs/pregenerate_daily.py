@@ -0,0 +1,67 @@
+"""
+Nightly job - pre-generate tomorrow's daily readings for all NFC users.
+
+Scheduled as a Render cron job (see render.yaml); run by hand with:
+    python -m api_v2.jobs.pregenerate_daily --date 2025-01-31 --backend direct
+"""
+from dotenv import load_dotenv
+load_dotenv()
+
+import argparse
+import asyncio
+import json
+import logging
+from datetime import datetime
+
+from api_v2.core.config import settings
+from api_v2.core.database import repository
+from api_v2.dependencies.services import get_reading_service
+from api_v2.services.batch_service import AnthropicBatchBackend, LocalBatchBackend
+from api_v2.services.pregeneration_service import DailyPregenerationService
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def main(args):
+    reading_service = get_reading_service()
+
+    if args.backend == 'batch':
+        backend = AnthropicBatchBackend(
+            reading_service.client,
+            poll_interval=args.poll_interval,
+            max_wait=args.max_wait
+        )
+    else:
+        # Plain messages.create calls with bounded concurrency
+        async def generate(params):
+            response = await reading_service.llm.create('pregenerate', **params)
+            return response.content[0].text
+
+        backend = LocalBatchBackend(generate, concurrency=args.concurrency)
+
+    service = DailyPregenerationService(
+        repository,
+        reading_service,
+        backend,
+        chunk_size=args.chunk_size,
+        max_batches_in_flight=args.batches_in_flight
+    )
+
+    target_date = datetime.strptime(args.date, '%Y-%m-%d') if args.date else None
+    report = await service.run(target_date)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-generate daily readings")
+    parser.add_argument('--date', help="Target date YYYY-MM-DD (default: tomorrow)")
+    parser.add_argument('--backend', choices=['batch', 'direct'], default='batch',
+                        help="Message Batches API, or direct calls with bounded concurrency")
+    parser.add_argument('--chunk-size', type=int, default=100, help="Users per batch")
+    parser.add_argument('--batches-in-flight', type=int, default=4)
+    parser.add_argument('--concurrency', type=int, default=8, help="Direct backend only")
+    parser.add_argument('--poll-interval', type=float, default=30.0, help="Batch backend only")
+    parser.add_argument('--max-wait', type=float, default=settings.PREGENERATION_BATCH_MAX_WAIT_SECONDS,
+                        help="Batch backend only: seconds before an unfinished batch is canceled")
+    asyncio.run(main(parser.parse_args()))
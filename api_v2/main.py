@@ -10,14 +10,21 @@ from datetime import datetime
 from pydantic import BaseModel
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 import logging
 import random
 import string
 
-from api_v2.routes import registration, readings, chat
-from api_v2.core.database import db
+from api_v2.routes import registration, readings, chat, frontend
+from api_v2.core.database import db, repository, profile_cache
 from api_v2.core.config import settings
+from api_v2.dependencies.services import get_chat_service, get_reading_service
+from api_v2.core.loader import DocumentLoaderMiddleware, loader_totals
+from api_v2.core.admission import AdmissionRejected
+from api_v2.core.llm_cache import get_llm_cache
+from api_v2.core.llm_gateway import get_llm_gateway
+from api_v2.core.llm_metrics import chat_context_metrics, llm_metrics, reading_fallbacks
+from api_v2.utils.numerology import get_numerology_engine
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -67,6 +74,31 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+# One DocumentLoader per request: duplicate Firestore reads are deduplicated
+# and concurrent ones share a single get_all round trip
+app.add_middleware(DocumentLoaderMiddleware, repository=repository)
+
+# ============================================================================
+# SINGLE-PROCESS MODE - serve the frontend here instead of Flask + proxy
+# ============================================================================
+if settings.SERVE_FRONTEND:
+    # Registered before the API root so "/" is the React page
+    app.include_router(frontend.router, tags=["Frontend"])
+    frontend.get_static_index()
+
+# ============================================================================
+# LOAD SHEDDING - Claude calls over capacity (core/admission.py)
+# ============================================================================
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected_handler(request, exc: AdmissionRejected):
+    """Too many readings/chats waiting on Claude - ask the client to come back"""
+    logger.warning(f"Shedding {request.url.path}: {exc.reason} (retry after {exc.retry_after}s)")
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "The cards are busy right now - please try again shortly"},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
 # ============================================================================
 # CUSTOM SWAGGER UI WITH NEOARCANA COSMIC THEME
 # ============================================================================
@@ -375,24 +407,37 @@ async def health_check():
         }
     }
 
+@app.get("/metrics")
+async def metrics():
+    """In-process cache and performance counters"""
+    metrics = {
+        "timestamp": datetime.now().isoformat(),
+        "user_profile_cache": profile_cache.stats(),
+        "document_loader": dict(loader_totals),
+        "llm": llm_metrics.stats(),
+        "llm_gateway": get_llm_gateway().stats(),
+        "llm_cache": get_llm_cache(repository).stats(),
+        "chat_context": chat_context_metrics.stats(),
+        "reading_fallbacks": reading_fallbacks.stats(),
+        "trial_pool": get_reading_service().trial_pool.stats()
+    }
+    if settings.SERVE_FRONTEND:
+        metrics["static_files"] = frontend.get_static_index().stats()
+    return metrics
+
 @app.get("/test-claude")
 async def test_claude():
     """Test Claude API connection"""
     try:
-        from anthropic import AsyncAnthropic
-        import os
-        
-        api_key = os.getenv('ANTHROPIC_API_KEY')
-        if not api_key:
+        if not settings.ANTHROPIC_API_KEY:
             return {
                 "success": False,
                 "error": "No API key found in environment",
                 "api_key_loaded": False
             }
         
-        client = AsyncAnthropic(api_key=api_key)
-        
-        response = await client.messages.create(
+        response = await get_llm_gateway().create(
+            'test',
             model="claude-sonnet-4-20250514",
             max_tokens=100,
             messages=[{"role": "user", "content": "Say 'Hello from FastAPI!' in one sentence."}]
@@ -407,7 +452,7 @@ async def test_claude():
         return {
             "success": False,
             "error": str(e),
-            "api_key_loaded": bool(os.getenv('ANTHROPIC_API_KEY'))
+            "api_key_loaded": bool(settings.ANTHROPIC_API_KEY)
         }
 
 # ============================================================================
@@ -434,8 +479,8 @@ async def verify_poster(request: VerifyRequest):
         logger.info(f"Verifying poster: {request.nfc_id}")
         
         # Check in Firebase valid_posters collection
-        poster_ref = db.collection('valid_posters').document(request.nfc_id)
-        poster = poster_ref.get()
+        poster_ref = repository.document('valid_posters', request.nfc_id)
+        poster = await repository.get(poster_ref)
         
         if not poster.exists:
             logger.warning(f"Poster not found: {request.nfc_id}")
@@ -485,8 +530,8 @@ async def create_poster(admin_key: str = None):
             test_code = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
             
             # Check if exists
-            poster_ref = db.collection('valid_posters').document(test_code)
-            if not poster_ref.get().exists:
+            poster_ref = repository.document('valid_posters', test_code)
+            if not (await repository.get(poster_ref)).exists:
                 code = test_code
                 break
         
@@ -504,8 +549,8 @@ async def create_poster(admin_key: str = None):
             'notes': 'Created via FastAPI'
         }
         
-        poster_ref = db.collection('valid_posters').document(code)
-        poster_ref.set(poster_data)
+        poster_ref = repository.document('valid_posters', code)
+        await repository.set(poster_ref, poster_data)
         
         logger.info(f"✅ Created poster code: {code}")
         
@@ -540,9 +585,22 @@ async def startup_event():
     logger.info(f"🔥 Firebase: {'Connected' if db else 'Not Connected'}")
     logger.info(f"🤖 Claude API: {'Configured' if settings.ANTHROPIC_API_KEY else 'NOT CONFIGURED'}")
     logger.info("🌐 CORS: Enabled for HTTP/HTTPS on localhost:5000, localhost:3000")
+    # Build the chat service now so its welcome catalog is loaded before traffic
+    chat_service = get_chat_service()
+    logger.info(f"💬 Welcome messages: {len(chat_service.welcome_catalog)} languages")
+    logger.info(f"🔢 Numerology insights: {len(get_numerology_engine().catalog)} languages")
+    # First trial readings should come from the pool, not Claude
+    if settings.ANTHROPIC_API_KEY and settings.TRIAL_POOL_SIZE:
+        get_reading_service().trial_pool.top_up()
+        logger.info(f"🃏 Trial reading pool: filling {settings.TRIAL_POOL_SIZE} readings")
     logger.info("✅ All routes loaded successfully")
     logger.info("=" * 60)
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release Firestore executor threads"""
+    repository.shutdown()
+
 # ============================================================================
 # RUN WITH: python -m uvicorn api_v2.main:app --reload --port 8000
 # ============================================================================
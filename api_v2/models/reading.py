@@ -2,7 +2,7 @@
 Daily reading models
 """
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Dict, Optional, List
 
 
 class UserPreferences(BaseModel):
@@ -47,16 +47,35 @@ class DailyAffirmationRequest(BaseModel):
         }
 
 
+class ImageSource(BaseModel):
+    """One <source> of a responsive card image"""
+    type: str
+    srcset: str
+
+
+class CardImageSet(BaseModel):
+    """Responsive card image - see utils/card_images.py"""
+    src: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+    placeholder: Optional[str] = None
+    sizes: Optional[str] = None
+    sources: List[ImageSource] = Field(default_factory=list)
+
+
 class ReadingData(BaseModel):
     """Reading data structure"""
     cardName: str
     cardImage: str
+    cardImageSet: Optional[CardImageSet] = None
     interpretation: str
+    sections: Optional[Dict[str, str]] = None  # interpretation split by section marker
     moonPhase: Optional[str] = None
     season: Optional[str] = None
     dayEnergy: Optional[str] = None
     numerologyDay: Optional[int] = None
     cached: bool = False
+    degraded: bool = False  # quick reading served past the latency SLO
 
 
 class DailyAffirmationResponse(BaseModel):
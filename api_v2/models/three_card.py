@@ -2,7 +2,9 @@
 Three-card and weekly reading models
 """
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Dict, Optional, List
+
+from api_v2.models.reading import CardImageSet
 
 
 class ThreeCardRequest(BaseModel):
@@ -26,14 +28,17 @@ class ThreeCardRequest(BaseModel):
 class ThreeCardReading(BaseModel):
     """Three-card reading data structure"""
     cards: List[str]
+    cardImageSets: Optional[List[CardImageSet]] = None
     cardNames: List[str]
     positions: List[str]
     interpretation: str
+    sections: Optional[Dict[str, str]] = None  # interpretation split by section marker
     moonPhase: Optional[str] = None
     season: Optional[str] = None
     dayEnergy: Optional[str] = None
     numerologyDay: Optional[int] = None
     cached: bool = False
+    degraded: bool = False  # quick reading served past the latency SLO
 
 
 class ThreeCardResponse(BaseModel):
@@ -1,7 +1,8 @@
 """
 Chat API endpoints
 """
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import Optional
 import logging
 
 from api_v2.models.chat import (
@@ -10,6 +11,7 @@ from api_v2.models.chat import (
     ChatRequest,
     ChatResponse
 )
+from api_v2.core.admission import AdmissionRejected
 from api_v2.services.chat_service import ChatService
 from api_v2.dependencies.services import get_chat_service
 
@@ -48,6 +50,8 @@ async def start_chat(
         
         return StartChatResponse(**result)
         
+    except AdmissionRejected:
+        raise  # 503 + Retry-After (main.py)
     except Exception as e:
         logger.error(f"Error starting chat: {e}")
         raise HTTPException(
@@ -94,6 +98,8 @@ async def chat(
         
         return ChatResponse(**result)
         
+    except AdmissionRejected:
+        raise  # 503 + Retry-After (main.py)
     except Exception as e:
         logger.error(f"Error in chat: {e}")
         raise HTTPException(
@@ -105,12 +111,16 @@ async def chat(
 @router.get("/chat/history/{session_id}")
 async def get_chat_history(
     session_id: str,
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    before: Optional[str] = None,
     chat_service: ChatService = Depends(get_chat_service)
 ):
     """
-    Get full chat history for a session
+    Get chat history for a session, newest page first
     
-    Retrieves all messages from a chat session stored in Firebase.
+    Returns up to `limit` messages (oldest first within the page).
+    When more exist, `next_cursor` is set - pass it as `before`
+    to fetch the previous page.
     Useful for:
     - Resuming conversations
     - Reviewing past discussions
@@ -119,12 +129,14 @@ async def get_chat_history(
     try:
         logger.info(f"Getting history for session {session_id}")
         
-        history = await chat_service.get_session_history(session_id)
+        history = await chat_service.get_session_history(session_id, limit=limit, before=before)
         
         return {
             "success": True,
             "session_id": session_id,
-            "messages": history
+            "messages": history['messages'],
+            "next_cursor": history['next_cursor'],
+            "has_more": history['next_cursor'] is not None
         }
         
     except Exception as e:
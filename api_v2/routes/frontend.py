@@ -0,0 +1,102 @@
+"""
+Frontend pages - the Flask front end (app.py) ported to FastAPI
+
+With SERVE_FRONTEND enabled, api_v2.main serves the React page and static
+files itself, so the whole site runs in one ASGI process with no proxy hop.
+Static files go through the shared layer in core/static_files.py.
+"""
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import HTMLResponse, Response
+from functools import lru_cache
+from jinja2 import Environment, FileSystemLoader
+import anyio
+import logging
+import os
+
+from api_v2.core.static_files import CHUNK_SIZE, PROJECT_ROOT, STATIC_DIR, StaticFileIndex, StaticResponse
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = os.path.join(PROJECT_ROOT, 'templates')
+
+
+def _static_url(endpoint: str, filename: str) -> str:
+    """Flask-style url_for('static', filename=...) used by the templates"""
+    return f"/static/{filename}"
+
+
+@lru_cache(maxsize=None)
+def get_static_index() -> StaticFileIndex:
+    """Built once - api_v2.main calls this at startup"""
+    return StaticFileIndex(STATIC_DIR)
+
+
+class StaticFileResponse(Response):
+    """Sends the byte range StaticFileIndex.resolve picked, in chunks"""
+
+    def __init__(self, resolved: StaticResponse):
+        status, headers, self.body_range = resolved
+        super().__init__(status_code=status, headers=headers)
+
+    async def __call__(self, scope, receive, send):
+        await send({'type': 'http.response.start', 'status': self.status_code, 'headers': self.raw_headers})
+        if self.body_range is None or scope['method'] == 'HEAD':
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+
+        path, offset, length = self.body_range
+        async with await anyio.open_file(path, 'rb') as f:
+            await f.seek(offset)
+            while length > 0:
+                chunk = await f.read(min(CHUNK_SIZE, length))
+                length -= len(chunk)
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': length > 0 and bool(chunk)})
+                if not chunk:
+                    break
+
+
+def static_response(path: str, request: Request) -> StaticFileResponse:
+    resolved = get_static_index().resolve(path, request.headers)
+    if resolved[0] == 404:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return StaticFileResponse(resolved)
+
+
+@lru_cache(maxsize=None)
+def render_react_page() -> str:
+    """The React shell has no per-request data - render it once"""
+    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR), autoescape=True)
+    env.globals['url_for'] = _static_url
+    html = env.get_template('react.html').render()
+    logger.info(f"Rendered react.html ({len(html)} bytes)")
+    return html
+
+
+@router.get("/", response_class=HTMLResponse, include_in_schema=False)
+async def index():
+    """Serve the main React application"""
+    return HTMLResponse(render_react_page())
+
+
+@router.api_route("/static/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def static_file(path: str, request: Request):
+    """Static files: precompressed variants, ETag/304, byte ranges"""
+    return static_response(path, request)
+
+
+@router.api_route("/manifest.json", methods=["GET", "HEAD"], include_in_schema=False)
+async def web_manifest(request: Request):
+    return static_response('manifest.json', request)
+
+
+@router.api_route("/service-worker.js", methods=["GET", "HEAD"], include_in_schema=False)
+async def service_worker(request: Request):
+    """Served from the root so the worker's scope is the whole site"""
+    return static_response('service-worker.js', request)
+
+
+@router.get("/nfc", response_class=HTMLResponse, include_in_schema=False)
+async def nfc_registration():
+    """NFC registration page"""
+    return HTMLResponse(render_react_page())
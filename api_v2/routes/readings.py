@@ -2,6 +2,9 @@
 Reading API endpoints
 """
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+import json
 import logging
 
 from api_v2.models.reading import (
@@ -16,6 +19,7 @@ from api_v2.models.three_card import (
     WeeklyReadingRequest,
     WeeklyReadingResponse
 )
+from api_v2.core.admission import AdmissionRejected
 from api_v2.services.reading_service import ReadingService
 from api_v2.dependencies.services import get_reading_service
 
@@ -23,6 +27,44 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def _format_sse(event: str, data: Dict) -> str:
+    """Encode one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str, ensure_ascii=False)}\n\n"
+
+
+async def _sse_response(
+    events: AsyncIterator[Tuple[str, Dict]],
+    on_done: Optional[Callable[[Dict], Awaitable[None]]] = None
+) -> StreamingResponse:
+    """
+    Wrap a service event stream in a text/event-stream response.
+
+    The first event is pulled before the response starts so validation
+    errors (unknown user, rate limit) still map to proper HTTP status codes.
+    """
+    first_event = await events.__anext__()
+    
+    async def stream():
+        event, data = first_event
+        while True:
+            if event == 'done' and on_done:
+                await on_done(data)
+            yield _format_sse(event, data)
+            try:
+                event, data = await events.__anext__()
+            except StopAsyncIteration:
+                break
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Don't let proxies buffer the stream
+        }
+    )
+
+
 @router.post("/daily_affirmation", response_model=DailyAffirmationResponse)
 async def daily_affirmation(
     request: DailyAffirmationRequest,
@@ -50,12 +92,14 @@ async def daily_affirmation(
         # Generate reading (ASYNC!)
         reading_data = await reading_service.generate_daily_reading(user_data)
         
-        # Save reading to Firebase (async, doesn't block response)
+        # Save reading to Firebase (async, doesn't block response) - a quick
+        # reading past the SLO is not; the full one is saved on the next tap
         try:
-            await reading_service.save_reading(
-                user_data['nfc_id'],
-                reading_data
-            )
+            if not reading_data.get('degraded'):
+                await reading_service.save_reading(
+                    user_data['nfc_id'],
+                    reading_data
+                )
         except Exception as e:
             # Log but don't fail if save fails
             logger.warning(f"Failed to save reading: {e}")
@@ -65,6 +109,8 @@ async def daily_affirmation(
             data=ReadingData(**reading_data)
         )
         
+    except AdmissionRejected:
+        raise  # 503 + Retry-After (main.py)
     except Exception as e:
         logger.error(f"Error in daily_affirmation: {e}")
         raise HTTPException(
@@ -116,6 +162,8 @@ async def three_card_reading(
     except ValueError as e:
         logger.error(f"Validation error: {e}")
         raise HTTPException(status_code=404, detail=str(e))
+    except AdmissionRejected:
+        raise  # 503 + Retry-After (main.py)
     except Exception as e:
         logger.error(f"Error in three_card_reading: {e}")
         raise HTTPException(
@@ -167,9 +215,111 @@ async def weekly_reading(
             status_code=429,  # 429 = Too Many Requests
             detail=str(e)
         )
+    except AdmissionRejected:
+        raise  # 503 + Retry-After (main.py)
     except Exception as e:
         logger.error(f"Error in weekly_reading: {e}")
         raise HTTPException(
             status_code=500,
             detail="Failed to generate weekly reading"
-        )
\ No newline at end of file
+        )
+
+
+# ============================================================================
+# STREAMING (SSE) VARIANTS
+# ============================================================================
+# Events: meta (cards + cosmic context), token (text delta), section (a
+# [MARKER]...[/MARKER] block as soon as it closes), error, done (full result,
+# same shape as the non-streaming response data).
+
+@router.post("/daily_affirmation/stream")
+async def daily_affirmation_stream(
+    request: DailyAffirmationRequest,
+    reading_service: ReadingService = Depends(get_reading_service)
+):
+    """
+    Stream a personalized daily tarot reading as Server-Sent Events
+    
+    The drawn card arrives immediately in a `meta` event, each section is
+    pushed as soon as its closing marker is generated, and the final `done`
+    event carries the complete reading (saved exactly like the regular endpoint).
+    """
+    logger.info(f"Streaming daily affirmation for: {request.userData.name}")
+    
+    user_data = request.userData.dict()
+    
+    async def save(reading_data: Dict):
+        try:
+            await reading_service.save_reading(user_data['nfc_id'], reading_data)
+        except Exception as e:
+            # Log but don't fail if save fails
+            logger.warning(f"Failed to save reading: {e}")
+    
+    return await _sse_response(
+        reading_service.stream_daily_reading(user_data),
+        on_done=save
+    )
+
+
+@router.post("/three_card_reading/stream")
+async def three_card_reading_stream(
+    request: ThreeCardRequest,
+    reading_service: ReadingService = Depends(get_reading_service)
+):
+    """
+    Stream a three-card Past/Present/Future reading as Server-Sent Events
+    
+    Cached readings are replayed section by section; new readings are
+    cached exactly like the regular endpoint once complete.
+    """
+    try:
+        if request.nfc_id:
+            logger.info(f"Streaming three-card reading for NFC user: {request.nfc_id}")
+            events = reading_service.stream_three_card_reading(request.nfc_id)
+        else:
+            logger.info("Streaming three-card reading for trial user")
+            events = reading_service.stream_trial_three_card_reading()
+        
+        return await _sse_response(events)
+        
+    except ValueError as e:
+        logger.error(f"Validation error: {e}")
+        raise HTTPException(status_code=404, detail=str(e))
+    except AdmissionRejected:
+        raise  # 503 + Retry-After (main.py)
+    except Exception as e:
+        logger.error(f"Error in three_card_reading_stream: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to generate three-card reading"
+        )
+
+
+@router.post("/weekly_reading/stream")
+async def weekly_reading_stream(
+    request: WeeklyReadingRequest,
+    reading_service: ReadingService = Depends(get_reading_service)
+):
+    """
+    Stream the weekly three-card reading (Premium Feature) as Server-Sent Events
+    
+    **RATE LIMITED** exactly like `/weekly_reading`: a user who already had
+    this week's reading gets the saved one replayed.
+    """
+    try:
+        logger.info(f"Streaming weekly reading for: {request.nfc_id}")
+        
+        return await _sse_response(reading_service.stream_weekly_reading(request.nfc_id))
+        
+    except ValueError as e:
+        # Rate limit or validation errors
+        logger.warning(f"Weekly reading limit: {e}")
+        raise HTTPException(status_code=429, detail=str(e))
+    except AdmissionRejected:
+        raise  # 503 + Retry-After (main.py)
+    except Exception as e:
+        logger.error(f"Error in weekly_reading_stream: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to generate weekly reading"
+        )
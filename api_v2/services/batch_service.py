@@ -0,0 +1,120 @@
+"""
+Batch backends - submit many Claude requests at once and collect results later.
+
+Both backends take Message Batches style requests:
+    {"custom_id": "r0", "params": {"model": ..., "max_tokens": ..., "messages": [...]}}
+and return {custom_id: text or None} once the batch has ended.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from api_v2.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AnthropicBatchBackend:
+    """Anthropic Message Batches API (half price, results within 24h)"""
+
+    # How long a canceled batch may take to end before it counts as lost
+    CANCEL_GRACE_SECONDS = 600
+
+    def __init__(self, client, poll_interval: float = 30.0, max_wait: Optional[float] = None):
+        self.client = client
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait if max_wait is not None else settings.PREGENERATION_BATCH_MAX_WAIT_SECONDS
+
+    async def submit(self, requests: List[Dict]) -> str:
+        """Create a batch and return its id"""
+        batch = await self.client.messages.batches.create(requests=requests)
+        logger.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+        return batch.id
+
+    async def wait(self, batch_id: str):
+        """
+        Poll until the batch has ended. Past max_wait the batch is canceled:
+        requests still processing end as canceled (None in results()) while
+        the finished ones are kept.
+        """
+        deadline = time.monotonic() + self.max_wait
+        canceled = False
+        while True:
+            batch = await self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == "ended":
+                return
+            if time.monotonic() >= deadline:
+                if canceled:
+                    raise TimeoutError(f"Batch {batch_id} did not end after cancel")
+                logger.error(
+                    f"Batch {batch_id} still {batch.processing_status} after {self.max_wait:.0f}s, "
+                    f"canceling {batch.request_counts.processing} unfinished requests"
+                )
+                await self.client.messages.batches.cancel(batch_id)
+                canceled = True
+                deadline = time.monotonic() + self.CANCEL_GRACE_SECONDS
+            await asyncio.sleep(self.poll_interval)
+
+    async def results(self, batch_id: str) -> Dict[str, Optional[str]]:
+        """Map custom_id -> generated text (None for errored/expired requests)"""
+        results = {}
+        async for entry in await self.client.messages.batches.results(batch_id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = entry.result.message.content[0].text
+            else:
+                logger.warning(f"Batch request {entry.custom_id} {entry.result.type}")
+                results[entry.custom_id] = None
+        return results
+
+
+class LocalBatchBackend:
+    """
+    In-process stand-in for the Message Batches API.
+
+    Runs each request through `generate(params) -> text` with bounded
+    concurrency. Use it with a stub generator in tests, or with a real
+    messages.create call to pre-generate without the batch API.
+    """
+
+    def __init__(self, generate: Callable[[Dict], Awaitable[str]], concurrency: int = 8):
+        self.generate = generate
+        self.concurrency = concurrency
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._batches: Dict[str, asyncio.Task] = {}
+
+    async def submit(self, requests: List[Dict]) -> str:
+        batch_id = f"local_{uuid.uuid4().hex[:12]}"
+        self._batches[batch_id] = asyncio.create_task(self._run(requests))
+        return batch_id
+
+    async def wait(self, batch_id: str):
+        if batch_id not in self._batches:
+            raise KeyError(f"Unknown local batch: {batch_id}")
+        await asyncio.shield(self._batches[batch_id])
+
+    async def results(self, batch_id: str) -> Dict[str, Optional[str]]:
+        await self.wait(batch_id)
+        return self._batches.pop(batch_id).result()
+
+    async def _run(self, requests: List[Dict]) -> Dict[str, Optional[str]]:
+        # Shared across batches so concurrency is a global cap
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def one(request: Dict):
+            async with self._semaphore:
+                self._in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self._in_flight)
+                try:
+                    return request["custom_id"], await self.generate(request["params"])
+                except Exception as e:
+                    logger.warning(f"Local batch request {request['custom_id']} failed: {e}")
+                    return request["custom_id"], None
+                finally:
+                    self._in_flight -= 1
+
+        return dict(await asyncio.gather(*[one(request) for request in requests]))
@@ -1,26 +1,65 @@
 """
 Chat service - AI conversation about tarot readings
+
+Messages are stored append-only in chat_sessions/{session_id}/messages, one
+document per message keyed by a sortable key, so no document grows with the
+conversation. Sessions created before this layout keep their `messages`
+array and are still read.
 """
+import asyncio
 import logging
+import time
 import uuid
 from datetime import datetime
-from typing import Dict, List
-from anthropic import AsyncAnthropic
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from google.cloud import firestore
 
+from api_v2.core.llm_cache import get_llm_cache
+from api_v2.core.llm_gateway import get_llm_gateway
+from api_v2.core.llm_metrics import chat_context_metrics, llm_metrics
+from api_v2.core.single_flight import SingleFlight
+from api_v2.utils.chat_context import estimate_tokens, fit_context
 from api_v2.utils.cosmic_utils import getLanguageForClaude
+from api_v2.utils.reading_prompts import CHAT_SYSTEM_PROMPT, cached_block
+from api_v2.utils.welcome_messages import (
+    WELCOME_TEMPLATES,
+    has_placeholders,
+    load_catalog,
+    render_welcome
+)
 
 logger = logging.getLogger(__name__)
 
+# Template translations are cached by content (core/llm_cache.py) for this
+# long; personal messages are never cached
+TRANSLATION_CACHE_TTL = 30 * 24 * 3600
+
+# Firestore batches take at most 500 writes
+LEGACY_MIGRATION_BATCH = 400
+
 
 class ChatService:
     """Service for handling chat conversations"""
     
-    def __init__(self, database):
-        self.db = database
-        # Initialize async Anthropic client
+    def __init__(self, repository):
+        self.repo = repository
         from api_v2.core.config import settings
-        self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+        # Shared Claude gateway (pooled client, timeouts, retries, breaker)
+        self.llm = get_llm_gateway()
+        self.llm_cache = get_llm_cache(repository)
+        self.context_messages = settings.CHAT_CONTEXT_MESSAGES
+        self.history_page_size = settings.CHAT_HISTORY_PAGE_SIZE
+        self.input_token_budget = settings.CHAT_INPUT_TOKEN_BUDGET
+        self.verbatim_messages = settings.CHAT_VERBATIM_TURNS * 2
+        self.summary_min_messages = settings.CHAT_SUMMARY_MIN_MESSAGES
+        # Sessions with a summary refresh running, and the refresh tasks
+        self._summarizing = set()
+        self._background = set()
+        # Precomputed welcome templates; Claude translations of missing
+        # languages are memoised per (language, kind)
+        self.welcome_catalog = load_catalog()
+        self._welcome_translations: Dict[Tuple[str, str], str] = {}
+        self._translating = SingleFlight()
     
     async def start_chat_session(
         self,
@@ -40,20 +79,7 @@ class ChatService:
             session_id = str(uuid.uuid4())
             
             # Create welcome message
-            if is_premium:
-                welcome_msg = (
-                    f"Hi {name}! I'm here to discuss your premium three-card reading "
-                    f"representing your past, present, and future. What would you like to know more about?"
-                )
-            else:
-                welcome_msg = (
-                    f"Hi {name}! I'm here to discuss your tarot reading "
-                    f"with the {card_name} card. What would you like to know more about?"
-                )
-            
-            # Translate if not English
-            if language != 'en':
-                welcome_msg = await self._translate_message(welcome_msg, language)
+            welcome_msg = await self._welcome_message(name, card_name, language, is_premium)
             
             # Create session in Firebase
             session_data = {
@@ -66,18 +92,16 @@ class ChatService:
                 'reading': reading,
                 'is_premium': is_premium,
                 'created_at': datetime.now(),
-                'messages': [
-                    {
-                        'role': 'assistant',
-                        'content': welcome_msg,
-                        'timestamp': datetime.now()
-                    }
-                ]
+                'last_activity': datetime.now(),
+                'message_count': 1
             }
             
-            # Save to Firebase
-            session_ref = self.db.collection('chat_sessions').document(session_id)
-            session_ref.set(session_data)
+            # Save session and welcome message to Firebase in one batch
+            session_ref = self.repo.document('chat_sessions', session_id)
+            await self.repo.set_all([
+                (session_ref, session_data),
+                self._message_write(session_ref, 'assistant', welcome_msg)
+            ])
             
             logger.info(f"Chat session started: {session_id} for {name}")
             
@@ -106,19 +130,28 @@ class ChatService:
         Send a message and get AI response
         """
         try:
-            # Get session from Firebase
-            session_ref = self.db.collection('chat_sessions').document(session_id)
-            session_doc = session_ref.get()
+            start = time.perf_counter()
+            
+            # The client sends the whole conversation (possibly empty);
+            # otherwise use the stored window, which ends at message
+            # message_count - 1
+            if message_history is not None:
+                session = await self.repo.load(self.repo.document('chat_sessions', session_id))
+                base_index = 0
+            else:
+                session, message_history = await self._get_recent_messages(session_id)
+                base_index = (session or {}).get('message_count', len(message_history)) - len(message_history)
             
-            if not session_doc.exists:
-                logger.warning(f"Session {session_id} not found, creating new one")
+            if session is None:
+                logger.warning(f"Session {session_id} not found - answering without history, not saving")
                 # If session doesn't exist, treat as new conversation
                 message_history = []
-            else:
-                session_data = session_doc.to_dict()
-                # Get history from session if not provided
-                if message_history is None:
-                    message_history = session_data.get('messages', [])
+            
+            message_history = [
+                msg for msg in message_history
+                if isinstance(msg, dict) and 'role' in msg and 'content' in msg
+            ]
+            summary = (session or {}).get('summary')
             
             # Build system prompt
             system_prompt = self._build_system_prompt(
@@ -126,44 +159,72 @@ class ChatService:
                 zodiac_sign=zodiac_sign,
                 reading=reading,
                 card_name=card_name,
-                language=language
+                language=language,
+                summary=summary
+            )
+            
+            # Keep the context within the per-turn token budget
+            context = fit_context(
+                message_history,
+                base_index=base_index,
+                summarized_count=(session or {}).get('summarized_count', 0) if summary else 0,
+                fixed_tokens=sum(estimate_tokens(block['text']) for block in system_prompt) + estimate_tokens(message),
+                budget=self.input_token_budget,
+                verbatim_messages=self.verbatim_messages
             )
             
             # Format messages for Claude
-            claude_messages = []
-            
-            # Add previous messages
-            for msg in message_history:
-                if isinstance(msg, dict) and 'role' in msg and 'content' in msg:
-                    role = "assistant" if msg['role'] == 'assistant' else "user"
-                    claude_messages.append({
-                        "role": role,
-                        "content": msg['content']
-                    })
-            
-            # Add current message
+            claude_messages = [
+                {
+                    "role": "assistant" if msg['role'] == 'assistant' else "user",
+                    "content": msg['content']
+                }
+                for msg in context['messages']
+            ]
+            
+            # Add current message - cache breakpoint so the next turn reads
+            # the whole conversation so far from the prompt cache
             claude_messages.append({
                 "role": "user",
-                "content": message
+                "content": [cached_block(message)]
             })
             
-            logger.info(f"Sending chat request with {len(claude_messages)} messages")
+            logger.info(
+                f"Sending chat request with {len(claude_messages)} messages "
+                f"(~{context['estimated_tokens']} of {context['full_tokens']} tokens)"
+            )
             
             # Call Claude API (ASYNC!)
-            response = await self.client.messages.create(
+            call_start = time.perf_counter()
+            response = await self.llm.create(
+                'chat',
                 model="claude-sonnet-4-20250514",  # Latest model!
                 max_tokens=1000,
                 system=system_prompt,
                 messages=claude_messages
             )
+            llm_metrics.record('chat', response.usage, time.perf_counter() - call_start)
             
             ai_response = response.content[0].text
             
-            # Save messages to session
-            await self._save_messages_to_session(
-                session_id=session_id,
-                user_message=message,
-                ai_response=ai_response
+            # Save messages to session - an unknown session_id must not
+            # create a partial chat_sessions document
+            if session is not None:
+                await self._save_messages_to_session(
+                    session_id=session_id,
+                    user_message=message,
+                    ai_response=ai_response
+                )
+            
+            # Fold turns that left the verbatim window into the summary,
+            # off the request path
+            if session is not None and len(context['fold']) >= self.summary_min_messages:
+                self._schedule_summary(session_id, summary, context['fold'], context['fold_until'])
+            
+            chat_context_metrics.record_turn(
+                context,
+                dropped=len(message_history) - len(context['messages']),
+                seconds=time.perf_counter() - start
             )
             
             logger.info(f"Chat response generated for session {session_id}")
@@ -183,42 +244,157 @@ class ChatService:
         zodiac_sign: str,
         reading: str,
         card_name: str,
-        language: str
-    ) -> str:
-        """Build system prompt for chat"""
-        
-        prompt = f"""You are a friendly and knowledgeable tarot reader having an ongoing conversation with {name}, 
+        language: str,
+        summary: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Build system prompt for chat: the shared guidelines, then this
+        session's context, then the rolling summary of older turns, if any.
+        The breakpoint after the context caches both, since neither changes
+        between turns; the guidelines alone are too short to cache.
+        """
+        context = f"""You are having an ongoing conversation with {name}, 
 who is a {zodiac_sign}. Their reading was: {reading}"""
         
         if card_name:
-            prompt += f"\nThe card drawn was: {card_name}"
+            context += f"\nThe card drawn was: {card_name}"
         
-        prompt += f"""
-
-Important guidelines:
-1. You are continuing an existing conversation - do not introduce yourself again
-2. Maintain conversation flow naturally
-3. Keep responses focused on the tarot reading and user's zodiac sign
-4. Respond in {getLanguageForClaude(language)} language
-5. Keep responses concise but meaningful (2-3 paragraphs maximum)
-6. Be warm, supportive, and insightful
-7. Reference their specific cards and cosmic context when relevant
-8. Avoid being overly mysterious - be helpful and clear"""
+        context += f"\nRespond in {getLanguageForClaude(language)} language."
         
-        return prompt
+        blocks = [{"type": "text", "text": CHAT_SYSTEM_PROMPT}, cached_block(context)]
+        if summary:
+            blocks.append({
+                "type": "text",
+                "text": f"Summary of the earlier conversation:\n{summary}"
+            })
+        return blocks
+    
+    def _schedule_summary(self, session_id: str, summary: Optional[str], messages: List[Dict], until: int):
+        """Refresh the session summary in the background (one refresh per session at a time)"""
+        if session_id in self._summarizing:
+            return
+        self._summarizing.add(session_id)
+        task = asyncio.ensure_future(self._refresh_summary(session_id, summary, messages, until))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
     
-    async def _translate_message(self, message: str, language: str) -> str:
-        """Translate message to target language"""
+    async def _refresh_summary(self, session_id: str, summary: Optional[str], messages: List[Dict], until: int):
+        """Fold messages into the rolling summary stored on the session"""
         try:
-            translate_prompt = f"Translate this message to {getLanguageForClaude(language)}: {message}"
+            transcript = "\n".join(
+                f"{'Reader' if msg['role'] == 'assistant' else 'Seeker'}: {msg['content']}"
+                for msg in messages
+            )
+            prompt = f"""Update the running summary of a tarot reading conversation.
+
+Current summary:
+{summary or '(none yet)'}
+
+New messages:
+{transcript}
+
+Write the updated summary in at most 150 words. Keep the seeker's questions, concerns and anything the reader promised or advised. Write it in the language of the conversation."""
             
-            response = await self.client.messages.create(
+            start = time.perf_counter()
+            response = await self.llm.create(
+                'chat_summary',
                 model="claude-sonnet-4-20250514",
-                max_tokens=500,
-                messages=[{"role": "user", "content": translate_prompt}]
+                max_tokens=400,
+                messages=[{"role": "user", "content": prompt}]
             )
+            llm_metrics.record('chat_summary', response.usage, time.perf_counter() - start)
+            
+            session_ref = self.repo.document('chat_sessions', session_id)
+            await self.repo.set(session_ref, {
+                'summary': response.content[0].text,
+                'summarized_count': until
+            }, merge=True)
             
-            return response.content[0].text
+            chat_context_metrics.record_summary(True)
+            logger.info(f"Chat summary refreshed for {session_id} (first {until} messages)")
+            
+        except Exception as e:
+            chat_context_metrics.record_summary(False)
+            logger.error(f"Error refreshing chat summary: {e}")
+        finally:
+            self._summarizing.discard(session_id)
+    
+    async def _welcome_message(self, name: str, card_name: str, language: str, is_premium: bool) -> str:
+        """Welcome message from the catalog, translating (once) only for missing languages"""
+        kind = 'premium' if is_premium else 'standard'
+        
+        template = self.welcome_catalog.get(language, {}).get(kind)
+        if template is None and getLanguageForClaude(language) == 'English':
+            # Unknown codes are answered in English
+            template = WELCOME_TEMPLATES[kind]
+        
+        if template is None:
+            key = (language, kind)
+            template = self._welcome_translations.get(key)
+            if template is None:
+                template = await self._translating.do(key, lambda: self._translate_template(language, kind))
+        
+        if template is None:
+            # Translation lost a placeholder - translate this message as before
+            return await self._translate_message(
+                render_welcome(WELCOME_TEMPLATES[kind], name, card_name), language
+            )
+        
+        return render_welcome(template, name, card_name)
+    
+    async def _translate_template(self, language: str, kind: str) -> Optional[str]:
+        """Translate a welcome template keeping its placeholders; memoised on success"""
+        translated = await self._translate_message(
+            WELCOME_TEMPLATES[kind],
+            language,
+            note="Keep {name} and {card_name} exactly as written, untranslated. Reply with the translation only.",
+            cache_ttl=TRANSLATION_CACHE_TTL
+        )
+        
+        if translated == WELCOME_TEMPLATES[kind]:
+            # Translation failed and returned the source - don't memoise it
+            return None
+        
+        if not has_placeholders(translated, kind):
+            logger.warning(f"Welcome translation to {language} dropped placeholders")
+            return None
+        
+        self._welcome_translations[(language, kind)] = translated
+        logger.info(f"Memoised {kind} welcome template for {language}")
+        return translated
+    
+    async def _translate_message(
+        self,
+        message: str,
+        language: str,
+        note: str = "",
+        cache_ttl: Optional[float] = None
+    ) -> str:
+        """
+        Translate message to target language.
+        cache_ttl: cache the translation by prompt - only for messages that
+        carry nothing personal (templates), never names or chat text.
+        """
+        try:
+            translate_prompt = f"Translate this message to {getLanguageForClaude(language)}: {message}"
+            if note:
+                translate_prompt += f"\n\n{note}"
+            
+            params = {
+                "model": "claude-sonnet-4-20250514",
+                "max_tokens": 500,
+                "messages": [{"role": "user", "content": translate_prompt}]
+            }
+            
+            async def translate() -> str:
+                response = await self.llm.create('translate', **params)
+                return response.content[0].text
+            
+            if cache_ttl is None:
+                return await translate()
+            
+            # Same text, same language - same translation
+            return await self.llm_cache.get_or_create('translate', params, translate, cache_ttl)
             
         except Exception as e:
             logger.error(f"Translation error: {e}")
@@ -231,26 +407,19 @@ Important guidelines:
         user_message: str,
         ai_response: str
     ):
-        """Save messages to Firebase session"""
+        """Append the turn to the session's messages subcollection"""
         try:
-            session_ref = self.db.collection('chat_sessions').document(session_id)
-            
-            # Add messages to array
-            session_ref.update({
-                'messages': firestore.ArrayUnion([
-                    {
-                        'role': 'user',
-                        'content': user_message,
-                        'timestamp': datetime.now()
-                    },
-                    {
-                        'role': 'assistant',
-                        'content': ai_response,
-                        'timestamp': datetime.now()
-                    }
-                ]),
-                'last_activity': datetime.now()
-            })
+            session_ref = self.repo.document('chat_sessions', session_id)
+            
+            # Both messages and the session counters in one batch
+            await self.repo.set_all([
+                self._message_write(session_ref, 'user', user_message, 0),
+                self._message_write(session_ref, 'assistant', ai_response, 1),
+                (session_ref, {
+                    'last_activity': datetime.now(),
+                    'message_count': firestore.Increment(2)
+                })
+            ], merge=True)
             
             logger.info(f"Messages saved to session {session_id}")
             
@@ -258,18 +427,107 @@ Important guidelines:
             logger.error(f"Error saving messages: {e}")
             # Don't fail the request if saving fails
     
-    async def get_session_history(self, session_id: str) -> List[Dict]:
-        """Get chat history for a session"""
+    def _message_write(self, session_ref, role: str, content: str, offset: int = 0) -> Tuple:
+        """
+        (ref, data) for one message document.
+        Keys sort chronologically; offset orders messages written together.
+        """
+        key = f"{time.time_ns():020d}-{offset}"
+        return session_ref.collection('messages').document(key), {
+            'key': key,
+            'role': role,
+            'content': content,
+            'timestamp': datetime.now()
+        }
+    
+    async def _query_messages(self, session_id: str, limit: int, before: Optional[str] = None) -> List[Dict]:
+        """Up to limit messages older than the before key, newest first"""
+        query = self.repo.document('chat_sessions', session_id).collection('messages')
+        if before:
+            query = query.where('key', '<', before)
+        return await self.repo.query(
+            query.order_by('key', direction='DESCENDING').limit(limit)
+        )
+    
+    async def _migrate_legacy_messages(self, session_id: str, session: Dict):
+        """
+        Move the messages array of a session from before the subcollection
+        layout into messages/. Legacy keys sort before every time-based key
+        and are deterministic, so an interrupted migration just runs again.
+        """
+        session_ref = self.repo.document('chat_sessions', session_id)
+        legacy = [msg for msg in session['messages'] if isinstance(msg, dict)]
+        
+        writes = []
+        for i, msg in enumerate(legacy):
+            key = f"{0:020d}-{i:06d}"
+            writes.append((session_ref.collection('messages').document(key), {
+                'key': key,
+                'role': msg.get('role'),
+                'content': msg.get('content'),
+                'timestamp': msg.get('timestamp')
+            }))
+        for start in range(0, len(writes), LEGACY_MIGRATION_BATCH):
+            await self.repo.set_all(writes[start:start + LEGACY_MIGRATION_BATCH])
+        
+        # Drop the array and count its messages once they are all copied
+        message_count = session.get('message_count', 0) + len(legacy)
+        await self.repo.update(session_ref, {
+            'messages': firestore.DELETE_FIELD,
+            'message_count': message_count
+        })
+        session.pop('messages')
+        session['message_count'] = message_count
+        
+        logger.info(f"Migrated {len(legacy)} legacy messages of session {session_id}")
+    
+    async def _load_session(self, session_id: str, query: Callable[[], Awaitable[List[Dict]]]) -> Tuple[Optional[Dict], List[Dict]]:
+        """The session document and a messages query, migrating a legacy array first"""
+        session, messages = await asyncio.gather(
+            self.repo.load(self.repo.document('chat_sessions', session_id)),
+            query()
+        )
+        if session and session.get('messages'):
+            await self._migrate_legacy_messages(session_id, session)
+            messages = await query()
+        return session, messages
+    
+    async def _get_recent_messages(self, session_id: str) -> Tuple[Optional[Dict], List[Dict]]:
+        """The session document and its last context_messages messages, oldest first"""
+        session, recent = await self._load_session(
+            session_id, lambda: self._query_messages(session_id, self.context_messages)
+        )
+        
+        if session is None:
+            return None, []
+        
+        recent.reverse()
+        return session, recent
+    
+    async def get_session_history(
+        self,
+        session_id: str,
+        limit: Optional[int] = None,
+        before: Optional[str] = None
+    ) -> Dict:
+        """
+        Get one page of chat history, oldest first.
+        Pass the returned next_cursor as before to page further back.
+        """
+        limit = limit or self.history_page_size
         try:
-            session_ref = self.db.collection('chat_sessions').document(session_id)
-            session_doc = session_ref.get()
-            
-            if session_doc.exists:
-                session_data = session_doc.to_dict()
-                return session_data.get('messages', [])
+            _, page = await self._load_session(
+                session_id, lambda: self._query_messages(session_id, limit + 1, before)
+            )
+            has_more = len(page) > limit
+            page = page[:limit]
+            page.reverse()
             
-            return []
+            return {
+                'messages': page,
+                'next_cursor': page[0]['key'] if has_more else None
+            }
             
         except Exception as e:
             logger.error(f"Error getting session history: {e}")
-            return []
\ No newline at end of file
+            return {'messages': [], 'next_cursor': None}
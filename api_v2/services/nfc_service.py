@@ -13,8 +13,8 @@ class NFCService:
     Service for NFC-related operations
     """
     
-    def __init__(self, database):
-        self.db = database
+    def __init__(self, repository):
+        self.repo = repository
     
     async def verify_poster(self, nfc_id: str) -> Dict:
         """
@@ -22,8 +22,8 @@ class NFCService:
         """
         try:
             # Check in valid_posters collection
-            poster_ref = self.db.collection('valid_posters').document(nfc_id)
-            poster = poster_ref.get()
+            poster_ref = self.repo.document('valid_posters', nfc_id)
+            poster = await self.repo.get(poster_ref)
             
             if not poster.exists:
                 return {
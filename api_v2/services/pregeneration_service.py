@@ -0,0 +1,206 @@
+"""
+Pregeneration service - nightly batch generation of tomorrow's daily readings
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from api_v2.utils.tarot_cards import deck
+
+logger = logging.getLogger(__name__)
+
+
+class DailyPregenerationService:
+    """
+    Walks nfc_users and generates the next day's daily reading for every user
+    through a batch backend, storing results in daily_reading_cache so that
+    /api/nfc/daily_affirmation becomes a cache read.
+
+    Progress is checkpointed per batch under
+    daily_pregeneration_runs/{date}/batches/{batch_id}; re-running the job for
+    the same date collects batches that were already submitted and skips users
+    that already have a reading.
+    """
+
+    def __init__(
+        self,
+        repository,
+        reading_service,
+        backend,
+        chunk_size: int = 100,
+        max_batches_in_flight: int = 4
+    ):
+        self.repo = repository
+        self.reading_service = reading_service
+        self.backend = backend
+        self.chunk_size = chunk_size
+        self.max_batches_in_flight = max_batches_in_flight
+
+    async def run(self, target_date: Optional[datetime] = None) -> Dict:
+        """Pre-generate readings for target_date (default: tomorrow) and return a run report"""
+        target_date = target_date or (datetime.now() + timedelta(days=1))
+        date_key = target_date.strftime('%Y-%m-%d')
+        run_ref = self.repo.document('daily_pregeneration_runs', date_key)
+        started = time.perf_counter()
+
+        report = {
+            'date': date_key,
+            'users': 0,
+            'skipped': 0,
+            'submitted': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'batches': 0,
+            'resumed_batches': 0,
+            'max_batches_in_flight': self.max_batches_in_flight
+        }
+
+        logger.info(f"Pre-generating daily readings for {date_key}")
+        await self.repo.set(run_ref, {'status': 'running', 'started_at': datetime.now()}, merge=True)
+
+        # Resume from checkpoints left by an earlier run for the same date
+        done = set()
+        for batch in await self.repo.query(run_ref.collection('batches')):
+            if batch.get('status') == 'collected':
+                done.update(batch.get('succeeded', []))
+            elif batch.get('status') == 'submitted':
+                logger.info(f"Resuming batch {batch['batch_id']}")
+                report['resumed_batches'] += 1
+                done.update(await self._collect(run_ref, batch, target_date, report))
+
+        # Walk registered users
+        pending = []
+        for doc in await self.repo.query(self.repo.collection('nfc_users')):
+            profile = self._reading_profile(doc)
+            if not profile:
+                continue
+            report['users'] += 1
+            if profile['nfc_id'] in done:
+                report['skipped'] += 1
+                continue
+            pending.append(profile)
+
+        chunks = [pending[i:i + self.chunk_size] for i in range(0, len(pending), self.chunk_size)]
+        semaphore = asyncio.Semaphore(self.max_batches_in_flight)
+
+        async def process(chunk: List[Dict]):
+            async with semaphore:
+                batch = await self._submit(run_ref, chunk, target_date)
+                report['batches'] += 1
+                report['submitted'] += len(chunk)
+                await self._collect(run_ref, batch, target_date, report)
+
+        await asyncio.gather(*[process(chunk) for chunk in chunks])
+
+        elapsed = time.perf_counter() - started
+        report['elapsed_seconds'] = round(elapsed, 2)
+        report['readings_per_second'] = round(report['succeeded'] / elapsed, 2) if elapsed else 0.0
+        if hasattr(self.backend, 'max_in_flight'):
+            report['max_requests_in_flight'] = self.backend.max_in_flight
+
+        status = 'complete' if report['failed'] == 0 else 'partial'
+        await self.repo.set(
+            run_ref,
+            {'status': status, 'finished_at': datetime.now(), 'report': report},
+            merge=True
+        )
+
+        logger.info(f"✅ Pre-generation {status} for {date_key}: {report}")
+        return report
+
+    async def _submit(self, run_ref, users: List[Dict], target_date: datetime) -> Dict:
+        """Build prompts for a chunk of users, submit them and checkpoint the batch"""
+        requests = []
+        mapping = {}
+
+        for i, profile in enumerate(users):
+            prepared = self.reading_service._prepare_daily_reading(profile, target_date)
+            custom_id = f"r{i}"
+            requests.append({
+                'custom_id': custom_id,
+                'params': self.reading_service._message_params('daily', prepared['prompt'], max_tokens=1500)
+            })
+            mapping[custom_id] = {
+                'nfc_id': profile['nfc_id'],
+                'language': profile['language'],
+                'card_name': prepared['card']['name'],
+                'numerology': prepared['numerology']
+            }
+
+        batch_id = await self.backend.submit(requests)
+        batch = {
+            'batch_id': batch_id,
+            'status': 'submitted',
+            'requests': mapping,
+            'submitted_at': datetime.now()
+        }
+        await self.repo.set(run_ref.collection('batches').document(batch_id), batch)
+        return batch
+
+    async def _collect(self, run_ref, batch: Dict, target_date: datetime, report: Dict) -> List[str]:
+        """Wait for a batch, cache its readings and checkpoint it; returns the nfc_ids done"""
+        batch_ref = run_ref.collection('batches').document(batch['batch_id'])
+
+        try:
+            await self.backend.wait(batch['batch_id'])
+            results = await self.backend.results(batch['batch_id'])
+        except Exception as e:
+            # Users in a lost batch are picked up again on the next run
+            logger.error(f"Batch {batch['batch_id']} could not be collected: {e}")
+            report['failed'] += len(batch['requests'])
+            await self.repo.update(batch_ref, {'status': 'failed'})
+            return []
+
+        date_key = target_date.strftime('%Y-%m-%d')
+        cosmic = self.reading_service._get_cosmic_context(target_date)
+        succeeded = []
+        writes = []
+
+        for custom_id, meta in batch['requests'].items():
+            interpretation = results.get(custom_id)
+            if not interpretation:
+                report['failed'] += 1
+                continue
+
+            card = deck.get_card_by_name(meta['card_name'])
+            reading = self.reading_service._build_daily_result(
+                {'card': card, 'cosmic': cosmic, 'numerology': meta.get('numerology')}, interpretation
+            )
+            writes.append(self.reading_service._cache_daily_reading(
+                meta['nfc_id'], date_key, meta['language'], reading
+            ))
+            succeeded.append(meta['nfc_id'])
+
+        await asyncio.gather(*writes)
+        report['succeeded'] += len(succeeded)
+        missing = len(batch['requests']) - len(succeeded)
+        if missing:
+            # Canceled, expired or errored requests: those users get a live reading
+            logger.warning(f"Batch {batch['batch_id']}: {missing} readings missing, they will be generated live")
+
+        await self.repo.update(batch_ref, {
+            'status': 'collected',
+            'succeeded': succeeded,
+            'collected_at': datetime.now()
+        })
+        return succeeded
+
+    def _reading_profile(self, doc: Dict) -> Optional[Dict]:
+        """Shape an nfc_users document like the userData the daily endpoint receives"""
+        nfc_id = doc.get('nfc_id')
+        if not nfc_id:
+            return None
+
+        # Registration nests the profile under user_data
+        profile = doc.get('user_data') or doc
+        preferences = profile.get('preferences') or {}
+
+        return {
+            'nfc_id': nfc_id,
+            'name': profile.get('name', 'Seeker'),
+            'zodiacSign': profile.get('zodiacSign', 'Unknown'),
+            'language': profile.get('language') or preferences.get('language') or 'en',
+            'preferences': preferences
+        }
@@ -11,8 +11,9 @@ logger = logging.getLogger(__name__)
 class RateLimiterService:
     """Service for rate limiting readings"""
     
-    def __init__(self, database):
-        self.db = database
+    def __init__(self, repository, profile_cache):
+        self.repo = repository
+        self.profiles = profile_cache
     
     async def check_weekly_limit(self, nfc_id: str) -> Tuple[bool, Optional[str]]:
         """
@@ -20,15 +21,13 @@ class RateLimiterService:
         Returns: (can_read, error_message)
         """
         try:
-            # Get user document
-            user_ref = self.db.collection('nfc_users').document(nfc_id)
-            user_doc = user_ref.get()
+            # Straight from Firestore: another worker may have just taken the
+            # reading, and lease waiters poll this for the holder's result
+            user_data = await self.repo.get_dict(self.repo.document('nfc_users', nfc_id))
             
-            if not user_doc.exists:
+            if user_data is None:
                 return False, "User not found"
             
-            user_data = user_doc.to_dict()
-            
             # Check if user has premium access
             # For now, assume all users can get weekly readings
             # In production, you'd check subscription status here
@@ -61,20 +60,16 @@ class RateLimiterService:
     async def get_last_weekly_reading(self, nfc_id: str) -> Optional[Dict]:
         """Get the last weekly reading for a user"""
         try:
-            user_ref = self.db.collection('nfc_users').document(nfc_id)
+            user_ref = self.repo.document('nfc_users', nfc_id)
             
             # Get weekly readings subcollection
-            weekly_readings = (
+            weekly_readings = await self.repo.query(
                 user_ref.collection('weekly_readings')
                 .order_by('timestamp', direction='DESCENDING')
                 .limit(1)
-                .stream()
             )
             
-            for reading in weekly_readings:
-                return reading.to_dict()
-            
-            return None
+            return weekly_readings[0] if weekly_readings else None
             
         except Exception as e:
             logger.error(f"Error getting last weekly reading: {e}")
@@ -83,10 +78,13 @@ class RateLimiterService:
     async def mark_weekly_reading_taken(self, nfc_id: str):
         """Mark that user has taken their weekly reading"""
         try:
-            user_ref = self.db.collection('nfc_users').document(nfc_id)
-            user_ref.update({
+            user_ref = self.repo.document('nfc_users', nfc_id)
+            await self.repo.update(user_ref, {
                 'last_weekly_reading': datetime.now()
             })
+            # Limit checks read Firestore directly; this keeps this worker's
+            # cached profile (display reads) current
+            self.profiles.invalidate(nfc_id)
             
             logger.info(f"Marked weekly reading taken for {nfc_id}")
             
@@ -99,14 +97,11 @@ class RateLimiterService:
         Returns: (can_read, error_message)
         """
         try:
-            # For daily readings, we allow one per day
-            user_ref = self.db.collection('nfc_users').document(nfc_id)
-            user_doc = user_ref.get()
+            # For daily readings, we allow one per day (fresh read, as above)
+            user_data = await self.repo.get_dict(self.repo.document('nfc_users', nfc_id))
             
-            if not user_doc.exists:
+            if user_data is None:
                 return False, "User not found"
-            
-            user_data = user_doc.to_dict()
             last_daily = user_data.get('last_daily_reading')
             
             if last_daily:
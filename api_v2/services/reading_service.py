@@ -1,98 +1,455 @@
 """
 Reading service - Tarot reading generation with Claude API
 """
+import asyncio
 import logging
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
-from anthropic import AsyncAnthropic
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
-from api_v2.utils.tarot_cards import get_random_cards, get_card_image
+from api_v2.core.admission import AdmissionRejected
+from api_v2.core.llm_cache import get_llm_cache
+from api_v2.core.llm_gateway import get_llm_gateway
+from api_v2.core.llm_metrics import llm_metrics, reading_fallbacks
+from api_v2.core.reading_pool import ReadingPool
+from api_v2.core.single_flight import FirestoreLease, SingleFlight
+from api_v2.services.rate_limiter_service import RateLimiterService
+
+from api_v2.utils.tarot_cards import (
+    get_card_image,
+    get_card_image_set,
+    get_random_cards,
+    get_seeded_cards
+)
 from api_v2.utils.cosmic_utils import (
-    calculate_moon_phase,
-    get_current_season,
-    calculate_numerology_day,
-    get_day_energy,
+    CosmicContext,
+    get_cosmic_context,
     getLanguageForClaude
 )
+from api_v2.utils.degraded_readings import get_degraded_readings
+from api_v2.utils.numerology import date_number, get_numerology_engine
+from api_v2.utils.reading_sections import SectionStreamParser, parse_sections, with_sections
+from api_v2.utils.reading_prompts import reading_system
 
 logger = logging.getLogger(__name__)
 
+# Anonymous trial interpretations depend only on the cards, moon phase and
+# season; they are cached by prompt (core/llm_cache.py) for this long
+TRIAL_CACHE_TTL = 7 * 24 * 3600
+
 
 class ReadingService:
     """Service for generating tarot readings"""
     
-    def __init__(self, database):
-        self.db = database
-        # Initialize async Anthropic client using settings
+    def __init__(self, repository, profile_cache):
+        self.repo = repository
+        self.profiles = profile_cache
         from api_v2.core.config import settings
-        self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+        # Shared Claude gateway (pooled client, timeouts, retries, breaker);
+        # .client is kept for the Message Batches API
+        self.llm = get_llm_gateway()
+        self.client = self.llm.client
+        self.llm_cache = get_llm_cache(repository)
+        # Daily NUMEROLOGY_INSIGHT is computed locally, not by Claude
+        self.numerology = get_numerology_engine()
+        # Quick readings past the SLO, in the seeker's language
+        self.degraded_readings = get_degraded_readings()
+        self.rate_limiter = RateLimiterService(repository, profile_cache)
+        # Coalesce concurrent per-user generations (double taps, retries)
+        self.single_flight = SingleFlight()
+        self.lease = (
+            FirestoreLease(repository, ttl_seconds=settings.GENERATION_LEASE_SECONDS)
+            if settings.GENERATION_LEASE_ENABLED else None
+        )
+        self.seeded_draws = settings.SEEDED_CARD_DRAWS
+        self.draw_secret = settings.CARD_DRAW_SECRET
+        if self.seeded_draws and not self.draw_secret:
+            # Without the secret anyone who knows an nfc_id could precompute its draws
+            logger.error("CARD_DRAW_SECRET is not set - seeded card draws are turned off")
+            self.seeded_draws = False
+        # Latency SLO per endpoint; generations that outlive it finish here
+        self.slo_seconds = {
+            'daily': settings.DAILY_READING_SLO_SECONDS,
+            'three_card': settings.THREE_CARD_READING_SLO_SECONDS
+        }
+        self._background: Set[asyncio.Task] = set()
+        # Anonymous trial readings depend only on the cards, moon phase and
+        # season, so they are generated ahead of time
+        self.trial_pool = ReadingPool(
+            self._generate_pooled_trial_reading,
+            self._trial_pool_key,
+            size=settings.TRIAL_POOL_SIZE,
+            low_watermark=settings.TRIAL_POOL_LOW_WATERMARK,
+            concurrency=settings.TRIAL_POOL_CONCURRENCY
+        )
     
     async def generate_daily_reading(self, user_data: Dict) -> Dict:
         """
         Generate personalized daily tarot reading
         """
         try:
-            # Extract user info
-            name = user_data.get('name', 'Seeker')
-            zodiac_sign = user_data.get('zodiacSign', 'Unknown')
-            language = user_data.get('language', 'en')
-            preferences = user_data.get('preferences', {})
-            
-            # Get cosmic context
-            current_date = datetime.now()
-            moon_phase = calculate_moon_phase(current_date)
-            season = get_current_season(current_date)
-            day_energy = get_day_energy(current_date)
-            numerology_day = calculate_numerology_day(current_date)
-            
-            # Select random card
-            cards = get_random_cards(1)
-            card = cards[0]
-            
-            # Build personalized prompt
-            prompt = self._build_reading_prompt(
-                name=name,
-                zodiac_sign=zodiac_sign,
-                language=language,
-                preferences=preferences,
-                card=card,
-                moon_phase=moon_phase,
-                season=season,
-                day_energy=day_energy,
-                numerology_day=numerology_day
-            )
+            # Nightly job may already have generated today's reading
+            pregenerated = await self._get_pregenerated_daily_reading(user_data)
+            if pregenerated:
+                return pregenerated
             
-            logger.info(f"Generating reading for {name} - Card: {card['name']}")
-            
-            # Call Claude API (ASYNC!)
-            response = await self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=1500,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            nfc_id = user_data.get('nfc_id')
+            today = datetime.now().strftime('%Y-%m-%d')
+            language = user_data.get('language', 'en')
+            key = ('daily', nfc_id, f"{today}_{language}")
+            drawn = {}
             
-            interpretation = response.content[0].text
+            def shared() -> Dict:
+                # The card the generation drew, also for requests that joined it
+                return self.single_flight.shared(key) if nfc_id else drawn
             
-            result = {
-                "cardName": card['name'],
-                "cardImage": get_card_image(card['name']),
-                "interpretation": interpretation,
-                "moonPhase": moon_phase,
-                "season": season,
-                "dayEnergy": day_energy.get('energy', 'Unknown'),
-                "numerologyDay": numerology_day,
-                "cached": False
-            }
+            async def generate() -> Dict:
+                prepared = shared()['prepared'] = self._prepare_daily_reading(user_data)
+                
+                logger.info(f"Generating reading for {prepared['name']} - Card: {prepared['card']['name']}")
+                
+                # Call Claude API (ASYNC!)
+                interpretation = await self._create_interpretation('daily', prepared['prompt'], max_tokens=1500)
+                
+                result = self._build_daily_result(prepared, interpretation)
+                
+                logger.info(f"✅ Reading generated successfully for {prepared['name']}")
+                
+                return result
+            
+            on_late_result = None
+            if nfc_id:
+                async def cache_late(result: Dict):
+                    # Only readings that missed the SLO are cached - the next tap
+                    # gets them through the pre-generated reading lookup
+                    await self._cache_daily_reading(nfc_id, today, language, result)
+                
+                on_late_result = cache_late
+                # Repeat taps (and streams) join the generation in flight
+                generation = self.single_flight.do(key, generate)
+            else:
+                generation = generate()
             
-            logger.info(f"✅ Reading generated successfully for {name}")
+            def quick_reading() -> Optional[Dict]:
+                prepared = shared().get('prepared')
+                return self._build_degraded_daily_result(prepared) if prepared else None
             
-            return result
+            quick = quick_reading if self.degraded_readings.has(language) else None
+            return await self._within_slo('daily', generation, quick, on_late_result)
             
+        except AdmissionRejected:
+            raise
         except Exception as e:
             logger.error(f"Error generating reading: {e}")
+            reading_fallbacks.record('daily', 'error_fallbacks')
             # Return fallback reading
             return self._get_fallback_reading()
     
+    async def stream_daily_reading(self, user_data: Dict) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        Stream a daily reading as (event, data) pairs.
+        Ends with a 'done' event carrying the same result generate_daily_reading returns.
+        """
+        try:
+            pregenerated = await self._get_pregenerated_daily_reading(user_data)
+            if pregenerated:
+                async for event in self._replay_reading(pregenerated):
+                    yield event
+                return
+            
+            nfc_id = user_data.get('nfc_id')
+            today = datetime.now().strftime('%Y-%m-%d')
+            language = user_data.get('language', 'en')
+            # Same key as generate_daily_reading, so taps join each other
+            key = ('daily', nfc_id, f"{today}_{language}")
+            
+            async def produce() -> AsyncIterator[Tuple[str, Dict]]:
+                # Shared with blocking requests that join this generation
+                prepared = self.single_flight.shared(key)['prepared'] = self._prepare_daily_reading(user_data)
+                card = prepared['card']
+                
+                # Hold an admission slot from before the first event, so an
+                # overloaded server answers 503 instead of a half-sent stream
+                async with self.llm.admission.slot('daily'):
+                    yield 'meta', {
+                        "cardName": card['name'],
+                        "cardImage": get_card_image(card['name']),
+                        "cardImageSet": get_card_image_set(card['name']),
+                        **self._cosmic_fields(prepared)
+                    }
+                    yield 'section', {"name": "NUMEROLOGY_INSIGHT", "content": prepared['numerology']['insight']}
+                
+                    interpretation = None
+                    async for event, data in self._stream_interpretation(
+                        'daily', prepared['prompt'], max_tokens=1500, admitted=True
+                    ):
+                        if event == 'complete':
+                            interpretation = data['interpretation']
+                        else:
+                            yield event, data
+                
+                yield 'done', self._build_daily_result(prepared, interpretation)
+            
+            if nfc_id:
+                async def cache_abandoned(result: Dict):
+                    # The next tap gets it through the pre-generated reading lookup
+                    await self._cache_daily_reading(nfc_id, today, language, result)
+                
+                events = self._stream_coalesced(
+                    'daily', nfc_id, key[2], produce, on_abandoned=cache_abandoned
+                )
+            else:
+                events = produce()
+            async for event in events:
+                yield event
+            
+        except AdmissionRejected:
+            raise
+        except Exception as e:
+            logger.error(f"Error streaming reading: {e}")
+            yield 'error', {"message": "Reading generation failed"}
+            yield 'done', self._get_fallback_reading()
+    
+    def _prepare_daily_reading(self, user_data: Dict, date: Optional[datetime] = None) -> Dict:
+        """Draw the card and build the prompt for a daily reading (today unless date given)"""
+        # Extract user info
+        name = user_data.get('name', 'Seeker')
+        zodiac_sign = user_data.get('zodiacSign', 'Unknown')
+        language = user_data.get('language', 'en')
+        preferences = user_data.get('preferences', {})
+        
+        # Get cosmic context
+        cosmic = self._get_cosmic_context(date)
+        numerology = self.numerology.reading(preferences.get('numbers'), date_number(cosmic.date), language)
+        
+        # Select the day's card
+        cards = self._draw_cards(1, 'daily', user_data.get('nfc_id'), date)
+        card = cards[0]
+        
+        # Build personalized prompt
+        prompt = self._build_reading_prompt(
+            name=name,
+            zodiac_sign=zodiac_sign,
+            language=language,
+            preferences=preferences,
+            card=card,
+            cosmic=cosmic,
+            numerology=numerology
+        )
+        
+        return {
+            "name": name,
+            "language": language,
+            "card": card,
+            "prompt": prompt,
+            "cosmic": cosmic,
+            "numerology": numerology
+        }
+    
+    def _build_daily_result(self, prepared: Dict, interpretation: str) -> Dict:
+        """Assemble the daily reading response"""
+        card = prepared['card']
+        interpretation = self._with_numerology(interpretation, prepared.get('numerology'))
+        return {
+            "cardName": card['name'],
+            "cardImage": get_card_image(card['name']),
+            "cardImageSet": get_card_image_set(card['name']),
+            "interpretation": interpretation,
+            "sections": parse_sections(interpretation),
+            **self._cosmic_fields(prepared),
+            "cached": False
+        }
+    
+    def _with_numerology(self, interpretation: Optional[str], numerology: Optional[Dict]) -> str:
+        """Splice the local NUMEROLOGY_INSIGHT section in after the card reading"""
+        interpretation = interpretation or ''
+        if not numerology or '[NUMEROLOGY_INSIGHT]' in interpretation:
+            return interpretation
+        section = f"[NUMEROLOGY_INSIGHT]\n{numerology['insight']}\n[/NUMEROLOGY_INSIGHT]"
+        head, marker, tail = interpretation.partition('[DAILY_AFFIRMATION]')
+        if not marker:
+            return f"{interpretation.rstrip()}\n\n{section}"
+        return f"{head.rstrip()}\n\n{section}\n\n{marker}{tail}"
+    
+    def _draw_cards(self, count: int, spread: str, nfc_id: Optional[str], date: Optional[datetime] = None) -> List:
+        """
+        Draw a spread. For NFC users (with SEEDED_CARD_DRAWS) the cards are a
+        pure function of (nfc_id, day, spread), so any worker - or a retry after
+        a lost cache entry - gets the same cards without a storage lookup.
+        """
+        if not (self.seeded_draws and nfc_id):
+            return get_random_cards(count)
+        day = (date or datetime.now()).strftime('%Y-%m-%d')
+        return get_seeded_cards(count, self.draw_secret, nfc_id, day, spread)
+    
+    def _get_cosmic_context(self, date: Optional[datetime] = None) -> CosmicContext:
+        """Moon phase, season, day energy and numerology for a date (default: now) - memoised per day"""
+        return get_cosmic_context(date)
+    
+    def _cosmic_fields(self, prepared: Dict) -> Dict:
+        """Cosmic context in response (camelCase) form"""
+        return prepared['cosmic'].response_fields()
+    
+    async def _within_slo(
+        self,
+        endpoint: str,
+        generation: Awaitable[Dict],
+        degraded: Optional[Callable[[], Optional[Dict]]],
+        on_late_result: Optional[Callable[[Dict], Awaitable[None]]] = None
+    ) -> Dict:
+        """
+        Wait for generation up to the endpoint's latency SLO. Past it, return
+        degraded() straight away and let the generation finish in the
+        background; on_late_result then stores the full reading for the next
+        request. Without degraded (no quick reading in the seeker's language),
+        or when it returns None (the generation has not drawn its cards yet),
+        it waits for the full reading.
+        """
+        task = asyncio.ensure_future(generation)
+        slo = self.slo_seconds.get(endpoint) if degraded else None
+        if not slo:
+            result = await task
+        else:
+            try:
+                result = await asyncio.wait_for(asyncio.shield(task), slo)
+            except asyncio.TimeoutError:
+                quick = degraded()
+                if quick is None:
+                    logger.warning(f"{endpoint} reading missed its {slo:g}s SLO with no cards drawn yet - waiting")
+                    result = await task
+                    reading_fallbacks.record(endpoint, 'late')
+                    return result
+                logger.warning(f"{endpoint} reading missed its {slo:g}s SLO - serving a quick reading")
+                reading_fallbacks.record(endpoint, 'slo_fallbacks')
+                self._in_background(self._finish_in_background(endpoint, task, on_late_result))
+                return quick
+        
+        reading_fallbacks.record(endpoint, 'on_time')
+        return result
+    
+    def _in_background(self, coro: Awaitable) -> None:
+        """Run coro to completion without anyone awaiting it"""
+        task = asyncio.ensure_future(coro)
+        # The loop only keeps weak references to tasks
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+    
+    async def _finish_in_background(
+        self,
+        endpoint: str,
+        task: Awaitable[Dict],
+        on_result: Optional[Callable[[Dict], Awaitable[None]]],
+        record: bool = True
+    ):
+        """
+        Await a generation nobody is waiting for any more and store its result.
+        record: count the outcome in the SLO fallback metrics (off for
+        streams whose client went away).
+        """
+        try:
+            result = await task
+            if on_result:
+                await on_result(result)
+        except Exception as e:
+            logger.error(f"Background {endpoint} reading failed: {e}")
+            if record:
+                reading_fallbacks.record(endpoint, 'background_failed')
+            return
+        logger.info(f"✅ Background {endpoint} reading finished")
+        if record:
+            reading_fallbacks.record(endpoint, 'background_completed')
+    
+    def _message_params(
+        self,
+        endpoint: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float] = None
+    ) -> Dict:
+        """
+        messages.create parameters for a reading.
+        The static instructions for the endpoint's reading type go in the
+        system prompt (cached when long enough) and the per-user prompt in
+        the user message.
+        """
+        params = {
+            "model": "claude-sonnet-4-20250514",
+            "max_tokens": max_tokens,
+            "system": reading_system(endpoint),
+            "messages": [{"role": "user", "content": prompt}]
+        }
+        if temperature is not None:
+            params["temperature"] = temperature
+        return params
+    
+    async def _create_interpretation(
+        self,
+        endpoint: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float] = None,
+        cache_ttl: Optional[float] = None
+    ) -> str:
+        """
+        Generate a reading's text in one call, recording usage for endpoint.
+        With cache_ttl the text is memoised by prompt (only for prompts that
+        carry nothing personal).
+        """
+        params = self._message_params(endpoint, prompt, max_tokens, temperature)
+        
+        async def create() -> str:
+            start = time.perf_counter()
+            response = await self.llm.create(endpoint, **params)
+            llm_metrics.record(endpoint, response.usage, time.perf_counter() - start)
+            return response.content[0].text
+        
+        if cache_ttl is None:
+            return await create()
+        return await self.llm_cache.get_or_create(endpoint, params, create, cache_ttl)
+    
+    async def _stream_interpretation(
+        self,
+        endpoint: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float] = None,
+        admitted: bool = False
+    ) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        Stream a Claude completion.
+        Yields 'token' for each text delta, 'section' whenever a section marker
+        closes, and finally 'complete' with the full interpretation.
+        admitted: the caller already holds an admission slot for endpoint.
+        """
+        parser = SectionStreamParser()
+        start = time.perf_counter()
+        first_token = None
+        
+        async with self.llm.stream(
+            endpoint, admitted=admitted, **self._message_params(endpoint, prompt, max_tokens, temperature)
+        ) as stream:
+            async for text in stream.text_stream:
+                if first_token is None:
+                    first_token = time.perf_counter() - start
+                yield 'token', {"text": text}
+                for name, content in parser.feed(text):
+                    yield 'section', {"name": name, "content": content}
+            
+            message = await stream.get_final_message()
+        
+        llm_metrics.record(endpoint, message.usage, time.perf_counter() - start, first_token)
+        
+        for name, content in parser.close():
+            yield 'section', {"name": name, "content": content}
+        
+        yield 'complete', {"interpretation": parser.text}
+    
+    async def _replay_reading(self, reading: Dict) -> AsyncIterator[Tuple[str, Dict]]:
+        """Stream an already-generated (cached) reading in one go"""
+        for name, content in with_sections(reading)['sections'].items():
+            yield 'section', {"name": name, "content": content}
+        yield 'done', reading
+    
     def _build_reading_prompt(
         self,
         name: str,
@@ -100,10 +457,8 @@ class ReadingService:
         language: str,
         preferences: Dict,
         card: Dict,
-        moon_phase: str,
-        season: str,
-        day_energy: Dict,
-        numerology_day: int
+        cosmic: CosmicContext,
+        numerology: Dict
     ) -> str:
         """Build personalized prompt for Claude"""
         
@@ -111,50 +466,37 @@ class ReadingService:
         color_name = color_info.get('name', 'Cosmic Purple') if color_info else 'Cosmic Purple'
         interests = preferences.get('interests', ['spiritual growth'])
         interests_str = ', '.join(interests) if interests else 'spiritual growth'
-        numbers = preferences.get('numbers', {})
+        numbers = self.numerology.prompt_lines(numerology)
         
-        prompt = f"""Create a deeply personalized tarot reading for {name}, 
-who is a {zodiac_sign} born under today's {moon_phase} moon in {season}.
+        # Reading instructions live in the cached system prompt
+        prompt = f"""Reading type: DAILY READING
+Language: {getLanguageForClaude(language)}
+
+Create a deeply personalized tarot reading for {name}, 
+who is a {zodiac_sign} born under today's {cosmic.moon_phase} moon in {cosmic.season}.
 
 Card Drawn: {card['name']}
 Keywords: {', '.join(card['keywords'])}
 
 Cosmic Timing:
-- Moon Phase: {moon_phase}
-- Season: {season}
-- Day Energy: {day_energy.get('energy', 'balanced energy')} ({day_energy.get('planet', 'Cosmic')} Day)
-- Numerological Day: {numerology_day}
+- Moon Phase: {cosmic.moon_phase}
+- Season: {cosmic.season}
+- Day Energy: {cosmic.day_energy.get('energy', 'balanced energy')} ({cosmic.day_energy.get('planet', 'Cosmic')} Day)
+- Numerological Day: {numbers['day']}
 
 Personal Energy:
 - Color Connection: {color_name}
 - Life Path Focus: {interests_str}
-- Personal Numbers: {numbers}
-
-Critical Instructions:
-1. Respond ENTIRELY in {getLanguageForClaude(language)} language
-2. Structure the reading with these EXACT markers:
-
-[CARD_READING]
-(Card interpretation connecting cosmic timing with personal path)
-[/CARD_READING]
-
-[NUMEROLOGY_INSIGHT]
-(Brief insight connecting their personal numbers with today's {numerology_day} energy)
-[/NUMEROLOGY_INSIGHT]
-
-[DAILY_AFFIRMATION]
-(Powerful affirmation drawing from their zodiac and current cosmic energy)
-[/DAILY_AFFIRMATION]
-
-Maintain a mystical yet practical tone throughout."""
+- Personal Numbers: {numbers['personal']}"""
         
         return prompt
     
     def _get_fallback_reading(self) -> Dict:
         """Get fallback reading when API fails"""
-        return {
+        return with_sections({
             "cardName": "The Star",
             "cardImage": "/static/images/cards/star.jpg",
+            "cardImageSet": get_card_image_set("The Star"),
             "interpretation": """[CARD_READING]
 The Star shines upon your path, bringing hope and renewal. Trust that you are being guided toward healing and inspiration.
 [/CARD_READING]
@@ -171,13 +513,20 @@ I trust the path that unfolds before me and welcome divine guidance.
             "dayEnergy": "Unknown",
             "numerologyDay": 0,
             "cached": False
-        }
+        })
+    
+    def _build_degraded_daily_result(self, prepared: Dict) -> Dict:
+        """Quick reading of the drawn card from its keywords (no Claude call)"""
+        interpretation = self.degraded_readings.daily(
+            prepared['name'], prepared['card'], prepared['cosmic'], prepared['language']
+        )
+        return {**self._build_daily_result(prepared, interpretation), "degraded": True}
     
     async def save_reading(self, nfc_id: str, reading_data: Dict):
         """Save reading to Firebase"""
         try:
-            reading_ref = self.db.collection('nfc_readings').document()
-            reading_ref.set({
+            reading_ref = self.repo.document('nfc_readings')
+            await self.repo.set(reading_ref, {
                 'nfc_id': nfc_id,
                 'reading_data': reading_data,
                 'created_at': datetime.now(),
@@ -187,6 +536,31 @@ I trust the path that unfolds before me and welcome divine guidance.
         except Exception as e:
             logger.error(f"Error saving reading: {e}")
     
+    async def _get_pregenerated_daily_reading(self, user_data: Dict) -> Optional[Dict]:
+        """Return today's reading from daily_reading_cache if the nightly job made one"""
+        nfc_id = user_data.get('nfc_id')
+        if not nfc_id:
+            return None
+        
+        today = datetime.now().strftime('%Y-%m-%d')
+        language = user_data.get('language', 'en')
+        try:
+            cache_ref = self.repo.document('daily_reading_cache', f"{nfc_id}_{today}_{language}")
+            reading = with_sections(await self.repo.load(cache_ref))
+            if reading:
+                logger.info(f"Returning pre-generated daily reading for {nfc_id}")
+                reading['cached'] = True
+            return reading
+            
+        except Exception as e:
+            logger.error(f"Error getting pre-generated reading: {e}")
+            return None
+    
+    async def _cache_daily_reading(self, nfc_id: str, date: str, language: str, reading: Dict):
+        """Store a pre-generated daily reading"""
+        cache_ref = self.repo.document('daily_reading_cache', f"{nfc_id}_{date}_{language}")
+        await self.repo.set(cache_ref, reading)
+    
     async def generate_trial_three_card_reading(self, user_data: Optional[Dict] = None) -> Dict:
         """
         Generate AI-powered three-card reading for trial users
@@ -194,116 +568,27 @@ I trust the path that unfolds before me and welcome divine guidance.
         NOW WITH PERSONALIZATION! 🎉
         """
         try:
-            logger.info("Generating AI-powered trial three-card reading")
-            
-            # Get cosmic context
-            current_date = datetime.now()
-            moon_phase = calculate_moon_phase(current_date)
-            season = get_current_season(current_date)
+            if not user_data:
+                pooled = self.trial_pool.pop()
+                if pooled:
+                    logger.info("Serving trial three-card reading from the pool")
+                    return pooled
             
-            # Select three random cards
-            cards = get_random_cards(3)
-            
-            card_names = [card['name'] for card in cards]
-            
-            # FIX: Ensure full path for images
-            card_images = []
-            for card in cards:
-                img = card['image']
-                # If image doesn't start with /static, add full path
-                if not img.startswith('/static'):
-                    # Remove any leading slashes and get just filename
-                    filename = img.split('/')[-1] if '/' in img else img
-                    img = f'/static/images/cards/{filename}'
-                card_images.append(img)
-            
-            positions = ["Past", "Present", "Future"]
-            
-            logger.info(f"Selected cards for trial: {card_names}")
+            logger.info("Generating AI-powered trial three-card reading")
             
-            # Get user info for personalization (if provided)
-            name = "friend"
-            zodiac_sign = ""
-            if user_data:
-                name = user_data.get('name', 'friend')
-                zodiac_sign = user_data.get('zodiacSign', '')
+            prepared = self._prepare_trial_three_card_reading(user_data)
             
-            # BUILD AI PROMPT for detailed reading
-            prompt = f"""You are a mystical tarot reader providing a deeply personalized three-card reading. 
-
-CARDS DRAWN:
-- PAST: {card_names[0]}
-- PRESENT: {card_names[1]}  
-- FUTURE: {card_names[2]}
-
-COSMIC CONTEXT:
-- Moon Phase: {moon_phase}
-- Season: {season}
-{f'- Zodiac Sign: {zodiac_sign}' if zodiac_sign else ''}
-
-Create a comprehensive, meaningful three-card reading with these sections:
-
-[PAST]
-Write 3-4 paragraphs (150-200 words) about {card_names[0]} in the past position. Explain:
-- What foundations this card reveals from their past
-- How past experiences shaped who they are today
-- What lessons and wisdom they've gained
-- How this energy still influences them
-Be specific, insightful, and empowering.
-
-[PRESENT]
-Write 3-4 paragraphs (150-200 words) about {card_names[1]} in the present position. Explain:
-- What this card reveals about their current situation
-- The energies and influences active right now
-- Opportunities and challenges they're facing
-- What they need to understand or embrace
-Be direct, relevant, and actionable.
-
-[FUTURE]
-Write 3-4 paragraphs (150-200 words) about {card_names[2]} in the future position. Explain:
-- What this card shows about the path ahead
-- Potential outcomes and possibilities
-- How current actions influence future results
-- What to focus on moving forward
-Be hopeful, inspiring, and empowering.
-
-[INTEGRATION]
-Write 2-3 paragraphs (100-150 words) weaving all three cards together. Show:
-- How the journey flows from {card_names[0]} through {card_names[1]} to {card_names[2]}
-- The overarching story these cards tell
-- How the {moon_phase} moon and {season} season amplify this message
-- A powerful concluding insight
-
-TONE: Warm, wise, mystical yet grounded. Speak directly to the reader as "you". Be specific to the actual cards drawn, not generic. Make it feel deeply personal and meaningful.
-
-LENGTH: Total of 600-800 words for a comprehensive, satisfying reading."""
-
             # Call Claude API
             logger.info("Calling Claude API for three-card interpretation...")
             
-            response = await self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=2000,
-                temperature=0.8,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
+            interpretation = await self._create_interpretation(
+                'trial_three_card', prepared['prompt'], max_tokens=2000, temperature=0.8,
+                cache_ttl=None if user_data else TRIAL_CACHE_TTL
             )
             
-            interpretation = response.content[0].text
-            
             logger.info(f"AI interpretation generated: {len(interpretation)} characters")
             
-            result = {
-                "cards": card_images,
-                "cardNames": card_names,
-                "positions": positions,
-                "interpretation": interpretation,
-                "moonPhase": moon_phase,
-                "season": season,
-                "cached": False
-            }
+            result = self._build_trial_three_card_result(prepared, interpretation)
             
             logger.info("Trial three-card reading generated successfully with AI")
             return result
@@ -312,6 +597,130 @@ LENGTH: Total of 600-800 words for a comprehensive, satisfying reading."""
             logger.error(f"Error generating trial three-card reading: {e}")
             raise
     
+    async def stream_trial_three_card_reading(self, user_data: Optional[Dict] = None) -> AsyncIterator[Tuple[str, Dict]]:
+        """Stream a trial three-card reading as (event, data) pairs"""
+        try:
+            pooled = None if user_data else self.trial_pool.pop()
+            if pooled:
+                async for event in self._replay_reading(pooled):
+                    yield event
+                return
+            
+            prepared = self._prepare_trial_three_card_reading(user_data)
+            
+            async with self.llm.admission.slot('trial_three_card'):
+                yield 'meta', {
+                    "cards": prepared['card_images'],
+                    "cardImageSets": [get_card_image_set(name) for name in prepared['card_names']],
+                    "cardNames": prepared['card_names'],
+                    "positions": prepared['positions'],
+                    "moonPhase": prepared['moon_phase'],
+                    "season": prepared['season']
+                }
+            
+                interpretation = None
+                async for event, data in self._stream_interpretation(
+                    'trial_three_card', prepared['prompt'], max_tokens=2000, temperature=0.8, admitted=True
+                ):
+                    if event == 'complete':
+                        interpretation = data['interpretation']
+                    else:
+                        yield event, data
+            
+            yield 'done', self._build_trial_three_card_result(prepared, interpretation)
+            
+        except AdmissionRejected:
+            raise
+        except Exception as e:
+            logger.error(f"Error streaming trial three-card reading: {e}")
+            yield 'error', {"message": "Reading generation failed"}
+            yield 'done', self._get_fallback_three_card_reading()
+    
+    def _trial_pool_key(self) -> Tuple[str, str]:
+        """What an anonymous trial prompt depends on besides the cards"""
+        cosmic = self._get_cosmic_context()
+        return cosmic.moon_phase, cosmic.season
+    
+    async def _generate_pooled_trial_reading(self) -> Dict:
+        """One anonymous trial reading for the pool"""
+        prepared = self._prepare_trial_three_card_reading()
+        interpretation = await self._create_interpretation(
+            'trial_pool', prepared['prompt'], max_tokens=2000, temperature=0.8, cache_ttl=TRIAL_CACHE_TTL
+        )
+        return self._build_trial_three_card_result(prepared, interpretation)
+    
+    def _prepare_trial_three_card_reading(self, user_data: Optional[Dict] = None) -> Dict:
+        """Draw three cards and build the trial reading prompt"""
+        # Get cosmic context
+        cosmic = self._get_cosmic_context()
+        
+        # Select three random cards
+        cards = get_random_cards(3)
+        
+        card_names = [card['name'] for card in cards]
+        
+        # FIX: Ensure full path for images
+        card_images = []
+        for card in cards:
+            img = card['image']
+            # If image doesn't start with /static, add full path
+            if not img.startswith('/static'):
+                # Remove any leading slashes and get just filename
+                filename = img.split('/')[-1] if '/' in img else img
+                img = f'/static/images/cards/{filename}'
+            card_images.append(img)
+        
+        positions = ["Past", "Present", "Future"]
+        
+        logger.info(f"Selected cards for trial: {card_names}")
+        
+        # Get user info for personalization (if provided)
+        name = "friend"
+        zodiac_sign = ""
+        if user_data:
+            name = user_data.get('name', 'friend')
+            zodiac_sign = user_data.get('zodiacSign', '')
+        
+        # BUILD AI PROMPT for detailed reading
+        # Reading instructions live in the cached system prompt
+        prompt = f"""Reading type: TRIAL THREE-CARD READING
+Language: English
+
+Create a deeply personalized three-card reading for {name}.
+
+CARDS DRAWN:
+- PAST: {card_names[0]}
+- PRESENT: {card_names[1]}  
+- FUTURE: {card_names[2]}
+
+COSMIC CONTEXT:
+- Moon Phase: {cosmic.moon_phase}
+- Season: {cosmic.season}
+{f'- Zodiac Sign: {zodiac_sign}' if zodiac_sign else ''}"""
+        
+        return {
+            "card_names": card_names,
+            "card_images": card_images,
+            "positions": positions,
+            "moon_phase": cosmic.moon_phase,
+            "season": cosmic.season,
+            "prompt": prompt
+        }
+    
+    def _build_trial_three_card_result(self, prepared: Dict, interpretation: str) -> Dict:
+        """Assemble the trial three-card response"""
+        return {
+            "cards": prepared['card_images'],
+            "cardImageSets": [get_card_image_set(name) for name in prepared['card_names']],
+            "cardNames": prepared['card_names'],
+            "positions": prepared['positions'],
+            "interpretation": interpretation,
+            "sections": parse_sections(interpretation),
+            "moonPhase": prepared['moon_phase'],
+            "season": prepared['season'],
+            "cached": False
+        }
+    
     async def generate_three_card_reading(self, nfc_id: str) -> Dict:
         """
         Generate three-card reading for NFC user (with saved preferences)
@@ -319,91 +728,292 @@ LENGTH: Total of 600-800 words for a comprehensive, satisfying reading."""
         try:
             logger.info(f"Generating three-card reading for NFC user: {nfc_id}")
             
+            # Check cache (one per day) - fetched together with the user doc
+            today = datetime.now().strftime('%Y-%m-%d')
+            self.repo.prime(self.repo.document('three_card_cache', f"{nfc_id}_{today}"))
+            
             # Get user from Firebase
-            user_ref = self.db.collection('nfc_users').document(nfc_id)
-            user_doc = user_ref.get()
+            user_data = await self._get_user_data(nfc_id)
             
-            if not user_doc.exists:
-                raise ValueError(f"User not found: {nfc_id}")
+            async def fetch_cached() -> Optional[Dict]:
+                cached_reading = await self._get_cached_three_card_reading(nfc_id, today)
+                if cached_reading:
+                    logger.info(f"Returning cached three-card reading for {nfc_id}")
+                    cached_reading['cached'] = True
+                return cached_reading
             
-            user_data = user_doc.to_dict()
+            key = ('three_card', nfc_id, today)
             
-            # Check cache (one per day)
-            today = datetime.now().strftime('%Y-%m-%d')
-            cached_reading = await self._get_cached_three_card_reading(nfc_id, today)
+            async def generate() -> Dict:
+                cached_reading = await fetch_cached()
+                if cached_reading:
+                    return cached_reading
+                
+                # Shared with requests that join this generation
+                prepared = self.single_flight.shared(key)['prepared'] = self._prepare_three_card_reading(user_data)
+                
+                # Call Claude API
+                interpretation = await self._create_interpretation(
+                    'three_card', prepared['prompt'], max_tokens=2000, temperature=0.8
+                )
+                
+                result = self._build_three_card_result(prepared, interpretation)
+                
+                # Cache the reading
+                await self._cache_three_card_reading(nfc_id, today, result)
+                
+                logger.info(f"✅ Three-card reading generated for {prepared['name']}")
+                
+                return result
             
-            if cached_reading:
-                logger.info(f"Returning cached three-card reading for {nfc_id}")
-                cached_reading['cached'] = True
-                return cached_reading
+            def quick_reading() -> Optional[Dict]:
+                # The cards the generation drew, whichever request started it
+                prepared = self.single_flight.shared(key).get('prepared')
+                return self._build_degraded_three_card_result(prepared) if prepared else None
             
-            # Extract user info
-            name = user_data.get('name', 'Seeker')
-            zodiac_sign = user_data.get('zodiacSign', 'Unknown')
-            language = user_data.get('language', 'en')
-            preferences = user_data.get('preferences', {})
-            
-            # Get cosmic context
-            current_date = datetime.now()
-            moon_phase = calculate_moon_phase(current_date)
-            season = get_current_season(current_date)
-            day_energy = get_day_energy(current_date)
-            numerology_day = calculate_numerology_day(current_date)
-            
-            # Select three cards
-            cards = get_random_cards(3)
-            card_names = [card['name'] for card in cards]
-            
-            logger.info(f"Selected cards: {card_names}")
-            
-            # Build prompt for three-card reading
-            prompt = self._build_three_card_prompt(
-                name=name,
-                zodiac_sign=zodiac_sign,
-                language=language,
-                preferences=preferences,
-                cards=cards,
-                moon_phase=moon_phase,
-                season=season,
-                day_energy=day_energy,
-                numerology_day=numerology_day
-            )
+            quick = quick_reading if self.degraded_readings.has(user_data.get('language', 'en')) else None
             
-            # Call Claude API
-            response = await self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=2000,
-                temperature=0.8,
-                messages=[{"role": "user", "content": prompt}]
+            # The generation caches its own result, also when it finishes late
+            return await self._within_slo(
+                'three_card', self._coalesce('three_card', nfc_id, today, generate, fetch_cached), quick
             )
             
-            interpretation = response.content[0].text
-            
-            result = {
-                "cards": [get_card_image(card['name']) for card in cards],
-                "cardNames": card_names,
-                "positions": ["Past", "Present", "Future"],
-                "interpretation": interpretation,
-                "moonPhase": moon_phase,
-                "season": season,
-                "dayEnergy": day_energy.get('energy', 'Unknown'),
-                "numerologyDay": numerology_day,
-                "cached": False
-            }
+        except ValueError as e:
+            logger.error(f"Validation error: {e}")
+            raise
+        except AdmissionRejected:
+            raise
+        except Exception as e:
+            logger.error(f"Error generating three-card reading: {e}")
+            reading_fallbacks.record('three_card', 'error_fallbacks')
+            return self._get_fallback_three_card_reading()
+    
+    async def stream_three_card_reading(self, nfc_id: str) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        Stream a three-card reading for an NFC user as (event, data) pairs.
+        Raises ValueError before the first event if the user does not exist.
+        """
+        logger.info(f"Streaming three-card reading for NFC user: {nfc_id}")
+        
+        today = datetime.now().strftime('%Y-%m-%d')
+        self.repo.prime(self.repo.document('three_card_cache', f"{nfc_id}_{today}"))
+        
+        user_data = await self._get_user_data(nfc_id)
+        
+        async def fetch_cached() -> Optional[Dict]:
+            cached_reading = await self._get_cached_three_card_reading(nfc_id, today)
+            if cached_reading:
+                logger.info(f"Returning cached three-card reading for {nfc_id}")
+                cached_reading['cached'] = True
+            return cached_reading
+        
+        key = ('three_card', nfc_id, today)
+        
+        async def produce() -> AsyncIterator[Tuple[str, Dict]]:
+            cached_reading = await fetch_cached()
+            if cached_reading:
+                yield 'done', cached_reading
+                return
+            
+            # Shared with blocking requests that join this generation
+            prepared = self.single_flight.shared(key)['prepared'] = self._prepare_three_card_reading(user_data)
+            
+            async with self.llm.admission.slot('three_card'):
+                yield 'meta', {
+                    "cards": [get_card_image(card['name']) for card in prepared['cards']],
+                    "cardImageSets": [get_card_image_set(card['name']) for card in prepared['cards']],
+                    "cardNames": [card['name'] for card in prepared['cards']],
+                    "positions": ["Past", "Present", "Future"],
+                    **self._cosmic_fields(prepared)
+                }
+            
+                interpretation = None
+                async for event, data in self._stream_interpretation(
+                    'three_card', prepared['prompt'], max_tokens=2000, temperature=0.8, admitted=True
+                ):
+                    if event == 'complete':
+                        interpretation = data['interpretation']
+                    else:
+                        yield event, data
+            
+            result = self._build_three_card_result(prepared, interpretation)
             
             # Cache the reading
             await self._cache_three_card_reading(nfc_id, today, result)
             
-            logger.info(f"✅ Three-card reading generated for {name}")
-            
-            return result
+            yield 'done', result
+        
+        try:
+            async for event in self._stream_coalesced('three_card', nfc_id, today, produce, fetch_cached):
+                yield event
             
-        except ValueError as e:
-            logger.error(f"Validation error: {e}")
+        except AdmissionRejected:
             raise
         except Exception as e:
-            logger.error(f"Error generating three-card reading: {e}")
-            return self._get_fallback_three_card_reading()
+            logger.error(f"Error streaming three-card reading: {e}")
+            yield 'error', {"message": "Reading generation failed"}
+            yield 'done', self._get_fallback_three_card_reading()
+    
+    async def _stream_coalesced(
+        self,
+        endpoint: str,
+        nfc_id: str,
+        day: str,
+        produce: Callable[[], AsyncIterator[Tuple[str, Dict]]],
+        fetch_existing: Optional[Callable[[], Awaitable[Optional[Dict]]]] = None,
+        on_abandoned: Optional[Callable[[Dict], Awaitable[None]]] = None
+    ) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        Streaming counterpart of _coalesce. produce() yields the stream's
+        events and ends with ('done', result); it runs as the SingleFlight
+        generation for (endpoint, nfc_id, day), under the lease, and feeds
+        this stream through a queue. Concurrent streaming and blocking
+        requests join it and get its result replayed. Without fetch_existing
+        there is no lease: the generation is only coalesced in this worker.
+        The generation outlives a client that disconnects mid-stream;
+        on_abandoned then stores its result for the next request.
+        """
+        key = (endpoint, nfc_id, day)
+        events: asyncio.Queue = asyncio.Queue()
+        
+        async def generate() -> Dict:
+            result = None
+            async for event, data in produce():
+                if event == 'done':
+                    result = data
+                else:
+                    events.put_nowait((event, data))
+            return result
+        
+        joining = self.single_flight.get(key) is not None
+        if fetch_existing is None:
+            work = generate
+        else:
+            work = lambda: self._generate_with_lease(key, generate, fetch_existing)
+        task = self.single_flight.start(key, work)
+        if joining:
+            async for event in self._replay_reading(await asyncio.shield(task)):
+                yield event
+            return
+        
+        # Also wakes us when the lease handed back another worker's result
+        task.add_done_callback(lambda _: events.put_nowait(None))
+        delivered = False
+        try:
+            streamed = False
+            while True:
+                item = await events.get()
+                if item is None:
+                    break
+                streamed = True
+                yield item
+            
+            result = await asyncio.shield(task)
+            if streamed:
+                yield 'done', result
+            else:
+                # Cached, or generated by another worker
+                async for event in self._replay_reading(result):
+                    yield event
+            delivered = True
+        finally:
+            failed = task.done() and (task.cancelled() or task.exception() is not None)
+            if not delivered and on_abandoned is not None and not failed:
+                logger.info(f"Client left the {endpoint} stream for {nfc_id} - finishing it in the background")
+                self._in_background(self._finish_in_background(endpoint, task, on_abandoned, record=False))
+    
+    async def _coalesce(
+        self,
+        endpoint: str,
+        nfc_id: str,
+        day: str,
+        generate: Callable[[], Awaitable[Dict]],
+        fetch_existing: Callable[[], Awaitable[Optional[Dict]]]
+    ) -> Dict:
+        """
+        Run generate once per (endpoint, nfc_id, day) across concurrent callers.
+        With the Firestore lease enabled, a worker that loses the lease waits
+        for fetch_existing to return the other worker's result instead.
+        """
+        key = (endpoint, nfc_id, day)
+        return await self.single_flight.do(
+            key, lambda: self._generate_with_lease(key, generate, fetch_existing)
+        )
+    
+    async def _generate_with_lease(
+        self,
+        key: Tuple[str, str, str],
+        generate: Callable[[], Awaitable[Dict]],
+        fetch_existing: Callable[[], Awaitable[Optional[Dict]]]
+    ) -> Dict:
+        """Generate under the cross-worker lease, if enabled"""
+        if self.lease is None:
+            return await generate()
+        
+        lease_key = ':'.join(key)
+        if not await self.lease.acquire(lease_key):
+            logger.info(f"Another worker is generating {lease_key}, waiting for its result")
+            existing = await self.lease.wait_for(fetch_existing)
+            if existing is not None:
+                return existing
+            # Lease expired without a result - generate ourselves
+            return await generate()
+        
+        try:
+            return await generate()
+        finally:
+            await self.lease.release(lease_key)
+    
+    async def _get_user_data(self, nfc_id: str) -> Dict:
+        """Load an NFC user document, raising ValueError if missing"""
+        user_data = await self.profiles.get(nfc_id)
+        
+        if user_data is None:
+            raise ValueError(f"User not found: {nfc_id}")
+        
+        return user_data
+    
+    def _prepare_three_card_reading(self, user_data: Dict) -> Dict:
+        """Draw three cards and build the prompt for an NFC user's reading"""
+        # Extract user info
+        name = user_data.get('name', 'Seeker')
+        zodiac_sign = user_data.get('zodiacSign', 'Unknown')
+        language = user_data.get('language', 'en')
+        preferences = user_data.get('preferences', {})
+        
+        # Get cosmic context
+        cosmic = self._get_cosmic_context()
+        
+        # Select three cards
+        cards = self._draw_cards(3, 'three_card', user_data.get('nfc_id'))
+        
+        logger.info(f"Selected cards: {[card['name'] for card in cards]}")
+        
+        # Build prompt for three-card reading
+        prompt = self._build_three_card_prompt(
+            name=name,
+            zodiac_sign=zodiac_sign,
+            language=language,
+            preferences=preferences,
+            cards=cards,
+            cosmic=cosmic
+        )
+        
+        return {"name": name, "language": language, "cards": cards, "prompt": prompt, "cosmic": cosmic}
+    
+    def _build_three_card_result(self, prepared: Dict, interpretation: str) -> Dict:
+        """Assemble the three-card reading response"""
+        cards = prepared['cards']
+        return {
+            "cards": [get_card_image(card['name']) for card in cards],
+            "cardImageSets": [get_card_image_set(card['name']) for card in cards],
+            "cardNames": [card['name'] for card in cards],
+            "positions": ["Past", "Present", "Future"],
+            "interpretation": interpretation,
+            "sections": parse_sections(interpretation),
+            **self._cosmic_fields(prepared),
+            "cached": False
+        }
     
     def _build_three_card_prompt(
         self,
@@ -412,10 +1022,7 @@ LENGTH: Total of 600-800 words for a comprehensive, satisfying reading."""
         language: str,
         preferences: Dict,
         cards: List[Dict],
-        moon_phase: str,
-        season: str,
-        day_energy: Dict,
-        numerology_day: int
+        cosmic: CosmicContext
     ) -> str:
         """Build prompt for three-card reading"""
         
@@ -430,55 +1037,33 @@ LENGTH: Total of 600-800 words for a comprehensive, satisfying reading."""
         interests = preferences.get('interests', ['spiritual growth'])
         interests_str = ', '.join(interests) if interests else 'spiritual growth'
         
-        prompt = f"""Create a deeply personalized three-card tarot reading for {name}, 
-a {zodiac_sign} born under today's {moon_phase} moon in {season}.
+        # Reading instructions live in the cached system prompt
+        prompt = f"""Reading type: THREE-CARD READING
+Language: {getLanguageForClaude(language)}
+
+Create a deeply personalized three-card tarot reading for {name}, 
+a {zodiac_sign} born under today's {cosmic.moon_phase} moon in {cosmic.season}.
 
 Cards Drawn:
 {chr(10).join(cards_info)}
 
 Cosmic Timing:
-- Moon Phase: {moon_phase}
-- Season: {season}
-- Day Energy: {day_energy.get('energy', 'balanced energy')} ({day_energy.get('planet', 'Cosmic')} Day)
-- Numerological Day: {numerology_day}
+- Moon Phase: {cosmic.moon_phase}
+- Season: {cosmic.season}
+- Day Energy: {cosmic.day_energy.get('energy', 'balanced energy')} ({cosmic.day_energy.get('planet', 'Cosmic')} Day)
+- Numerological Day: {cosmic.numerology_day}
 
 Personal Energy:
 - Color Connection: {color_name}
-- Life Path Focus: {interests_str}
-
-Critical Instructions:
-1. Respond ENTIRELY in {getLanguageForClaude(language)} language
-2. Structure with these EXACT markers:
-
-[PAST]
-(Detailed interpretation of {cards[0]['name']} - foundations and lessons from the past. 3-4 paragraphs, 150-200 words)
-[/PAST]
-
-[PRESENT]
-(Detailed interpretation of {cards[1]['name']} - current energies and situation. 3-4 paragraphs, 150-200 words)
-[/PRESENT]
-
-[FUTURE]
-(Detailed interpretation of {cards[2]['name']} - path ahead and potential. 3-4 paragraphs, 150-200 words)
-[/FUTURE]
-
-[INTEGRATION]
-(Weaving all three cards into a cohesive narrative. How do these cards tell a complete story? 2-3 paragraphs, 100-150 words)
-[/INTEGRATION]
-
-Maintain a mystical yet practical tone, deeply personalized to {name}'s journey."""
+- Life Path Focus: {interests_str}"""
         
         return prompt
     
     async def _get_cached_three_card_reading(self, nfc_id: str, date: str) -> Optional[Dict]:
         """Get cached three-card reading if exists"""
         try:
-            cache_ref = self.db.collection('three_card_cache').document(f"{nfc_id}_{date}")
-            cache_doc = cache_ref.get()
-            
-            if cache_doc.exists:
-                return cache_doc.to_dict()
-            return None
+            cache_ref = self.repo.document('three_card_cache', f"{nfc_id}_{date}")
+            return with_sections(await self.repo.load(cache_ref))
             
         except Exception as e:
             logger.error(f"Error getting cached reading: {e}")
@@ -487,21 +1072,29 @@ Maintain a mystical yet practical tone, deeply personalized to {name}'s journey.
     async def _cache_three_card_reading(self, nfc_id: str, date: str, reading: Dict):
         """Cache three-card reading"""
         try:
-            cache_ref = self.db.collection('three_card_cache').document(f"{nfc_id}_{date}")
-            cache_ref.set(reading)
+            cache_ref = self.repo.document('three_card_cache', f"{nfc_id}_{date}")
+            await self.repo.set(cache_ref, reading)
             logger.info(f"Three-card reading cached for {nfc_id}")
             
         except Exception as e:
             logger.error(f"Error caching reading: {e}")
     
+    def _build_degraded_three_card_result(self, prepared: Dict) -> Dict:
+        """Quick Past/Present/Future reading of the drawn cards from their keywords"""
+        interpretation = self.degraded_readings.three_card(
+            prepared['name'], prepared['cards'], prepared['cosmic'], prepared['language']
+        )
+        return {**self._build_three_card_result(prepared, interpretation), "degraded": True}
+    
     def _get_fallback_three_card_reading(self) -> Dict:
         """Get fallback three-card reading when API fails"""
-        return {
+        return with_sections({
             "cards": [
                 "/static/images/cards/star.jpg",
                 "/static/images/cards/sun.jpg",
                 "/static/images/cards/world.jpg"
             ],
+            "cardImageSets": [get_card_image_set(name) for name in ("The Star", "The Sun", "The World")],
             "cardNames": ["The Star", "The Sun", "The World"],
             "positions": ["Past", "Present", "Future"],
             "interpretation": """[PAST]
@@ -518,7 +1111,7 @@ Together, these cards tell a story of transformation and achievement.""",
             "moonPhase": "Unknown",
             "season": "Unknown",
             "cached": False
-        }
+        })
     
     async def generate_weekly_reading(self, nfc_id: str) -> Dict:
         """
@@ -527,105 +1120,184 @@ Together, these cards tell a story of transformation and achievement.""",
         try:
             logger.info(f"Generating weekly reading for: {nfc_id}")
             
-            # Import rate limiter
-            from api_v2.services.rate_limiter_service import RateLimiterService
-            rate_limiter = RateLimiterService(self.db)
+            rate_limiter = self.rate_limiter
             
-            # Check rate limit (once per week!)
-            can_generate, error_message = await rate_limiter.check_weekly_limit(nfc_id)
-            
-            if not can_generate:
-                # Return cached reading with rate limit message
-                logger.warning(f"Weekly reading rate limit for {nfc_id}: {error_message}")
-                
-                # Try to get the most recent weekly reading
-                cached = await self._get_latest_weekly_reading(nfc_id)
+            async def generate() -> Dict:
+                # Check rate limit (once per week!)
+                cached = await self._get_rate_limited_weekly_reading(rate_limiter, nfc_id)
                 if cached:
-                    cached['cached'] = True
                     return cached
                 
-                raise ValueError(error_message)
-            
-            # Get user from Firebase
-            user_ref = self.db.collection('nfc_users').document(nfc_id)
-            user_doc = user_ref.get()
-            
-            if not user_doc.exists:
-                raise ValueError(f"User not found: {nfc_id}")
-            
-            user_data = user_doc.to_dict()
-            
-            # Extract user info
-            name = user_data.get('name', 'Seeker')
-            zodiac_sign = user_data.get('zodiacSign', 'Unknown')
-            language = user_data.get('language', 'en')
-            preferences = user_data.get('preferences', {})
-            
-            # Get cosmic context
-            current_date = datetime.now()
-            moon_phase = calculate_moon_phase(current_date)
-            season = get_current_season(current_date)
-            day_energy = get_day_energy(current_date)
-            numerology_day = calculate_numerology_day(current_date)
-            
-            # Select three cards
-            cards = get_random_cards(3)
-            
-            # Build prompt for weekly reading
-            prompt = self._build_weekly_reading_prompt(
-                name=name,
-                zodiac_sign=zodiac_sign,
-                language=language,
-                preferences=preferences,
-                cards=cards,
-                moon_phase=moon_phase,
-                season=season,
-                day_energy=day_energy,
-                numerology_day=numerology_day
-            )
-            
-            logger.info(f"Generating weekly reading for {name}")
-            logger.info(f"Cards: {[card['name'] for card in cards]}")
+                # Get user from Firebase
+                user_data = await self._get_user_data(nfc_id)
+                
+                prepared = self._prepare_weekly_reading(user_data)
+                
+                # Call Claude API (ASYNC!)
+                interpretation = await self._create_interpretation('weekly', prepared['prompt'], max_tokens=2500)
+                
+                result = self._build_weekly_result(prepared, interpretation)
+                
+                # Save weekly reading and mark it taken
+                await self._finish_weekly_reading(rate_limiter, nfc_id, result)
+                
+                logger.info(f"✅ Weekly reading generated for {prepared['name']}")
+                
+                return result
             
-            # Call Claude API (ASYNC!)
-            response = await self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=2500,
-                messages=[{"role": "user", "content": prompt}]
+            today = datetime.now().strftime('%Y-%m-%d')
+            return await self._coalesce(
+                'weekly', nfc_id, today, generate, lambda: self._fetch_latest_weekly_reading(rate_limiter, nfc_id)
             )
             
-            interpretation = response.content[0].text
-            
-            result = {
-                "cards": [get_card_image(card['name']) for card in cards],
-                "cardNames": [card['name'] for card in cards],
-                "positions": ["Week's Challenge", "Week's Opportunity", "Week's Outcome"],
-                "interpretation": interpretation,
-                "moonPhase": moon_phase,
-                "season": season,
-                "dayEnergy": day_energy.get('energy', 'Unknown'),
-                "numerologyDay": numerology_day,
-                "cached": False,
-                "timestamp": datetime.now()
-            }
-            
-            # Save weekly reading
-            await self._save_weekly_reading(nfc_id, result)
-            
-            # Mark weekly reading taken
-            await rate_limiter.mark_weekly_reading_taken(nfc_id)
-            
-            logger.info(f"✅ Weekly reading generated for {name}")
-            
-            return result
-            
         except ValueError as e:
             logger.error(f"Validation error: {e}")
             raise
+        except AdmissionRejected:
+            raise
         except Exception as e:
             logger.error(f"Error generating weekly reading: {e}")
             return self._get_fallback_three_card_reading()
     
+    async def stream_weekly_reading(self, nfc_id: str) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        Stream a weekly reading as (event, data) pairs.
+        Raises ValueError before the first event on rate limit or unknown user.
+        """
+        logger.info(f"Streaming weekly reading for: {nfc_id}")
+        
+        rate_limiter = self.rate_limiter
+        
+        async def produce() -> AsyncIterator[Tuple[str, Dict]]:
+            # Checked inside the generation, so concurrent requests cannot
+            # both pass the limit
+            cached = await self._get_rate_limited_weekly_reading(rate_limiter, nfc_id)
+            if cached:
+                yield 'done', cached
+                return
+            
+            user_data = await self._get_user_data(nfc_id)
+            prepared = self._prepare_weekly_reading(user_data)
+            
+            async with self.llm.admission.slot('weekly'):
+                yield 'meta', {
+                    "cards": [get_card_image(card['name']) for card in prepared['cards']],
+                    "cardImageSets": [get_card_image_set(card['name']) for card in prepared['cards']],
+                    "cardNames": [card['name'] for card in prepared['cards']],
+                    "positions": ["Week's Challenge", "Week's Opportunity", "Week's Outcome"],
+                    **self._cosmic_fields(prepared)
+                }
+            
+                interpretation = None
+                async for event, data in self._stream_interpretation(
+                    'weekly', prepared['prompt'], max_tokens=2500, admitted=True
+                ):
+                    if event == 'complete':
+                        interpretation = data['interpretation']
+                    else:
+                        yield event, data
+            
+            result = self._build_weekly_result(prepared, interpretation)
+            
+            await self._finish_weekly_reading(rate_limiter, nfc_id, result)
+            
+            yield 'done', result
+        
+        today = datetime.now().strftime('%Y-%m-%d')
+        try:
+            async for event in self._stream_coalesced(
+                'weekly', nfc_id, today, produce, lambda: self._fetch_latest_weekly_reading(rate_limiter, nfc_id)
+            ):
+                yield event
+            
+        except (ValueError, AdmissionRejected):
+            raise
+        except Exception as e:
+            logger.error(f"Error streaming weekly reading: {e}")
+            yield 'error', {"message": "Reading generation failed"}
+            yield 'done', self._get_fallback_three_card_reading()
+    
+    async def _fetch_latest_weekly_reading(self, rate_limiter, nfc_id: str) -> Optional[Dict]:
+        """The reading another worker generated, once the limit applies to it"""
+        try:
+            return await self._get_rate_limited_weekly_reading(rate_limiter, nfc_id)
+        except ValueError:
+            return None
+    
+    async def _get_rate_limited_weekly_reading(self, rate_limiter, nfc_id: str) -> Optional[Dict]:
+        """
+        Enforce the once-per-week limit.
+        Returns the latest weekly reading if the user is limited, None if they
+        may generate a new one; raises ValueError if limited with nothing cached.
+        """
+        can_generate, error_message = await rate_limiter.check_weekly_limit(nfc_id)
+        
+        if can_generate:
+            return None
+        
+        # Return cached reading with rate limit message
+        logger.warning(f"Weekly reading rate limit for {nfc_id}: {error_message}")
+        
+        # Try to get the most recent weekly reading
+        cached = await self._get_latest_weekly_reading(nfc_id)
+        if cached:
+            cached['cached'] = True
+            return cached
+        
+        raise ValueError(error_message)
+    
+    def _prepare_weekly_reading(self, user_data: Dict) -> Dict:
+        """Draw three cards and build the weekly reading prompt"""
+        # Extract user info
+        name = user_data.get('name', 'Seeker')
+        zodiac_sign = user_data.get('zodiacSign', 'Unknown')
+        language = user_data.get('language', 'en')
+        preferences = user_data.get('preferences', {})
+        
+        # Get cosmic context
+        cosmic = self._get_cosmic_context()
+        
+        # Select three cards
+        cards = self._draw_cards(3, 'weekly', user_data.get('nfc_id'))
+        
+        # Build prompt for weekly reading
+        prompt = self._build_weekly_reading_prompt(
+            name=name,
+            zodiac_sign=zodiac_sign,
+            language=language,
+            preferences=preferences,
+            cards=cards,
+            cosmic=cosmic
+        )
+        
+        logger.info(f"Generating weekly reading for {name}")
+        logger.info(f"Cards: {[card['name'] for card in cards]}")
+        
+        return {"name": name, "language": language, "cards": cards, "prompt": prompt, "cosmic": cosmic}
+    
+    def _build_weekly_result(self, prepared: Dict, interpretation: str) -> Dict:
+        """Assemble the weekly reading response"""
+        cards = prepared['cards']
+        return {
+            "cards": [get_card_image(card['name']) for card in cards],
+            "cardImageSets": [get_card_image_set(card['name']) for card in cards],
+            "cardNames": [card['name'] for card in cards],
+            "positions": ["Week's Challenge", "Week's Opportunity", "Week's Outcome"],
+            "interpretation": interpretation,
+            "sections": parse_sections(interpretation),
+            **self._cosmic_fields(prepared),
+            "cached": False,
+            "timestamp": datetime.now()
+        }
+    
+    async def _finish_weekly_reading(self, rate_limiter, nfc_id: str, result: Dict):
+        """Save a freshly generated weekly reading and start the weekly cooldown"""
+        # Save weekly reading
+        await self._save_weekly_reading(nfc_id, result)
+        
+        # Mark weekly reading taken
+        await rate_limiter.mark_weekly_reading_taken(nfc_id)
+    
     def _build_weekly_reading_prompt(
         self,
         name: str,
@@ -633,10 +1305,7 @@ Together, these cards tell a story of transformation and achievement.""",
         language: str,
         preferences: Dict,
         cards: List[Dict],
-        moon_phase: str,
-        season: str,
-        day_energy: Dict,
-        numerology_day: int
+        cosmic: CosmicContext
     ) -> str:
         """Build prompt for weekly reading"""
         
@@ -651,57 +1320,36 @@ Together, these cards tell a story of transformation and achievement.""",
         interests = preferences.get('interests', ['spiritual growth'])
         interests_str = ', '.join(interests) if interests else 'spiritual growth'
         
-        prompt = f"""Create a deeply personalized weekly tarot reading for {name}, 
-a {zodiac_sign} born under this week's {moon_phase} moon in {season}.
+        # Reading instructions live in the cached system prompt
+        prompt = f"""Reading type: WEEKLY READING
+Language: {getLanguageForClaude(language)}
 
-This is a WEEKLY reading focusing on the week ahead.
+Create a deeply personalized weekly tarot reading for {name}, 
+a {zodiac_sign} born under this week's {cosmic.moon_phase} moon in {cosmic.season}.
 
 Cards Drawn:
 {chr(10).join(cards_info)}
 
 Cosmic Timing This Week:
-- Moon Phase: {moon_phase}
-- Season: {season}
-- Today's Energy: {day_energy.get('energy', 'balanced energy')} ({day_energy.get('planet', 'Cosmic')} Day)
-- Numerological Day: {numerology_day}
+- Moon Phase: {cosmic.moon_phase}
+- Season: {cosmic.season}
+- Today's Energy: {cosmic.day_energy.get('energy', 'balanced energy')} ({cosmic.day_energy.get('planet', 'Cosmic')} Day)
+- Numerological Day: {cosmic.numerology_day}
 
 Personal Energy:
 - Color Connection: {color_name}
-- Life Path Focus: {interests_str}
-
-Critical Instructions:
-1. Respond ENTIRELY in {getLanguageForClaude(language)} language
-2. This is a WEEKLY forecast - focus on the 7 days ahead
-3. Structure with these EXACT markers:
-
-[WEEKLY_CHALLENGE]
-(Interpretation of {cards[0]['name']} - the main challenge or lesson this week)
-[/WEEKLY_CHALLENGE]
-
-[WEEKLY_OPPORTUNITY]
-(Interpretation of {cards[1]['name']} - the opportunity or gift available this week)
-[/WEEKLY_OPPORTUNITY]
-
-[WEEKLY_OUTCOME]
-(Interpretation of {cards[2]['name']} - the likely outcome if you navigate the week wisely)
-[/WEEKLY_OUTCOME]
-
-[WEEKLY_GUIDANCE]
-(Practical advice for navigating this week successfully, weaving in their {zodiac_sign} strengths and {interests_str} interests)
-[/WEEKLY_GUIDANCE]
-
-Maintain a mystical yet practical tone, focusing on actionable weekly guidance."""
+- Life Path Focus: {interests_str}"""
         
         return prompt
     
     async def _save_weekly_reading(self, nfc_id: str, reading_data: Dict):
         """Save weekly reading to Firebase"""
         try:
-            user_ref = self.db.collection('nfc_users').document(nfc_id)
+            user_ref = self.repo.document('nfc_users', nfc_id)
             
             # Save to weekly_readings subcollection
             weekly_ref = user_ref.collection('weekly_readings').document()
-            weekly_ref.set(reading_data)
+            await self.repo.set(weekly_ref, reading_data)
             
             logger.info(f"Weekly reading saved for {nfc_id}")
             
@@ -711,16 +1359,14 @@ Maintain a mystical yet practical tone, focusing on actionable weekly guidance."
     async def _get_latest_weekly_reading(self, nfc_id: str) -> Optional[Dict]:
         """Get the most recent weekly reading"""
         try:
-            user_ref = self.db.collection('nfc_users').document(nfc_id)
-            weekly_readings = user_ref.collection('weekly_readings')\
-                .order_by('timestamp', direction='DESCENDING')\
-                .limit(1)\
-                .get()
-            
-            for reading in weekly_readings:
-                return reading.to_dict()
+            user_ref = self.repo.document('nfc_users', nfc_id)
+            weekly_readings = await self.repo.query(
+                user_ref.collection('weekly_readings')
+                .order_by('timestamp', direction='DESCENDING')
+                .limit(1)
+            )
             
-            return None
+            return with_sections(weekly_readings[0]) if weekly_readings else None
             
         except Exception as e:
             logger.error(f"Error getting latest weekly reading: {e}")
@@ -13,8 +13,9 @@ logger = logging.getLogger(__name__)
 class RegistrationService:
     """Service for handling user registration"""
     
-    def __init__(self, database):
-        self.db = database
+    def __init__(self, repository, profile_cache):
+        self.repo = repository
+        self.profiles = profile_cache
     
     async def validate_poster_code(self, poster_code: str) -> Tuple[bool, str, Dict]:
         """
@@ -23,8 +24,8 @@ class RegistrationService:
         """
         try:
             # Check if poster exists
-            poster_ref = self.db.collection('valid_posters').document(poster_code)
-            poster = poster_ref.get()
+            poster_ref = self.repo.document('valid_posters', poster_code)
+            poster = await self.repo.get(poster_ref)
             
             if not poster.exists:
                 return False, "Invalid poster code", {}
@@ -80,12 +81,13 @@ class RegistrationService:
             }
             
             # Save to Firestore - nfc_users collection
-            user_ref = self.db.collection('nfc_users').document(nfc_id)
-            user_ref.set(user_document)
+            user_ref = self.repo.document('nfc_users', nfc_id)
+            await self.repo.set(user_ref, user_document)
+            self.profiles.invalidate(nfc_id)
             
             # Update poster as registered
-            poster_ref = self.db.collection('valid_posters').document(request.posterCode)
-            poster_ref.update({
+            poster_ref = self.repo.document('valid_posters', request.posterCode)
+            await self.repo.update(poster_ref, {
                 'is_registered': True,
                 'registered_at': datetime.now(),
                 'nfc_id': nfc_id,
@@ -111,13 +113,12 @@ class RegistrationService:
     async def get_user(self, nfc_id: str) -> Dict:
         """Get user data by NFC ID"""
         try:
-            user_ref = self.db.collection('nfc_users').document(nfc_id)
-            user = user_ref.get()
+            user = await self.profiles.get(nfc_id)
             
-            if not user.exists:
+            if user is None:
                 raise ValueError("User not found")
             
-            return user.to_dict()
+            return user
             
         except Exception as e:
             logger.error(f"Error getting user: {e}")
@@ -126,10 +127,10 @@ class RegistrationService:
     async def update_user_preferences(self, nfc_id: str, updates: Dict) -> Dict:
         """Update user preferences"""
         try:
-            user_ref = self.db.collection('nfc_users').document(nfc_id)
+            user_ref = self.repo.document('nfc_users', nfc_id)
             
             # Verify user exists
-            if not user_ref.get().exists:
+            if await self.profiles.get(nfc_id) is None:
                 raise ValueError("User not found")
             
             # Structure update data
@@ -152,7 +153,8 @@ class RegistrationService:
                 update_data['user_data']['preferences.color'] = updates['color']
             
             # Update in Firestore
-            user_ref.update(update_data)
+            await self.repo.update(user_ref, update_data)
+            self.profiles.invalidate(nfc_id)
             
             logger.info(f"User preferences updated: {nfc_id}")
             
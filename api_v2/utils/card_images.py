@@ -0,0 +1,71 @@
+"""
+Responsive card images.
+
+`python -m api_v2.jobs.build_card_images` (run at deploy) turns each card JPEG
+into several widths of AVIF/WebP with content-hashed names plus a tiny blurred
+placeholder, and records them in static/images/cards/build/manifest.json.
+Reading responses carry a descriptor built from that manifest so the client
+can pick the smallest variant; without a manifest it falls back to the JPEG.
+"""
+import json
+import logging
+import os
+import re
+from functools import lru_cache
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CARDS_DIR = os.path.join(PROJECT_ROOT, 'static', 'images', 'cards')
+BUILD_DIR = os.path.join(CARDS_DIR, 'build')
+MANIFEST_PATH = os.path.join(BUILD_DIR, 'manifest.json')
+CARDS_URL = '/static/images/cards'
+
+# Rendered card width: ~60% of a phone screen, never wider than 320px
+CARD_SIZES = '(max-width: 600px) 60vw, 320px'
+
+# name.<10 hex>.<width>.<ext> - the name changes whenever the content does
+HASHED_ASSET = re.compile(r'\.[0-9a-f]{10}\.\d+\.(avif|webp)$')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+@lru_cache(maxsize=None)
+def load_manifest(path: str = MANIFEST_PATH) -> Dict[str, Dict]:
+    """{source filename: {width, height, placeholder, variants: {mime: [[width, file]]}}}"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        logger.info(f"Loaded image manifest for {len(manifest)} cards")
+        return manifest
+    except (OSError, ValueError) as e:
+        logger.warning(f"No card image manifest ({e}) - serving original JPEGs")
+        return {}
+
+
+def card_image_set(filename: str) -> Dict:
+    """<picture>-ready descriptor for a card image file (e.g. 'star.jpg')"""
+    image_set = {"src": f"{CARDS_URL}/{filename}"}
+    entry = load_manifest().get(filename)
+    if not entry:
+        return image_set
+
+    image_set.update({
+        "width": entry['width'],
+        "height": entry['height'],
+        "placeholder": entry['placeholder'],
+        "sizes": CARD_SIZES,
+        "sources": [
+            {
+                "type": mime,
+                "srcset": ', '.join(f"{CARDS_URL}/build/{file} {width}w" for width, file in variants)
+            }
+            for mime, variants in entry['variants'].items()
+        ]
+    })
+    return image_set
+
+
+def is_immutable_asset(path: str) -> bool:
+    """Content-hashed build outputs can be cached forever"""
+    return bool(HASHED_ASSET.search(path))
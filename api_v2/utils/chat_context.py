@@ -0,0 +1,69 @@
+"""
+Chat context window - fit a conversation into a per-turn input-token budget.
+
+Messages are addressed by their absolute position in the conversation. The
+session stores a rolling summary of messages [0, summarized_count); the rest
+are sent verbatim, newest first, until the budget is spent. Messages older
+than the last few turns are handed back for folding into the summary.
+"""
+from typing import Dict, List
+
+# Per-message overhead (role, separators) in tokens
+MESSAGE_OVERHEAD = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap token estimate without a tokenizer round trip.
+    ~4 characters per token for Latin text; Georgian, Cyrillic and CJK
+    characters are counted as one token each so those budgets stay safe.
+    """
+    if not text:
+        return 0
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return (len(text) - non_ascii) // 4 + non_ascii + 1
+
+
+def message_tokens(message: Dict) -> int:
+    """Estimated tokens of one chat message"""
+    return estimate_tokens(message.get('content', '')) + MESSAGE_OVERHEAD
+
+
+def fit_context(
+    history: List[Dict],
+    base_index: int,
+    summarized_count: int,
+    fixed_tokens: int,
+    budget: int,
+    verbatim_messages: int
+) -> Dict:
+    """
+    Choose which prior messages to send this turn.
+
+    history: prior messages, oldest first; history[i] is message base_index + i
+    fixed_tokens: system prompt + summary + current message
+    Returns the messages to send, the older messages to fold into the summary
+    (fold/fold_until) and token estimates for metrics.
+    """
+    unsummarized = history[max(summarized_count - base_index, 0):]
+
+    # Newest first, stop at the first message that no longer fits
+    used = fixed_tokens
+    kept = 0
+    for message in reversed(unsummarized):
+        cost = message_tokens(message)
+        if used + cost > budget:
+            break
+        used += cost
+        kept += 1
+
+    # Everything before the last verbatim_messages goes into the summary
+    verbatim_start = max(len(unsummarized) - verbatim_messages, 0)
+
+    return {
+        'messages': unsummarized[len(unsummarized) - kept:],
+        'fold': unsummarized[:verbatim_start],
+        'fold_until': base_index + len(history) - len(unsummarized) + verbatim_start,
+        'estimated_tokens': used,
+        'full_tokens': fixed_tokens + sum(message_tokens(m) for m in history)
+    }
@@ -1,153 +1,212 @@
 """
 Cosmic utilities - moon phase, seasons, numerology
 Pure Python version (no external dependencies needed)
+
+Everything here depends only on the calendar day, so readings (and the
+pre-generation job) use a CosmicContext computed once per day
+(get_cosmic_context).
 """
-from datetime import datetime
-import math
+from bisect import bisect_right
+from datetime import date as Date, datetime, tzinfo
+import threading
+from typing import Dict, Optional, Union
 
+MOON_PHASES = (
+    "New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
+    "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent"
+)
+SEASONS = ("Winter", "Spring", "Summer", "Autumn")
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
 
-def calculate_moon_phase(date=None):
-    """Calculate current moon phase - Pure Python implementation"""
-    if date is None:
-        date = datetime.now()
-    
-    # Calculate moon phase using astronomical formula
-    year = date.year
-    month = date.month
-    day = date.day
-    
+DAY_ENERGIES = {
+    'Monday': {
+        'planet': 'Moon',
+        'energy': 'intuition, emotions, and inner wisdom',
+        'focus': 'emotional healing and intuitive development'
+    },
+    'Tuesday': {
+        'planet': 'Mars',
+        'energy': 'action, courage, and determination',
+        'focus': 'initiative and breaking through obstacles'
+    },
+    'Wednesday': {
+        'planet': 'Mercury',
+        'energy': 'communication, intellect, and adaptability',
+        'focus': 'learning, writing, and social connections'
+    },
+    'Thursday': {
+        'planet': 'Jupiter',
+        'energy': 'growth, abundance, and wisdom',
+        'focus': 'expansion and spiritual development'
+    },
+    'Friday': {
+        'planet': 'Venus',
+        'energy': 'love, beauty, and harmony',
+        'focus': 'relationships and creative expression'
+    },
+    'Saturday': {
+        'planet': 'Saturn',
+        'energy': 'structure, discipline, and manifestation',
+        'focus': 'organization and long-term planning'
+    },
+    'Sunday': {
+        'planet': 'Sun',
+        'energy': 'vitality, confidence, and success',
+        'focus': 'personal power and achievement'
+    }
+}
+
+SYNODIC_MONTH = 29.53
+KNOWN_NEW_MOON_JD = 2451549.5
+# Illuminated-percentage thresholds between consecutive MOON_PHASES
+MOON_PHASE_BOUNDS = (6.25, 18.75, 31.25, 43.75, 56.25, 68.75, 81.25)
+
+
+def julian_day(date) -> float:
+    """Julian day at 00:00 of the date's calendar day"""
+    year, month, day = date.year, date.month, date.day
     if month < 3:
         year -= 1
         month += 12
-    
-    # Calculate Julian day
     a = year // 100
     b = a // 4
     c = 2 - a + b
     e = int(365.25 * (year + 4716))
     f = int(30.6001 * (month + 1))
-    jd = c + day + e + f - 1524.5
-    
-    # Days since known new moon
-    days_since_new = jd - 2451549.5
-    new_moons = days_since_new / 29.53
-    
-    # Get phase (0-1)
-    phase = new_moons - int(new_moons)
-    
-    # Convert to percentage
-    illuminated = phase * 100
-    
-    # Determine moon phase name
-    if illuminated < 6.25:
-        return "New Moon"
-    elif illuminated < 18.75:
-        return "Waxing Crescent"
-    elif illuminated < 31.25:
-        return "First Quarter"
-    elif illuminated < 43.75:
-        return "Waxing Gibbous"
-    elif illuminated < 56.25:
-        return "Full Moon"
-    elif illuminated < 68.75:
-        return "Waning Gibbous"
-    elif illuminated < 81.25:
-        return "Last Quarter"
-    else:
-        return "Waning Crescent"
+    return c + day + e + f - 1524.5
+
+
+def moon_phase_index(jd: float) -> int:
+    """Index into MOON_PHASES for a Julian day"""
+    new_moons = (jd - KNOWN_NEW_MOON_JD) / SYNODIC_MONTH
+    illuminated = (new_moons - int(new_moons)) * 100
+    return bisect_right(MOON_PHASE_BOUNDS, illuminated)
+
+
+def season_index(day_of_year: int) -> int:
+    """Index into SEASONS (northern hemisphere)"""
+    if 80 <= day_of_year < 172:  # March 21 to June 20
+        return 1
+    if 172 <= day_of_year < 264:  # June 21 to September 21
+        return 2
+    if 264 <= day_of_year < 355:  # September 22 to December 20
+        return 3
+    return 0  # December 21 to March 20
+
+
+def numerology_number(date) -> int:
+    """Digit sum of YYYYMMDD reduced to one digit (the digital root)
+
+    Same as the legacy backend's numerologyDay. Master days (11, 22, 33) only
+    matter to the numerology insight, which uses numerology.date_number.
+    """
+    return 1 + (date.year * 10000 + date.month * 100 + date.day - 1) % 9
+
+
+def calculate_moon_phase(date=None):
+    """Calculate current moon phase - Pure Python implementation"""
+    if date is None:
+        date = datetime.now()
+    return MOON_PHASES[moon_phase_index(julian_day(date))]
 
 
 def get_current_season(date=None):
     """Get current season based on date"""
     if date is None:
         date = datetime.now()
-
-    # Get day of year
-    doy = date.timetuple().tm_yday
-    
-    # Northern hemisphere seasons
-    if doy >= 80 and doy < 172:  # March 21 to June 20
-        return "Spring"
-    elif doy >= 172 and doy < 264:  # June 21 to September 21
-        return "Summer"
-    elif doy >= 264 and doy < 355:  # September 22 to December 20
-        return "Autumn"
-    else:  # December 21 to March 20
-        return "Winter"
+    return SEASONS[season_index(date.timetuple().tm_yday)]
 
 
 def get_day_energy(date=None):
-    """Get cosmic energy for the day"""
+    """Get cosmic energy for the day (shared dict - don't mutate)"""
     if date is None:
         date = datetime.now()
-        
-    weekday = date.strftime('%A')
-    day_energies = {
-        'Monday': {
-            'planet': 'Moon',
-            'energy': 'intuition, emotions, and inner wisdom',
-            'focus': 'emotional healing and intuitive development'
-        },
-        'Tuesday': {
-            'planet': 'Mars',
-            'energy': 'action, courage, and determination',
-            'focus': 'initiative and breaking through obstacles'
-        },
-        'Wednesday': {
-            'planet': 'Mercury',
-            'energy': 'communication, intellect, and adaptability',
-            'focus': 'learning, writing, and social connections'
-        },
-        'Thursday': {
-            'planet': 'Jupiter',
-            'energy': 'growth, abundance, and wisdom',
-            'focus': 'expansion and spiritual development'
-        },
-        'Friday': {
-            'planet': 'Venus',
-            'energy': 'love, beauty, and harmony',
-            'focus': 'relationships and creative expression'
-        },
-        'Saturday': {
-            'planet': 'Saturn',
-            'energy': 'structure, discipline, and manifestation',
-            'focus': 'organization and long-term planning'
-        },
-        'Sunday': {
-            'planet': 'Sun',
-            'energy': 'vitality, confidence, and success',
-            'focus': 'personal power and achievement'
-        }
-    }
-    return day_energies.get(weekday, {})
+    return DAY_ENERGIES[WEEKDAYS[date.weekday()]]
 
 
 def calculate_numerology_day(date=None):
     """Calculate numerology day number"""
     if date is None:
         date = datetime.now()
-        
-    # Add all numbers in date
-    day_num = sum(int(digit) for digit in date.strftime('%Y%m%d'))
-    
-    # Reduce to single digit
-    while day_num > 9:
-        day_num = sum(int(digit) for digit in str(day_num))
-        
-    return day_num
+    return numerology_number(date)
+
+
+class CosmicContext:
+    """Date-derived reading context for one calendar day (immutable)"""
+
+    __slots__ = ('date', 'moon_phase', 'season', 'day_energy', 'numerology_day')
+
+    def __init__(self, date: Date, moon_phase: str, season: str, day_energy: Dict, numerology_day: int):
+        for name, value in zip(self.__slots__, (date, moon_phase, season, day_energy, numerology_day)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CosmicContext is immutable")
+
+    @classmethod
+    def for_date(cls, date: Date) -> 'CosmicContext':
+        return cls(
+            date,
+            calculate_moon_phase(date),
+            get_current_season(date),
+            get_day_energy(date),
+            calculate_numerology_day(date)
+        )
+
+    def response_fields(self) -> Dict:
+        """Cosmic context in response (camelCase) form"""
+        return {
+            "moonPhase": self.moon_phase,
+            "season": self.season,
+            "dayEnergy": self.day_energy.get('energy', 'Unknown'),
+            "numerologyDay": self.numerology_day
+        }
+
+    def __repr__(self):
+        return f"CosmicContext({self.date}, {self.moon_phase}, {self.season}, numerology {self.numerology_day})"
+
+
+# Memoised contexts by calendar day; the oldest days are evicted first
+COSMIC_CONTEXT_DAYS = 8
+_contexts: Dict[Date, CosmicContext] = {}
+_contexts_lock = threading.Lock()
+
+
+def get_cosmic_context(when: Optional[Union[datetime, Date]] = None, tz: Optional[tzinfo] = None) -> CosmicContext:
+    """
+    CosmicContext for the calendar day of `when` (default: now) in `tz`
+    (default: server local time). Computed once per day and shared.
+    """
+    if when is None:
+        when = datetime.now(tz)
+    elif tz is not None and isinstance(when, datetime) and when.tzinfo is not None:
+        when = when.astimezone(tz)
+    day = when.date() if isinstance(when, datetime) else when
+
+    context = _contexts.get(day)
+    if context is None:
+        context = CosmicContext.for_date(day)
+        with _contexts_lock:
+            _contexts[day] = context
+            for old in sorted(_contexts)[:max(len(_contexts) - COSMIC_CONTEXT_DAYS, 0)]:
+                del _contexts[old]
+    return context
+
+
+# ISO language code -> Claude-friendly language name
+LANGUAGE_NAMES = {
+    'ka': 'Georgian',
+    'ru': 'Russian',
+    'es': 'Spanish',
+    'fr': 'French',
+    'de': 'German',
+    'zh': 'Chinese',
+    'ja': 'Japanese',
+    'ko': 'Korean',
+    'en': 'English'
+}
 
 
 def getLanguageForClaude(iso_code):
     """Convert ISO language code to Claude-friendly language name"""
-    language_map = {
-        'ka': 'Georgian',
-        'ru': 'Russian',
-        'es': 'Spanish',
-        'fr': 'French',
-        'de': 'German',
-        'zh': 'Chinese',
-        'ja': 'Japanese',
-        'ko': 'Korean',
-        'en': 'English'
-    }
-    return language_map.get(iso_code, 'English')
\ No newline at end of file
+    return LANGUAGE_NAMES.get(iso_code, 'English')
\ No newline at end of file
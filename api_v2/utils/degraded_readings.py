@@ -0,0 +1,157 @@
+"""
+Quick-reading catalog - the keyword readings served when Claude misses the
+latency SLO.
+
+Sentence templates and translated terms (card keywords, moon phases,
+seasons) per language live in data/degraded_readings.json, translated
+offline by `python -m api_v2.jobs.generate_degraded_catalog`. English sources
+live here. A language with no entry gets no quick reading: its request waits
+for the full one instead of getting English text. Placeholders: {name},
+{card_name}, {keywords}, {first_keyword}, {second_keyword}, {moon_phase},
+{season}, {past}, {present}, {future}, {past_keyword}, {future_keyword},
+{items}, {last}.
+"""
+import json
+import logging
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from api_v2.utils.cosmic_utils import MOON_PHASES, SEASONS
+from api_v2.utils.numerology import render
+from api_v2.utils.tarot_cards import MAJOR_ARCANA
+
+logger = logging.getLogger(__name__)
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'degraded_readings.json')
+
+# Source templates the catalog is translated from
+DEGRADED_TEMPLATES = {
+    'card_reading': (
+        "{card_name} comes to you today, {name}, carrying {keywords}. With the moon in its "
+        "{moon_phase} phase this {season}, let its message guide your choices."
+    ),
+    'affirmation': "I welcome {first_keyword} and {second_keyword} into my day.",
+    'past': "{card_name} shows the foundations you are building on: {keywords}.",
+    'present': "{card_name} speaks to where you stand now, {name}: {keywords}.",
+    'future': "{card_name} points to the path ahead: {keywords}.",
+    'integration': (
+        "From {past} through {present} to {future}, the {moon_phase} energy invites you "
+        "to carry {past_keyword} forward into {future_keyword}."
+    ),
+    # Joins "a, b" and "c" into a keyword list
+    'list': "{items} and {last}"
+}
+
+PLACEHOLDER = re.compile(r'\{[a-z_]+\}')
+
+
+def keywords(card: Dict) -> List[str]:
+    """The three keywords a quick reading uses, in source (English) form"""
+    return [keyword.lower() for keyword in card['keywords'][:3]]
+
+
+def source_terms() -> Dict[str, str]:
+    """Every English term a quick reading can contain"""
+    terms = [keyword for card in MAJOR_ARCANA for keyword in keywords(card)]
+    terms += list(MOON_PHASES) + list(SEASONS)
+    return {term: term for term in terms}
+
+
+def source_catalog() -> Dict:
+    """The English entry, in catalog form"""
+    return {'templates': dict(DEGRADED_TEMPLATES), 'terms': source_terms()}
+
+
+def load_catalog(path: str = CATALOG_PATH) -> Dict[str, Dict]:
+    """Load {language: {'templates': ..., 'terms': ...}}; English only if the file is missing"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            catalog = json.load(f)
+        logger.info(f"Loaded quick readings for {len(catalog)} languages")
+        return catalog
+    except (OSError, ValueError) as e:
+        logger.error(f"Error loading quick-reading catalog {path}: {e}")
+        return {'en': source_catalog()}
+
+
+def has_placeholders(template: str, name: str) -> bool:
+    """A translated template must keep the placeholders its source has"""
+    return set(PLACEHOLDER.findall(DEGRADED_TEMPLATES[name])) <= set(PLACEHOLDER.findall(template))
+
+
+class DegradedReadings:
+    """Keyword readings of the drawn cards in the seeker's language"""
+
+    def __init__(self, catalog: Optional[Dict[str, Dict]] = None):
+        self.catalog = catalog if catalog is not None else load_catalog()
+
+    def has(self, language: str) -> bool:
+        """Whether language has every template (a quick reading can be served)"""
+        templates = self.catalog.get(language, {}).get('templates', {})
+        return all(templates.get(name) for name in DEGRADED_TEMPLATES)
+
+    def _template(self, language: str, name: str) -> str:
+        return self.catalog[language]['templates'][name]
+
+    def _term(self, language: str, term: str) -> str:
+        # Terms missing from a translation stay in English
+        return self.catalog[language].get('terms', {}).get(term) or term
+
+    def _keywords(self, card: Dict, language: str) -> List[str]:
+        return [self._term(language, keyword) for keyword in keywords(card)]
+
+    def _list(self, items: List[str], language: str) -> str:
+        return render(self._template(language, 'list'), {'items': ', '.join(items[:-1]), 'last': items[-1]})
+
+    def daily(self, name: str, card: Dict, cosmic, language: str) -> Optional[str]:
+        """CARD_READING and DAILY_AFFIRMATION sections, or None without templates"""
+        if not self.has(language):
+            return None
+        words = self._keywords(card, language)
+        values = {
+            'name': name,
+            'card_name': card['name'],
+            'keywords': self._list(words, language),
+            'first_keyword': words[0],
+            'second_keyword': words[1],
+            'moon_phase': self._term(language, cosmic.moon_phase),
+            'season': self._term(language, cosmic.season)
+        }
+        return f"""[CARD_READING]
+{render(self._template(language, 'card_reading'), values)}
+[/CARD_READING]
+
+[DAILY_AFFIRMATION]
+{render(self._template(language, 'affirmation'), values)}
+[/DAILY_AFFIRMATION]"""
+
+    def three_card(self, name: str, cards: List[Dict], cosmic, language: str) -> Optional[str]:
+        """PAST, PRESENT, FUTURE and INTEGRATION sections, or None without templates"""
+        if not self.has(language):
+            return None
+        past, present, future = cards
+        sections = []
+        for position, card in (('past', past), ('present', present), ('future', future)):
+            text = render(self._template(language, position), {
+                'name': name,
+                'card_name': card['name'],
+                'keywords': self._list(self._keywords(card, language), language)
+            })
+            sections.append((position.upper(), text))
+        sections.append(('INTEGRATION', render(self._template(language, 'integration'), {
+            'past': past['name'],
+            'present': present['name'],
+            'future': future['name'],
+            'moon_phase': self._term(language, cosmic.moon_phase),
+            'past_keyword': self._keywords(past, language)[0],
+            'future_keyword': self._keywords(future, language)[0]
+        })))
+        return '\n\n'.join(f"[{section}]\n{text}\n[/{section}]" for section, text in sections)
+
+
+@lru_cache()
+def get_degraded_readings() -> DegradedReadings:
+    """The process-wide quick-reading catalog, loaded once"""
+    return DegradedReadings()
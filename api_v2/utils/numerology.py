@@ -0,0 +1,244 @@
+"""
+Local numerology engine - digit reduction, master numbers and the daily
+NUMEROLOGY_INSIGHT section, with no Claude call.
+
+A seeker's personal numbers (favourite, lucky, guidance) are reduced and
+summed into a core number, which is read against the day's number: the same
+number ('aligned'), the same family of 1-5-7 / 2-4-8 / 3-6-9 ('harmonious')
+or neither ('contrasting'). 11, 22 and 33 are kept as master numbers.
+
+The insight is rendered from a table of number meanings and sentence
+templates per language in data/numerology_insights.json, translated offline
+by `python -m api_v2.jobs.generate_numerology_catalog`. English sources live
+here. Placeholders: {numbers}, {core}, {core_keyword}, {day}, {day_keyword},
+{master}.
+"""
+import json
+import logging
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'numerology_insights.json')
+
+MASTER_NUMBERS = (11, 22, 33)
+
+NUMBER_KEYS = ('favoriteNumber', 'luckyNumber', 'guidanceNumber')
+
+# Numbers that share a family support each other
+HARMONY_GROUPS = ((1, 5, 7), (2, 4, 8), (3, 6, 9))
+
+# Source meanings the catalog is translated from
+NUMBER_MEANINGS = {
+    1: {
+        'keyword': "new beginnings and independence",
+        'advice': "Take the first step on something that matters to you."
+    },
+    2: {
+        'keyword': "partnership and balance",
+        'advice': "Listen closely and let cooperation do the work."
+    },
+    3: {
+        'keyword': "creativity and expression",
+        'advice': "Share your ideas and let joy lead the way."
+    },
+    4: {
+        'keyword': "stability and steady work",
+        'advice': "Build patiently - small, solid steps count today."
+    },
+    5: {
+        'keyword': "change and freedom",
+        'advice': "Stay flexible and welcome the unexpected."
+    },
+    6: {
+        'keyword': "love, care and responsibility",
+        'advice': "Tend to the people and places that nourish you."
+    },
+    7: {
+        'keyword': "reflection and inner wisdom",
+        'advice': "Make space for quiet and trust your intuition."
+    },
+    8: {
+        'keyword': "power and abundance",
+        'advice': "Step into your authority and handle practical matters with confidence."
+    },
+    9: {
+        'keyword': "completion and compassion",
+        'advice': "Let go of what is finished and offer kindness freely."
+    },
+    11: {
+        'keyword': "intuition and spiritual insight",
+        'advice': "Pay attention to hunches and meaningful coincidences."
+    },
+    22: {
+        'keyword': "the master builder's vision",
+        'advice': "Turn a big dream into a concrete plan."
+    },
+    33: {
+        'keyword': "the master teacher's compassion",
+        'advice': "Lead by example and let your kindness teach."
+    }
+}
+
+INSIGHT_TEMPLATES = {
+    'pair': "Your numbers {numbers} come together as {core} ({core_keyword}), meeting today's {day} ({day_keyword}).",
+    'day': "Today vibrates with the number {day} ({day_keyword}).",
+    'aligned': "Your core number matches the day, so its energy is fully on your side.",
+    'harmonious': "{core} and {day} are natural allies, so the day supports your own rhythm.",
+    'contrasting': "{core} and {day} pull in different directions - honour your own rhythm while meeting the day's.",
+    'master': "{master} is a master number, so its lessons arrive with heightened intensity."
+}
+
+PLACEHOLDERS = ('{numbers}', '{core}', '{core_keyword}', '{day}', '{day_keyword}', '{master}')
+
+
+def reduce_number(n: int) -> int:
+    """Sum digits until one digit or a master number remains"""
+    while n > 9 and n not in MASTER_NUMBERS:
+        n = sum(int(digit) for digit in str(n))
+    return n
+
+
+def root_number(n: int) -> int:
+    """Single-digit root (master numbers fall to 2, 4 and 6)"""
+    return 1 + (n - 1) % 9
+
+
+def date_number(date) -> int:
+    """Digit sum of YYYYMMDD, reduced keeping master days"""
+    return reduce_number(sum(int(digit) for digit in date.strftime('%Y%m%d')))
+
+
+def parse_number(value) -> Optional[int]:
+    """A personal number as entered at registration ("7", " 12 ", 3), or None"""
+    try:
+        number = int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+def personal_numbers(numbers: Optional[Dict]) -> List[int]:
+    """The seeker's valid numbers in NUMBER_KEYS order"""
+    numbers = numbers or {}
+    parsed = (parse_number(numbers.get(key)) for key in NUMBER_KEYS)
+    return [number for number in parsed if number is not None]
+
+
+def core_number(numbers: List[int]) -> Optional[int]:
+    """Reduced sum of the reduced personal numbers"""
+    if not numbers:
+        return None
+    return reduce_number(sum(reduce_number(number) for number in numbers))
+
+
+def relation(core: int, day: int) -> str:
+    """How a core number meets the day's number"""
+    if core == day:
+        return 'aligned'
+    for group in HARMONY_GROUPS:
+        if root_number(core) in group and root_number(day) in group:
+            return 'harmonious'
+    return 'contrasting'
+
+
+def source_catalog() -> Dict:
+    """The English entry, in catalog form"""
+    return {
+        'templates': dict(INSIGHT_TEMPLATES),
+        'numbers': {str(number): dict(meaning) for number, meaning in NUMBER_MEANINGS.items()}
+    }
+
+
+def load_catalog(path: str = CATALOG_PATH) -> Dict[str, Dict]:
+    """Load {language: {'templates': ..., 'numbers': ...}}; English only if the file is missing"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            catalog = json.load(f)
+        logger.info(f"Loaded numerology insights for {len(catalog)} languages")
+        return catalog
+    except (OSError, ValueError) as e:
+        logger.error(f"Error loading numerology catalog {path}: {e}")
+        return {'en': source_catalog()}
+
+
+def has_placeholders(template: str, name: str) -> bool:
+    """A translated template must keep the placeholders its source has"""
+    return all(p in template for p in PLACEHOLDERS if p in INSIGHT_TEMPLATES[name])
+
+
+def render(template: str, values: Dict[str, str]) -> str:
+    """Fill in a template (plain replace, like the welcome messages)"""
+    for name, value in values.items():
+        template = template.replace('{' + name + '}', value)
+    return template
+
+
+class NumerologyEngine:
+    """Deterministic numerology for daily readings"""
+
+    def __init__(self, catalog: Optional[Dict[str, Dict]] = None):
+        self.catalog = catalog if catalog is not None else load_catalog()
+        self.source = source_catalog()
+
+    def _entry(self, language: str, part: str, key: str) -> Dict:
+        # Missing languages or keys fall back to the English source
+        return self.catalog.get(language, {}).get(part, {}).get(key) or self.source[part][key]
+
+    def keyword(self, number: int, language: str = 'en') -> str:
+        return self._entry(language, 'numbers', str(number))['keyword']
+
+    def reading(self, numbers: Optional[Dict], day: int, language: str = 'en') -> Dict:
+        """Core number, its relation to the day and the localised insight"""
+        personal = personal_numbers(numbers)
+        core = core_number(personal)
+        values = {
+            'numbers': ', '.join(str(number) for number in personal),
+            'day': str(day),
+            'day_keyword': self.keyword(day, language)
+        }
+
+        if core is None:
+            link = None
+            sentences = [render(self._entry(language, 'templates', 'day'), values)]
+        else:
+            link = relation(core, day)
+            values.update(core=str(core), core_keyword=self.keyword(core, language))
+            sentences = [
+                render(self._entry(language, 'templates', 'pair'), values),
+                render(self._entry(language, 'templates', link), values)
+            ]
+
+        for master in sorted({number for number in (core, day) if number in MASTER_NUMBERS}):
+            sentences.append(render(self._entry(language, 'templates', 'master'), {'master': str(master)}))
+        sentences.append(self._entry(language, 'numbers', str(day))['advice'])
+
+        return {
+            'numbers': personal,
+            'core': core,
+            'day': day,
+            'relation': link,
+            'insight': ' '.join(sentences)
+        }
+
+    def prompt_lines(self, reading: Dict) -> Dict[str, str]:
+        """English descriptions of the day and personal numbers for the reading prompt"""
+        day = reading['day']
+        lines = {'day': f"{day} ({self.keyword(day)})"}
+        if reading['core'] is None:
+            lines['personal'] = "not given"
+        else:
+            core = reading['core']
+            lines['personal'] = (
+                f"{', '.join(str(number) for number in reading['numbers'])} "
+                f"- core number {core} ({self.keyword(core)}), {reading['relation']} with the day"
+            )
+        return lines
+
+
+@lru_cache()
+def get_numerology_engine() -> NumerologyEngine:
+    """The process-wide engine with the catalog loaded once"""
+    return NumerologyEngine()
@@ -0,0 +1,100 @@
+"""
+Reading section markers - [CARD_READING]...[/CARD_READING], [PAST], ...
+Incremental parser used to push sections while Claude is still streaming,
+and parse_sections for whole interpretations, so readings are stored and
+returned with their sections already split out.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+# [NAME] or [/NAME] where NAME is an upper-case marker like WEEKLY_CHALLENGE
+SECTION_MARKER = re.compile(r'\[(/?)([A-Z][A-Z0-9_]*)\]')
+
+
+class SectionStreamParser:
+    """
+    Feed streamed text chunks, get back sections as soon as they close.
+
+    A section closes on its own closing marker, or - for prompts that only
+    use opening markers - when the next opening marker starts. Whatever is
+    still open when the stream ends is returned by close().
+    """
+
+    def __init__(self):
+        self._text = ''
+        self._scan_pos = 0
+        self._current: Optional[str] = None
+        self._content_start = 0
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        """Add a chunk; return the (name, content) sections it completed"""
+        self._text += chunk
+        completed = []
+
+        for match in SECTION_MARKER.finditer(self._text, self._scan_pos):
+            is_closing, name = match.group(1) == '/', match.group(2)
+            if is_closing:
+                if name == self._current:
+                    completed.append(self._finish(match.start()))
+            else:
+                if self._current is not None:
+                    completed.append(self._finish(match.start()))
+                self._current = name
+                self._content_start = match.end()
+            self._scan_pos = match.end()
+
+        # Only a trailing '[' can still grow into a marker
+        tail = self._text.rfind('[', self._scan_pos)
+        self._scan_pos = tail if tail != -1 else len(self._text)
+
+        return completed
+
+    def close(self) -> List[Tuple[str, str]]:
+        """End of stream - flush a section left without a closing marker"""
+        if self._current is None:
+            return []
+        return [self._finish(len(self._text))]
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far"""
+        return self._text
+
+    def _finish(self, end: int) -> Tuple[str, str]:
+        section = (self._current, self._text[self._content_start:end].strip())
+        self._current = None
+        return section
+
+
+def parse_sections(text: str) -> Dict[str, str]:
+    """
+    One pass over an interpretation -> {marker name: content} in reading order.
+    Covers every marker family (CARD_READING, NUMEROLOGY_INSIGHT,
+    DAILY_AFFIRMATION, PAST/PRESENT/FUTURE/INTEGRATION, WEEKLY_*, SECTION_n);
+    missing closing markers end the section at the next opening one.
+    """
+    parser = SectionStreamParser()
+    return dict(parser.feed(text or '') + parser.close())
+
+
+def with_sections(reading: Dict) -> Dict:
+    """
+    Sections of a stored reading in reading order. Firestore maps do not keep
+    key order, so stored sections are re-ordered by where their markers open
+    in the interpretation; readings that predate sections are parsed.
+    """
+    if not reading:
+        return reading
+    text = reading.get('interpretation') or ''
+    sections = reading.get('sections')
+    if not sections:
+        reading['sections'] = parse_sections(text)
+        return reading
+
+    def position(name: str) -> int:
+        start = text.find(f"[{name}]")
+        return start if start != -1 else len(text)
+
+    # sorted() is stable: sections without a marker keep their relative order
+    reading['sections'] = {name: sections[name] for name in sorted(sections, key=position)}
+    return reading
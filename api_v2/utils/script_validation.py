@@ -0,0 +1,66 @@
+"""
+Script validation - does a reading look like it is written in the requested
+language's script?
+
+A script is a few codepoint ranges merged and sorted once; checking a
+response takes its distinct characters (one C-level set() call) and bisects
+each of them into the ranges, instead of building a set of every character
+in the script. A response is valid when it contains at least `min_chars`
+distinct characters of the script (case-folded), which is what the old set
+intersection measured.
+"""
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Optional, Set, Tuple
+
+# Script name -> inclusive codepoint ranges
+SCRIPT_RANGES: Dict[str, Tuple[Tuple[int, int], ...]] = {
+    'georgian': ((0x10A0, 0x10FF),),  # Georgian
+    'cyrillic': ((0x0400, 0x04FF),),  # Cyrillic
+    'hangul': ((0xAC00, 0xD7AF),),    # Korean Hangul
+    'chinese': ((0x4E00, 0x9FFF),),   # Chinese
+    'japanese': (
+        (0x3040, 0x309F),  # Hiragana
+        (0x30A0, 0x30FF),  # Katakana
+        (0x4E00, 0x9FFF),  # Kanji
+    ),
+}
+
+
+def merge_ranges(ranges: Tuple[Tuple[int, int], ...]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Inclusive ranges -> sorted, non-overlapping (starts, ends)"""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return tuple(start for start, _ in merged), tuple(end for _, end in merged)
+
+
+class ScriptValidator:
+    """Minimum distinct-character check for one script"""
+
+    def __init__(self, script: str, min_chars: int):
+        self.script = script
+        self.min_chars = min_chars
+        self.starts, self.ends = merge_ranges(SCRIPT_RANGES[script])
+
+    def in_script(self, char: str) -> bool:
+        i = bisect_right(self.starts, ord(char)) - 1
+        return i >= 0 and ord(char) <= self.ends[i]
+
+    def script_chars(self, text: str) -> Set[str]:
+        """Distinct characters of the script in text"""
+        return {char for char in set(text.lower()) if self.in_script(char)}
+
+    def is_valid(self, text: str) -> bool:
+        return len(self.script_chars(text)) >= self.min_chars
+
+
+@lru_cache(maxsize=None)
+def get_validator(script: Optional[str], min_chars: int) -> Optional[ScriptValidator]:
+    """Shared validator for a script (None for languages without a check)"""
+    if not script or script not in SCRIPT_RANGES:
+        return None
+    return ScriptValidator(script, min_chars)
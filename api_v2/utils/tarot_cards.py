@@ -1,6 +1,11 @@
+import hashlib
+import hmac
 import random
 import logging
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Sequence, Tuple
+
+from api_v2.utils.card_images import card_image_set
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -187,70 +192,83 @@ MAJOR_ARCANA = [
 ]
 
 class TarotDeck:
-    def __init__(self):
-        self.cards = MAJOR_ARCANA.copy()
-        self.current_spread = []
-        logger.info("Tarot deck initialized with %d cards", len(self.cards))
+    """
+    Immutable card registry.
 
-    def shuffle(self) -> None:
-        random.shuffle(self.cards)
-        logger.debug("Deck shuffled")
+    Cards are read-only mappings indexed by lower-cased name and by number, so
+    lookups are O(1). A draw samples indices with its own RNG call and never
+    touches deck state, so the shared module-level deck is safe to use from
+    concurrent coroutines and threads.
+    """
+
+    def __init__(self, cards: Sequence[Dict] = MAJOR_ARCANA):
+        self.cards: Tuple[Mapping, ...] = tuple(
+            MappingProxyType({**card, "keywords": tuple(card["keywords"])}) for card in cards
+        )
+        self._by_name = {card["name"].lower(): card for card in self.cards}
+        self._by_number = {card["number"]: card for card in self.cards if "number" in card}
+        logger.info("Tarot deck initialized with %d cards", len(self.cards))
 
-    def draw_cards(self, count: int = 1) -> List[Dict]:
+    def draw_cards(self, count: int = 1, rng: Optional[random.Random] = None) -> List[Mapping]:
+        """Draw `count` distinct cards in random order"""
         try:
             if count > len(self.cards):
                 raise ValueError(f"Cannot draw {count} cards from a deck of {len(self.cards)} cards")
-            
-            self.shuffle()
-            drawn_cards = self.cards[:count]
-            self.current_spread = drawn_cards
-            
+
+            indices = (rng or random).sample(range(len(self.cards)), count)
+            drawn_cards = [self.cards[i] for i in indices]
+
             logger.info(f"Drew {count} cards: {[card['name'] for card in drawn_cards]}")
             return drawn_cards
-            
+
         except Exception as e:
             logger.error(f"Error drawing cards: {e}")
             return self._get_default_cards(count)
 
-    def get_card_by_name(self, name: str) -> Optional[Dict]:
-        try:
-            return next((card for card in self.cards 
-                        if card["name"].lower() == name.lower()), None)
-        except Exception as e:
-            logger.error(f"Error finding card {name}: {e}")
+    def get_card_by_name(self, name: str) -> Optional[Mapping]:
+        if not isinstance(name, str):
             return None
+        return self._by_name.get(name.lower())
 
-    def _get_default_cards(self, count: int) -> List[Dict]:
-        default_cards = [
-            {
-                "name": "The Star",
-                "image": "star.jpg",
-                "keywords": ["Hope", "Inspiration", "Renewal"],
-                "type": "major",
-                "element": "Air"
-            }
-        ] * count
+    def get_card_by_number(self, number: int) -> Optional[Mapping]:
+        return self._by_number.get(number)
+
+    def _get_default_cards(self, count: int) -> List[Mapping]:
         logger.warning(f"Returning {count} default cards")
-        return default_cards
+        return [self._by_name["the star"]] * count
 
 # Create global instance
 deck = TarotDeck()
 
 # Helper functions
-def get_random_cards(count: int = 1) -> List[Dict]:
+def get_random_cards(count: int = 1) -> List[Mapping]:
     return deck.draw_cards(count)
 
+def draw_seed(key: str, *parts: str) -> int:
+    """Keyed hash (HMAC-SHA256) of the draw context, as an RNG seed"""
+    digest = hmac.new(key.encode(), '|'.join(parts).encode(), hashlib.sha256).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+def get_seeded_cards(count: int, key: str, *parts: str) -> List[Mapping]:
+    """Same key and parts -> same cards, in any process, with no stored state"""
+    return deck.draw_cards(count, random.Random(draw_seed(key, *parts)))
+
 def get_card_image(card_name: str) -> str:
     card = deck.get_card_by_name(card_name)
     if card:
         return f"/static/images/cards/{card['image']}"
-    return "/static/images/cards/card_back.jpg"
+    return "/static/images/cards/card-back.jpg"
+
+def get_card_image_set(card_name: str) -> Dict:
+    """Responsive variants of the card art (see utils/card_images.py)"""
+    card = deck.get_card_by_name(card_name)
+    return card_image_set(card['image'] if card else 'card-back.jpg')
 
-def format_card_data(card: Dict) -> Dict:
+def format_card_data(card: Mapping) -> Dict:
     return {
         "name": card["name"],
         "image": f"/static/images/cards/{card['image']}",
-        "keywords": card["keywords"],
+        "keywords": list(card["keywords"]),
         "element": card.get("element", "Unknown")
     }
 
@@ -259,6 +277,9 @@ __all__ = [
     'TarotDeck',
     'deck',
     'get_random_cards',
+    'get_seeded_cards',
+    'draw_seed',
     'get_card_image',
+    'get_card_image_set',
     'format_card_data'
 ]
\ No newline at end of file
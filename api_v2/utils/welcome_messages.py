@@ -0,0 +1,51 @@
+"""
+Chat welcome-message catalog.
+
+Templates per language and reading kind live in data/welcome_messages.json,
+generated offline by `python -m api_v2.jobs.generate_welcome_catalog`, so a
+session start needs no translation call. Placeholders: {name}, {card_name}.
+"""
+import json
+import logging
+import os
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'welcome_messages.json')
+
+PLACEHOLDERS = ('{name}', '{card_name}')
+
+# Source templates the catalog is translated from
+WELCOME_TEMPLATES = {
+    'standard': (
+        "Hi {name}! I'm here to discuss your tarot reading "
+        "with the {card_name} card. What would you like to know more about?"
+    ),
+    'premium': (
+        "Hi {name}! I'm here to discuss your premium three-card reading "
+        "representing your past, present, and future. What would you like to know more about?"
+    )
+}
+
+
+def load_catalog(path: str = CATALOG_PATH) -> Dict[str, Dict[str, str]]:
+    """Load {language: {kind: template}}; English only if the file is missing"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            catalog = json.load(f)
+        logger.info(f"Loaded welcome messages for {len(catalog)} languages")
+        return catalog
+    except (OSError, ValueError) as e:
+        logger.error(f"Error loading welcome catalog {path}: {e}")
+        return {'en': dict(WELCOME_TEMPLATES)}
+
+
+def has_placeholders(template: str, kind: str) -> bool:
+    """A translated template must keep the placeholders its source has"""
+    return all(p in template for p in PLACEHOLDERS if p in WELCOME_TEMPLATES[kind])
+
+
+def render_welcome(template: str, name: str, card_name: str = None) -> str:
+    """Fill in a template (plain replace - names may contain braces)"""
+    return template.replace('{name}', name).replace('{card_name}', card_name or '')
@@ -1,18 +1,21 @@
 import os
-from flask import Flask, render_template, send_from_directory
+from flask import Flask, render_template, abort
 from flask_cors import CORS
 from dotenv import load_dotenv
 import subprocess
 import threading
 import requests
-from flask import request, jsonify
+from requests.adapters import HTTPAdapter
+from flask import request, jsonify, Response, stream_with_context
+
+from api_v2.core.static_files import STATIC_DIR, StaticFileIndex, iter_file
 
 # Load environment variables
 load_dotenv()
 
 # Initialize Flask app
 app = Flask(__name__, 
-            static_folder='static',
+            static_folder=None,
             template_folder='templates')
 
 # Enable CORS
@@ -44,48 +47,106 @@ if os.getenv('RENDER'):
     fastapi_thread.start()
     print("✅ FastAPI background thread started (Render deployment)")
 
+# ============================================================================
+# API PROXY
+# ============================================================================
+FASTAPI_URL = os.getenv('FASTAPI_URL', 'http://localhost:8000')
+PROXY_CONNECT_TIMEOUT = float(os.getenv('PROXY_CONNECT_TIMEOUT', 3.05))
+# Max wait between bytes - SSE readings can pause while Claude thinks
+PROXY_READ_TIMEOUT = float(os.getenv('PROXY_READ_TIMEOUT', 120))
+PROXY_POOL_SIZE = int(os.getenv('PROXY_POOL_SIZE', 32))
+PROXY_CHUNK_SIZE = 8192
+
+# Connection-level headers that must not be forwarded (RFC 7230 6.1);
+# CORS headers are set by after_request below
+HOP_BY_HOP_HEADERS = {
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
+    'te', 'trailers', 'transfer-encoding', 'upgrade'
+}
+
+
+def _create_proxy_session():
+    """Keep-alive connection pool to FastAPI, shared by all Flask threads"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=PROXY_POOL_SIZE, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    # Never pick up HTTP(S)_PROXY env vars for a loopback upstream
+    session.trust_env = False
+    return session
+
+
+proxy_session = _create_proxy_session()
+
+
+def _forward_request_headers():
+    headers = {
+        name: value for name, value in request.headers.items()
+        if name.lower() not in HOP_BY_HOP_HEADERS and name.lower() not in ('host', 'content-length')
+    }
+    headers['X-Forwarded-For'] = request.remote_addr or ''
+    headers['X-Forwarded-Proto'] = request.scheme
+    headers['X-Forwarded-Host'] = request.host
+    return headers
+
+
+def _forward_response_headers(upstream):
+    return [
+        (name, value) for name, value in upstream.raw.headers.items()
+        if name.lower() not in HOP_BY_HOP_HEADERS and not name.lower().startswith('access-control-')
+    ]
+
+
 # Proxy all /api/ calls to FastAPI (for production on Render)
 @app.route('/api/<path:path>', methods=['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'])
 def api_proxy(path):
-    """Proxy API calls to FastAPI backend"""
-    fastapi_url = f'http://localhost:8000/api/{path}'
+    """
+    Proxy API calls to FastAPI backend.
+    Method, query string, body, headers and status pass through unchanged and
+    the response body is streamed, so SSE readings reach the browser as
+    they are generated.
+    """
+    # Handle OPTIONS (CORS preflight)
+    if request.method == 'OPTIONS':
+        response = jsonify({'status': 'ok'})
+        response.headers.add('Access-Control-Allow-Origin', '*')
+        response.headers.add('Access-Control-Allow-Headers', 'Content-Type')
+        response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
+        return response
     
     try:
-        # Handle OPTIONS (CORS preflight)
-        if request.method == 'OPTIONS':
-            response = jsonify({'status': 'ok'})
-            response.headers.add('Access-Control-Allow-Origin', '*')
-            response.headers.add('Access-Control-Allow-Headers', 'Content-Type')
-            response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
-            return response
-            
-        # Forward the request to FastAPI
-        if request.method == 'POST':
-            resp = requests.post(
-                fastapi_url,
-                json=request.get_json(),
-                headers={'Content-Type': 'application/json'}
-            )
-        elif request.method == 'GET':
-            resp = requests.get(
-                fastapi_url,
-                params=request.args
-            )
-        elif request.method == 'PUT':
-            resp = requests.put(
-                fastapi_url,
-                json=request.get_json(),
-                headers={'Content-Type': 'application/json'}
-            )
-        elif request.method == 'DELETE':
-            resp = requests.delete(fastapi_url)
-        
-        # Return FastAPI's response
-        return resp.json(), resp.status_code
-        
-    except Exception as e:
+        upstream = proxy_session.request(
+            request.method,
+            f'{FASTAPI_URL}/api/{path}',
+            params=list(request.args.items(multi=True)),
+            data=request.get_data(),
+            headers=_forward_request_headers(),
+            stream=True,
+            allow_redirects=False,
+            timeout=(PROXY_CONNECT_TIMEOUT, PROXY_READ_TIMEOUT)
+        )
+    except requests.Timeout as e:
+        print(f"❌ FastAPI timed out: {e}")
+        return {"error": "API request timed out", "details": str(e)}, 504
+    except requests.RequestException as e:
         print(f"❌ Error proxying to FastAPI: {e}")
-        return {"error": "API request failed", "details": str(e)}, 500
+        return {"error": "API request failed", "details": str(e)}, 502
+    
+    def body():
+        try:
+            # Raw bytes: a gzip-encoded upstream body stays gzip-encoded
+            for chunk in upstream.raw.stream(PROXY_CHUNK_SIZE, decode_content=False):
+                yield chunk
+        finally:
+            # Returns the connection to the pool (or drops it if unfinished)
+            upstream.close()
+    
+    return Response(
+        stream_with_context(body()),
+        status=upstream.status_code,
+        headers=_forward_response_headers(upstream),
+        direct_passthrough=True
+    )
 
 # Main page route
 @app.route('/')
@@ -99,11 +160,33 @@ def nfc_registration():
     """NFC registration page"""
     return render_template('react.html')
 
-# Serve static files
-@app.route('/static/<path:path>')
-def serve_static(path):
-    """Serve static files (JS, CSS, images)"""
-    return send_from_directory('static', path)
+# Serve static files - indexed once at startup (ETags, .br/.gz siblings)
+static_index = StaticFileIndex(STATIC_DIR)
+
+def static_response(path):
+    status, headers, body = static_index.resolve(path, request.headers)
+    if status == 404:
+        abort(404)
+    return Response(
+        iter_file(*body) if body else b'',
+        status=status,
+        headers=headers,
+        direct_passthrough=True
+    )
+
+@app.route('/static/<path:filename>', endpoint='static')
+def serve_static(filename):
+    """Serve static files (JS, CSS, images) - precompressed, ETag/304, byte ranges"""
+    return static_response(filename)
+
+@app.route('/manifest.json')
+def web_manifest():
+    return static_response('manifest.json')
+
+@app.route('/service-worker.js')
+def service_worker():
+    """Served from the root so the worker's scope is the whole site"""
+    return static_response('service-worker.js')
 
 # Health check
 @app.route('/health')
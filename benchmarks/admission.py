@@ -0,0 +1,138 @@
+"""
+Admission control under a burst of mixed-priority Claude calls.
+
+Every call holds a slot for --hold seconds (a stand-in for the Claude
+request). Scenarios:
+  mixed     - chat, readings and weekly readings arrive together, more than
+              the limit: concurrency never exceeds the limit and chat waits
+              least, weekly most
+  overload  - a burst bigger than the limit plus the queue: the excess is
+              shed (queue_full / evicted) right away, chat is never evicted
+  deadline  - a call still queued after its class deadline is rejected
+  cancel    - queued callers that disconnect give their place back
+After each scenario no slot or queue entry may be left behind.
+
+Exits non-zero if any check fails. Run from the repo root:
+    python -m benchmarks.admission
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from collections import defaultdict
+
+from api_v2.core.admission import AdmissionController, AdmissionRejected
+
+
+class Probe:
+    """Runs calls through a controller and records what happened"""
+
+    def __init__(self, admission: AdmissionController, hold: float):
+        self.admission = admission
+        self.hold = hold
+        self.running = 0
+        self.peak = 0
+        self.waits = defaultdict(list)
+        self.outcomes = defaultdict(lambda: defaultdict(int))
+
+    async def call(self, endpoint: str):
+        start = time.perf_counter()
+        try:
+            async with self.admission.slot(endpoint):
+                self.waits[endpoint].append(time.perf_counter() - start)
+                self.running += 1
+                self.peak = max(self.peak, self.running)
+                await asyncio.sleep(self.hold)
+                self.running -= 1
+        except AdmissionRejected as e:
+            self.outcomes[endpoint][e.reason] += 1
+            return
+        self.outcomes[endpoint]['ok'] += 1
+
+    def drained(self) -> bool:
+        return self.admission.active == 0 and self.admission.queued == 0
+
+    def report(self):
+        for endpoint, outcomes in self.outcomes.items():
+            waits = self.waits[endpoint]
+            avg = sum(waits) / len(waits) * 1000 if waits else 0.0
+            print(f"    {endpoint:<8} {dict(outcomes)}  avg wait {avg:.0f}ms")
+
+
+async def mixed(limit: int, hold: float) -> bool:
+    probe = Probe(AdmissionController(limit, limit * 4), hold)
+    # Once the limit is taken, weekly calls queue first and chat last -
+    # priority must still win
+    endpoints = ['daily'] * limit + ['weekly'] * limit + ['daily'] * limit + ['chat'] * limit
+    await asyncio.gather(*[probe.call(endpoint) for endpoint in endpoints])
+    avg = {e: sum(w[-limit:]) / limit for e, w in probe.waits.items()}
+    print(f"mixed: {len(endpoints)} calls, limit {limit} - peak concurrency {probe.peak}")
+    probe.report()
+    return probe.peak <= limit and avg['chat'] < avg['daily'] < avg['weekly'] and probe.drained()
+
+
+async def overload(limit: int, hold: float) -> bool:
+    queue = limit * 2
+    probe = Probe(AdmissionController(limit, queue), hold)
+    background = [asyncio.ensure_future(probe.call('pregenerate')) for _ in range(limit + queue + limit)]
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*[probe.call('weekly') for _ in range(limit)], *[probe.call('chat') for _ in range(limit)])
+    await asyncio.gather(*background)
+    print(f"overload: {len(background)} background calls overfill the limit and queue, then {2 * limit} more "
+          f"({(time.perf_counter() - start):.2f}s) - peak concurrency {probe.peak}")
+    probe.report()
+    stats = probe.admission.stats()
+    print(f"    evicted {stats['evicted']}, rejected queue_full {stats['rejected_queue_full']}")
+    return (
+        probe.peak <= limit
+        and probe.outcomes['chat']['ok'] == limit
+        and probe.outcomes['pregenerate']['evicted'] == 2 * limit
+        and probe.outcomes['pregenerate']['queue_full'] == limit
+        and probe.drained()
+    )
+
+
+async def deadline(hold: float) -> bool:
+    probe = Probe(AdmissionController(1, 4, deadlines=(hold / 4,) * 4), hold)
+    start = time.perf_counter()
+    await asyncio.gather(probe.call('daily'), probe.call('chat'))
+    elapsed = time.perf_counter() - start
+    print(f"deadline: a chat queued behind a {hold * 1000:.0f}ms call with a {hold * 250:.0f}ms deadline")
+    probe.report()
+    return probe.outcomes['chat']['deadline'] == 1 and elapsed < hold * 1.5 and probe.drained()
+
+
+async def cancel(hold: float) -> bool:
+    probe = Probe(AdmissionController(1, 4), hold)
+    first = asyncio.ensure_future(probe.call('daily'))
+    waiting = [asyncio.ensure_future(probe.call('weekly')) for _ in range(3)]
+    await asyncio.sleep(hold / 4)
+    for task in waiting[:2]:
+        task.cancel()
+    await asyncio.gather(first, *waiting, return_exceptions=True)
+    print("cancel: 2 of 3 queued callers disconnect")
+    probe.report()
+    return probe.outcomes['weekly']['ok'] == 1 and probe.drained()
+
+
+async def run(limit: int, hold: float) -> bool:
+    results = [await mixed(limit, hold), await overload(limit, hold), await deadline(hold), await cancel(hold)]
+    return all(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--limit', type=int, default=4)
+    parser.add_argument('--hold', type=float, default=0.1, help="Seconds each call holds its slot")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)  # evictions are expected here
+
+    ok = asyncio.run(run(args.limit, args.hold))
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
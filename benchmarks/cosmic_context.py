@@ -0,0 +1,75 @@
+"""
+Cosmic context: per-request cost and consistency.
+
+  per request - the four scalar functions (moon phase, season, day energy,
+                numerology) called for every reading, as the service used to
+  memoised    - get_cosmic_context(), computed once per calendar day
+
+Also checks that get_cosmic_context() matches the scalar functions for
+every day over --years years, and that its memo stays bounded. Exits
+non-zero on a mismatch.
+
+Run from the repo root:
+    python -m benchmarks.cosmic_context --years 6
+"""
+import argparse
+import sys
+import timeit
+from datetime import date, datetime
+
+from api_v2.utils import cosmic_utils
+from api_v2.utils.cosmic_utils import (
+    COSMIC_CONTEXT_DAYS,
+    calculate_moon_phase,
+    calculate_numerology_day,
+    get_cosmic_context,
+    get_current_season,
+    get_day_energy,
+)
+
+
+def per_request(now: datetime) -> dict:
+    return {
+        "moon_phase": calculate_moon_phase(now),
+        "season": get_current_season(now),
+        "day_energy": get_day_energy(now),
+        "numerology_day": calculate_numerology_day(now)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--years', type=int, default=6)
+    parser.add_argument('--first-year', type=int, default=date.today().year)
+    parser.add_argument('--number', type=int, default=200000)
+    args = parser.parse_args()
+
+    now = datetime.now()
+    timings = [
+        ('per request', lambda: per_request(now)),
+        ('memoised', lambda: get_cosmic_context(now)),
+    ]
+    print("Per reading:")
+    for label, fn in timings:
+        seconds = timeit.timeit(fn, number=args.number)
+        print(f"  {label:<12}: {seconds / args.number * 1e9:7.0f}ns")
+
+    start = date(args.first_year, 1, 1).toordinal()
+    days = date(args.first_year + args.years, 1, 1).toordinal() - start
+    mismatches = 0
+    for offset in range(days):
+        day = date.fromordinal(start + offset)
+        context = get_cosmic_context(day)
+        expected = per_request(day)
+        if (context.moon_phase, context.season, context.day_energy, context.numerology_day) != tuple(expected.values()):
+            mismatches += 1
+    memo = len(cosmic_utils._contexts)
+    print(f"Consistency: {mismatches} mismatches over {days} days, {memo} days memoised")
+
+    ok = mismatches == 0 and memo <= COSMIC_CONTEXT_DAYS
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
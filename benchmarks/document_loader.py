@@ -0,0 +1,71 @@
+"""
+Per-request Firestore latency: sequential reads vs the request-scoped DocumentLoader.
+
+Each simulated three-card request reads what ReadingService reads: the user
+document (twice - rate limiter and reading service) and the day's cache doc.
+
+Run from the repo root:
+    python -m benchmarks.document_loader --requests 50 --latency 0.05
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from api_v2.core.loader import request_scope
+from api_v2.core.repository import FirestoreRepository
+from benchmarks.fake_firestore import FakeFirestore
+
+
+async def sequential_request(repo: FirestoreRepository, nfc_id: str):
+    """Old path: one round trip per read"""
+    await repo.get_dict(repo.document('nfc_users', nfc_id))
+    await repo.get_dict(repo.document('nfc_users', nfc_id))
+    await repo.get_dict(repo.document('three_card_cache', f"{nfc_id}_2025-01-31"))
+
+
+async def loader_request(repo: FirestoreRepository, nfc_id: str):
+    """New path: cache doc declared up front, duplicate user read deduplicated"""
+    with request_scope(repo):
+        repo.prime(repo.document('three_card_cache', f"{nfc_id}_2025-01-31"))
+        await repo.load(repo.document('nfc_users', nfc_id))
+        await repo.load(repo.document('nfc_users', nfc_id))
+        await repo.load(repo.document('three_card_cache', f"{nfc_id}_2025-01-31"))
+
+
+async def timed(handler, repo, nfc_id: str) -> float:
+    start = time.perf_counter()
+    await handler(repo, nfc_id)
+    return time.perf_counter() - start
+
+
+async def run(handler, repo, requests: int):
+    return await asyncio.gather(*[timed(handler, repo, f"nfc_{i % 10}") for i in range(requests)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--latency', type=float, default=0.05, help="Firestore round trip (s)")
+    args = parser.parse_args()
+
+    db = FakeFirestore(latency=0)
+    for i in range(10):
+        db.collection('nfc_users').document(f"nfc_{i}").set({'name': f"User {i}"})
+    db.latency = args.latency
+    repo = FirestoreRepository(db, max_workers=args.requests)
+
+    results = {}
+    for label, handler in [('sequential', sequential_request), ('loader', loader_request)]:
+        db.round_trips = 0
+        latencies = asyncio.run(run(handler, repo, args.requests))
+        results[label] = (statistics.median(latencies), db.round_trips / args.requests)
+    repo.shutdown()
+
+    print(f"{args.requests} concurrent requests, firestore={args.latency * 1000:.0f}ms")
+    for label, (p50, trips) in results.items():
+        print(f"  {label:<11}: p50 {p50 * 1000:6.1f}ms  {trips:.1f} round trips/request")
+
+
+if __name__ == "__main__":
+    main()
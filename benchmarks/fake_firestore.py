@@ -0,0 +1,182 @@
+"""
+In-memory stand-in for the synchronous Firestore client.
+Implements the subset of the API used by api_v2 and sleeps on every
+round trip (like the real client blocks on the network).
+"""
+import copy
+import operator
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from google.cloud.firestore import DELETE_FIELD
+
+
+class FakeSnapshot:
+    """Minimal DocumentSnapshot"""
+
+    def __init__(self, reference, data: Optional[Dict]):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+
+    @property
+    def exists(self) -> bool:
+        return self._data is not None
+
+    def to_dict(self) -> Optional[Dict]:
+        return copy.deepcopy(self._data) if self._data is not None else None
+
+
+_OPERATORS = {
+    '==': operator.eq, '<': operator.lt, '<=': operator.le,
+    '>': operator.gt, '>=': operator.ge
+}
+
+
+class FakeQuery:
+    """Minimal filtered/ordered/limited query over a collection"""
+
+    def __init__(self, collection, order_field=None, descending=False, limit=None, filters=()):
+        self._collection = collection
+        self._order_field = order_field
+        self._descending = descending
+        self._limit = limit
+        self._filters = tuple(filters)
+
+    def where(self, field, op, value):
+        return FakeQuery(self._collection, self._order_field, self._descending, self._limit,
+                         self._filters + ((field, _OPERATORS[op], value),))
+
+    def order_by(self, field, direction='ASCENDING'):
+        return FakeQuery(self._collection, field, direction == 'DESCENDING', self._limit, self._filters)
+
+    def limit(self, count):
+        return FakeQuery(self._collection, self._order_field, self._descending, count, self._filters)
+
+    def stream(self):
+        client = self._collection.client
+        client._round_trip()
+        with client._lock:
+            docs = [
+                (path, data) for path, data in client._docs.items()
+                if path.rsplit('/', 1)[0] == self._collection.path
+                and all(field in data and op(data[field], value) for field, op, value in self._filters)
+            ]
+        if self._order_field:
+            docs.sort(key=lambda item: item[1].get(self._order_field), reverse=self._descending)
+        if self._limit is not None:
+            docs = docs[:self._limit]
+        for path, data in docs:
+            ref = FakeDocument(client, path)
+            yield FakeSnapshot(ref, copy.deepcopy(data))
+
+    def get(self) -> List[FakeSnapshot]:
+        return list(self.stream())
+
+
+class FakeCollection(FakeQuery):
+    """Collection reference"""
+
+    def __init__(self, client, path: str):
+        self.client = client
+        self.path = path
+        super().__init__(self)
+
+    def document(self, doc_id: Optional[str] = None):
+        return FakeDocument(self.client, f"{self.path}/{doc_id or uuid.uuid4().hex}")
+
+
+class FakeDocument:
+    """Document reference"""
+
+    def __init__(self, client, path: str):
+        self.client = client
+        self.path = path
+        self.id = path.rsplit('/', 1)[-1]
+
+    def collection(self, name: str) -> FakeCollection:
+        return FakeCollection(self.client, f"{self.path}/{name}")
+
+    def get(self) -> FakeSnapshot:
+        self.client._round_trip()
+        with self.client._lock:
+            return FakeSnapshot(self, copy.deepcopy(self.client._docs.get(self.path)))
+
+    def set(self, data: Dict, merge: bool = False):
+        self.client._round_trip()
+        with self.client._lock:
+            if merge and self.path in self.client._docs:
+                self.client._docs[self.path].update(copy.deepcopy(data))
+            else:
+                self.client._docs[self.path] = copy.deepcopy(data)
+
+    def update(self, data: Dict):
+        self.client._round_trip()
+        with self.client._lock:
+            if self.path not in self.client._docs:
+                raise KeyError(f"No document to update: {self.path}")
+            doc = self.client._docs[self.path]
+            for key, value in data.items():
+                target = doc
+                *parents, leaf = key.split('.')
+                for part in parents:
+                    target = target.setdefault(part, {})
+                if value is DELETE_FIELD:
+                    target.pop(leaf, None)
+                else:
+                    target[leaf] = copy.deepcopy(value)
+
+    def delete(self):
+        self.client._round_trip()
+        with self.client._lock:
+            self.client._docs.pop(self.path, None)
+
+
+class FakeFirestore:
+    """Thread-safe in-memory Firestore client with simulated latency"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.round_trips = 0
+        self._docs: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _round_trip(self):
+        with self._lock:
+            self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def collection(self, name: str) -> FakeCollection:
+        return FakeCollection(self, name)
+
+    def batch(self) -> "FakeBatch":
+        return FakeBatch(self)
+
+    def get_all(self, refs):
+        self._round_trip()
+        with self._lock:
+            snapshots = [FakeSnapshot(ref, copy.deepcopy(self._docs.get(ref.path))) for ref in refs]
+        yield from snapshots
+
+
+class FakeBatch:
+    """WriteBatch: queued writes applied in one round trip"""
+
+    def __init__(self, client):
+        self.client = client
+        self._writes = []
+
+    def set(self, ref, data: Dict, merge: bool = False):
+        self._writes.append((ref, data, merge))
+
+    def commit(self):
+        self.client._round_trip()
+        with self.client._lock:
+            for ref, data, merge in self._writes:
+                if merge and ref.path in self.client._docs:
+                    self.client._docs[ref.path].update(copy.deepcopy(data))
+                else:
+                    self.client._docs[ref.path] = copy.deepcopy(data)
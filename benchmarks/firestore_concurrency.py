@@ -0,0 +1,71 @@
+"""
+Concurrent-request throughput: blocking Firestore calls vs FirestoreRepository.
+
+Each simulated reading request does what the reading endpoints do:
+read the user document, await a Claude call, write the reading back.
+
+Run from the repo root:
+    python -m benchmarks.firestore_concurrency --requests 100 --latency 0.05
+"""
+import argparse
+import asyncio
+import time
+
+from api_v2.core.repository import FirestoreRepository
+from benchmarks.fake_firestore import FakeFirestore
+
+
+async def blocking_request(db, nfc_id: str, claude_latency: float):
+    """Old path: sync client called straight from the coroutine"""
+    user = db.collection('nfc_users').document(nfc_id).get()
+    await asyncio.sleep(claude_latency)
+    db.collection('nfc_readings').document().set({'nfc_id': nfc_id, 'user': user.to_dict()})
+
+
+async def repository_request(repo: FirestoreRepository, nfc_id: str, claude_latency: float):
+    """New path: every round trip awaited through the repository"""
+    user = await repo.get(repo.document('nfc_users', nfc_id))
+    await asyncio.sleep(claude_latency)
+    await repo.set(repo.document('nfc_readings'), {'nfc_id': nfc_id, 'user': user.to_dict()})
+
+
+async def run(handler, target, requests: int, claude_latency: float) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        handler(target, f"nfc_{i % 10}", claude_latency) for i in range(requests)
+    ])
+    return time.perf_counter() - start
+
+
+def seed(db: FakeFirestore):
+    latency, db.latency = db.latency, 0
+    for i in range(10):
+        db.collection('nfc_users').document(f"nfc_{i}").set({'name': f"User {i}"})
+    db.latency = latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.05, help="Firestore round trip (s)")
+    parser.add_argument('--claude-latency', type=float, default=0.2, help="Claude call (s)")
+    parser.add_argument('--workers', type=int, default=16)
+    args = parser.parse_args()
+
+    db = FakeFirestore(latency=args.latency)
+    seed(db)
+    repo = FirestoreRepository(db, max_workers=args.workers)
+
+    before = asyncio.run(run(blocking_request, db, args.requests, args.claude_latency))
+    after = asyncio.run(run(repository_request, repo, args.requests, args.claude_latency))
+    repo.shutdown()
+
+    print(f"{args.requests} concurrent requests, firestore={args.latency * 1000:.0f}ms, "
+          f"claude={args.claude_latency * 1000:.0f}ms, workers={args.workers}")
+    print(f"  blocking client : {before:6.2f}s  {args.requests / before:8.1f} req/s")
+    print(f"  repository      : {after:6.2f}s  {args.requests / after:8.1f} req/s")
+    print(f"  speedup         : {before / after:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Content-addressed LLM result cache: repeated pure prompts vs calling Claude each time.
+
+A fake Claude takes --llm seconds per call; Firestore is the in-memory fake
+with --latency per round trip. Checks:
+  repeats      - --requests translations drawn from --distinct (text, language)
+                 pairs: only the first of each reaches Claude, and the cache
+                 reports the hit ratio and the time it saved
+  normalised   - the same prompt with CRLF line endings and trailing spaces
+                 is the same entry
+  persistent   - a fresh process (empty memory tier) finds the results in
+                 Firestore and promotes them to memory
+  expiry       - an entry past its TTL is regenerated
+  lru          - the memory tier stays within its size
+
+Exits non-zero if any check fails. Run from the repo root:
+    python -m benchmarks.llm_cache --requests 200 --distinct 20
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+
+from api_v2.core.llm_cache import FirestoreResultStore, LLMResultCache
+from api_v2.core.repository import FirestoreRepository
+from benchmarks.fake_firestore import FakeFirestore
+
+LANGUAGES = ['ka', 'ja', 'es', 'de', 'ru']
+
+
+class FakeClaude:
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.calls = 0
+
+    async def translate(self, params) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.seconds)
+        return f"translated: {params['messages'][0]['content']}"
+
+
+def params(text: str, language: str) -> dict:
+    return {
+        "model": "claude-sonnet-4-20250514",
+        "max_tokens": 500,
+        "messages": [{"role": "user", "content": f"Translate this message to {language}: {text}"}]
+    }
+
+
+async def translate(cache: LLMResultCache, claude: FakeClaude, request: dict, ttl: float = 3600) -> str:
+    return await cache.get_or_create('translate', request, lambda: claude.translate(request), ttl)
+
+
+async def run(requests: int, distinct: int, llm: float, latency: float) -> bool:
+    db = FakeFirestore(latency=latency)
+    repo = FirestoreRepository(db, max_workers=8)
+    store = FirestoreResultStore(repo)
+    claude = FakeClaude(llm)
+    ok = True
+
+    pairs = [(f"Welcome, seeker number {i}. The cards await you.", LANGUAGES[i % len(LANGUAGES)])
+             for i in range(distinct)]
+    rng = random.Random(7)
+    workload = [params(*rng.choice(pairs)) for _ in range(requests)]
+
+    uncached = requests * llm
+    cache = LLMResultCache(memory_size=distinct * 2, store=store)
+    start = time.perf_counter()
+    for request in workload:
+        await translate(cache, claude, request)
+    elapsed = time.perf_counter() - start
+    stats = cache.stats()
+    unique = len({request['messages'][0]['content'] for request in workload})
+    print(f"repeats: {requests} requests, {unique} distinct - {claude.calls} Claude calls, "
+          f"{elapsed:.2f}s vs {uncached:.2f}s uncached, hit ratio {stats['hit_ratio']}, "
+          f"saved {stats['saved_seconds']}s")
+    ok &= claude.calls == unique and stats['hit_ratio'] == round((requests - unique) / requests, 3)
+
+    calls = claude.calls
+    messy = params(*pairs[0])
+    messy['messages'][0]['content'] += "  \r\n"
+    await translate(cache, claude, messy)
+    print(f"normalised: CRLF/trailing-space variant -> {'hit' if claude.calls == calls else 'miss'}")
+    ok &= claude.calls == calls
+
+    restarted = LLMResultCache(memory_size=distinct * 2, store=store)
+    for request in workload[:distinct]:
+        await translate(restarted, claude, request)
+    tier = restarted.stats()['endpoints']['translate']
+    print(f"persistent: new process - {tier['store_hits']} Firestore hits, {tier['memory_hits']} memory hits, "
+          f"{claude.calls - calls} Claude calls")
+    ok &= claude.calls == calls and tier['misses'] == 0 and tier['store_hits'] == len(
+        {request['messages'][0]['content'] for request in workload[:distinct]}
+    )
+
+    short = params("Short-lived", "es")
+    await translate(cache, claude, short, ttl=0.2)
+    await asyncio.sleep(0.3)
+    calls = claude.calls
+    await translate(LLMResultCache(memory_size=4, store=store), claude, short, ttl=0.2)
+    print(f"expiry: entry past its TTL -> {'regenerated' if claude.calls == calls + 1 else 'served stale'}")
+    ok &= claude.calls == calls + 1
+
+    small = LLMResultCache(memory_size=5)
+    for text, language in pairs:
+        await translate(small, claude, params(text, language))
+    print(f"lru: {distinct} entries into a 5-entry memory tier -> size {small.memory.stats()['size']}, "
+          f"evictions {small.memory.stats()['evictions']}")
+    ok &= small.memory.stats()['size'] == 5
+
+    repo.shutdown()
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--distinct', type=int, default=20)
+    parser.add_argument('--llm', type=float, default=0.02, help="Seconds per fake Claude call")
+    parser.add_argument('--latency', type=float, default=0.002, help="Firestore round trip (s)")
+    args = parser.parse_args()
+
+    ok = asyncio.run(run(args.requests, args.distinct, args.llm, args.latency))
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
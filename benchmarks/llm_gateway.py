@@ -0,0 +1,133 @@
+"""
+LLM gateway behaviour against a scripted fake Claude API.
+
+Runs a local HTTP server that answers /v1/messages from a script of status
+codes, and points the gateway's client at it:
+  transient - 429 (Retry-After: 0.2) twice, then 200: the call succeeds after
+              waiting out the Retry-After both times
+  outage    - 529 on every request: the breaker opens after the threshold and
+              later calls fail fast; compared with a default SDK client, which
+              retries each call itself
+  recovery  - after the reset period one trial call goes through and, when it
+              succeeds, closes the breaker
+
+Exits non-zero if the gateway does not behave as described. Run from the repo root:
+    python -m benchmarks.llm_gateway
+"""
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import anthropic
+
+from api_v2.core.admission import AdmissionController
+from api_v2.core.llm_gateway import CircuitBreaker, CircuitOpenError, LLMGateway, RetryPolicy
+
+MESSAGE = {
+    "id": "msg_fake", "type": "message", "role": "assistant", "model": "fake",
+    "content": [{"type": "text", "text": "ok"}], "stop_reason": "end_turn", "stop_sequence": None,
+    "usage": {"input_tokens": 1, "output_tokens": 1}
+}
+PARAMS = dict(model="fake", max_tokens=10, messages=[{"role": "user", "content": "hi"}])
+
+
+class FakeAPI(BaseHTTPRequestHandler):
+    script = []  # status codes to answer with, then 200
+    requests = 0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        FakeAPI.requests += 1
+        status = FakeAPI.script.pop(0) if FakeAPI.script else 200
+        body = MESSAGE if status == 200 else {"type": "error", "error": {"type": "overloaded_error", "message": "busy"}}
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        if status == 429:
+            self.send_header('Retry-After', '0.2')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def gateway(base_url: str, threshold: int, reset_seconds: float) -> LLMGateway:
+    llm = LLMGateway(
+        'test-key', RetryPolicy(3, 0.05, 1.0), CircuitBreaker(threshold, reset_seconds), AdmissionController(8, 32)
+    )
+    llm.client = anthropic.AsyncAnthropic(api_key='test-key', base_url=base_url, max_retries=0)
+    return llm
+
+
+def script(*codes):
+    FakeAPI.script = list(codes)
+    FakeAPI.requests = 0
+
+
+async def timed(coro):
+    start = time.perf_counter()
+    try:
+        await coro
+        outcome = 'ok'
+    except CircuitOpenError:
+        outcome = 'circuit open'
+    except anthropic.APIStatusError as e:
+        outcome = f"HTTP {e.status_code}"
+    return outcome, (time.perf_counter() - start) * 1000
+
+
+async def run(base_url: str, calls: int) -> bool:
+    ok = True
+
+    print("transient: 429, 429, 200")
+    llm = gateway(base_url, threshold=3, reset_seconds=1.0)
+    script(429, 429)
+    outcome, ms = await timed(llm.create('test', **PARAMS))
+    print(f"  gateway : {outcome} after {FakeAPI.requests} requests in {ms:.0f}ms  {llm.stats()['endpoints']}")
+    ok &= outcome == 'ok' and FakeAPI.requests == 3 and ms >= 400
+
+    print(f"outage: every request 529, {calls} calls")
+    llm = gateway(base_url, threshold=3, reset_seconds=1.0)
+    default = anthropic.AsyncAnthropic(api_key='test-key', base_url=base_url)
+    failed_fast = {}
+    for label, call in (('gateway', lambda: llm.create('test', **PARAMS)),
+                        ('sdk', lambda: default.messages.create(**PARAMS))):
+        script(*([529] * 10_000))
+        results = [await timed(call()) for _ in range(calls)]
+        fast = [ms for outcome, ms in results if outcome == 'circuit open']
+        failed_fast[label] = len(fast)
+        print(f"  {label:<8}: {FakeAPI.requests} upstream requests, total {sum(ms for _, ms in results):.0f}ms, "
+              f"{len(fast)} failed fast" + (f" (max {max(fast):.2f}ms)" if fast else ''))
+    ok &= failed_fast['gateway'] == calls - 3 and llm.stats()['circuit_breaker']['times_opened'] == 1
+
+    print("recovery: wait for the reset period, upstream healthy again")
+    script()
+    await asyncio.sleep(1.05)
+    outcome, ms = await timed(llm.create('test', **PARAMS))
+    print(f"  gateway : trial call {outcome} in {ms:.0f}ms, breaker {llm.breaker.state}")
+    ok &= outcome == 'ok' and llm.breaker.state == 'closed'
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--calls', type=int, default=10)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeAPI)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    ok = asyncio.run(run(f"http://127.0.0.1:{server.server_port}", args.calls))
+    server.shutdown()
+
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
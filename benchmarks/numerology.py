@@ -0,0 +1,148 @@
+"""
+Daily numerology insight: a Claude round trip vs the local numerology engine.
+
+A fake Claude takes --llm seconds per insight, as get_numerology_insight
+used to. Checks:
+  reduction    - digit reduction keeps 11, 22 and 33, and every day over
+                 --years years reduces to the old digital root unless it is
+                 a master day
+  catalog      - every language in LANGUAGE_NAMES has every number and
+                 template, and every (core, day) combination renders with
+                 no placeholder left, the same text each time
+  latency      - --insights insights from the engine vs the fake Claude
+  reading      - a daily reading built from an interpretation without a
+                 numerology section gets the engine's section in the
+                 seeker's language, and its prompt carries the core number
+
+Exits non-zero if any check fails. Run from the repo root:
+    python -m benchmarks.numerology --insights 2000 --llm 0.05
+"""
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from api_v2.utils.cosmic_utils import LANGUAGE_NAMES
+from api_v2.utils.numerology import (
+    INSIGHT_TEMPLATES,
+    MASTER_NUMBERS,
+    NUMBER_MEANINGS,
+    NumerologyEngine,
+    date_number,
+    reduce_number
+)
+from api_v2.services.reading_service import ReadingService
+from benchmarks.reading_slo import FakeClaude
+
+NUMBERS = sorted(NUMBER_MEANINGS)
+
+
+def check_reduction(years: int) -> bool:
+    known = {29: 11, 38: 11, 1999: 1, 33: 33, 44: 8, 7: 7, 1010: 2}
+    reduced = {n: reduce_number(n) for n in known}
+    ok = reduced == known
+
+    day = date(2000, 1, 1)
+    masters = mismatches = 0
+    for _ in range(years * 365):
+        number = date_number(day)
+        digital_root = 1 + (day.year * 10000 + day.month * 100 + day.day - 1) % 9
+        if number in MASTER_NUMBERS:
+            masters += 1
+            mismatches += 1 + (number - 1) % 9 != digital_root
+        else:
+            mismatches += number != digital_root
+        day += timedelta(days=1)
+    print(f"reduction: {reduced}")
+    print(f"  {years * 365} days: {masters} master days, {mismatches} disagree with the digital root")
+    return ok and masters > 0 and mismatches == 0
+
+
+def check_catalog(engine: NumerologyEngine) -> bool:
+    ok = True
+    for code in LANGUAGE_NAMES:
+        entry = engine.catalog.get(code, {})
+        missing = (set(INSIGHT_TEMPLATES) - set(entry.get('templates', {}))) | (
+            {str(n) for n in NUMBERS} - set(entry.get('numbers', {}))
+        )
+        leftovers = 0
+        for core in NUMBERS:
+            # One personal number that is already reduced gives this core
+            for day in NUMBERS:
+                insight = engine.reading({'favoriteNumber': str(core)}, day, code)['insight']
+                leftovers += '{' in insight or insight != engine.reading({'favoriteNumber': core}, day, code)['insight']
+        print(f"catalog: {code} - {len(missing)} missing entries, {leftovers} bad renders")
+        ok &= not missing and not leftovers
+    return ok
+
+
+async def check_latency(engine: NumerologyEngine, insights: int, llm: float) -> bool:
+    rng = random.Random(25)
+    requests = [
+        ({key: str(rng.randint(1, 99)) for key in ('favoriteNumber', 'luckyNumber', 'guidanceNumber')},
+         rng.choice(NUMBERS), rng.choice(list(LANGUAGE_NAMES)))
+        for _ in range(insights)
+    ]
+
+    claude = FakeClaude(llm)
+    sample = max(insights // 100, 1)
+    start = time.perf_counter()
+    for _ in range(sample):
+        await claude.create('legacy_numerology')
+    per_call = (time.perf_counter() - start) / sample
+
+    start = time.perf_counter()
+    for numbers, day, language in requests:
+        engine.reading(numbers, day, language)
+    per_insight = (time.perf_counter() - start) / insights
+
+    print(f"latency: Claude {per_call * 1000:.1f}ms per insight ({sample} calls), "
+          f"engine {per_insight * 1e6:.1f}µs per insight ({insights} insights) - "
+          f"{per_call * insights:.1f}s of Claude time saved")
+    return per_insight * 100 < per_call
+
+
+def check_reading() -> bool:
+    service = ReadingService(None, None)
+    user = {
+        'name': 'Georgie',
+        'zodiacSign': 'Libra',
+        'language': 'ka',
+        'preferences': {'numbers': {'favoriteNumber': '7', 'luckyNumber': '13', 'guidanceNumber': '22'}}
+    }
+    prepared = service._prepare_daily_reading(user, datetime(2026, 10, 18))
+    interpretation = "[CARD_READING]\ncard\n[/CARD_READING]\n\n[DAILY_AFFIRMATION]\naffirmation\n[/DAILY_AFFIRMATION]"
+    reading = service._build_daily_result(prepared, interpretation)
+    numerology = prepared['numerology']
+    print(f"reading: numbers {numerology['numbers']} -> core {numerology['core']}, day {numerology['day']} "
+          f"({numerology['relation']}); sections {list(reading['sections'])}")
+    print(f"  {reading['sections'].get('NUMEROLOGY_INSIGHT')}")
+    return (
+        list(reading['sections']) == ['CARD_READING', 'NUMEROLOGY_INSIGHT', 'DAILY_AFFIRMATION']
+        and reading['sections']['NUMEROLOGY_INSIGHT'] == numerology['insight']
+        and f"core number {numerology['core']}" in prepared['prompt']
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--insights', type=int, default=2000)
+    parser.add_argument('--llm', type=float, default=0.05, help="Seconds per fake Claude insight")
+    parser.add_argument('--years', type=int, default=50)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    engine = NumerologyEngine()
+    ok = check_reduction(args.years)
+    ok &= check_catalog(engine)
+    ok &= asyncio.run(check_latency(engine, args.insights, args.llm))
+    ok &= check_reading()
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
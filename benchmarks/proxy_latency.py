@@ -0,0 +1,150 @@
+"""
+Latency of /api calls through the Flask proxy (app.py) vs calling FastAPI directly.
+
+A local stand-in upstream answers JSON with a fixed delay and streams an SSE
+endpoint. Compares:
+  direct        - client -> upstream
+  legacy proxy  - the old per-call requests.post/get proxy (no pooling, buffered)
+  pooled proxy  - app.api_proxy (keep-alive pool, streamed)
+
+Run from the repo root:
+    python -m benchmarks.proxy_latency --requests 300 --upstream-delay 0.005
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from werkzeug.serving import make_server
+
+
+def start_upstream(delay: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def _json(self, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path.startswith('/api/stream'):
+                # SSE: 5 events, 50ms apart, chunked
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                for i in range(5):
+                    event = f"event: token\ndata: {i}\n\n".encode()
+                    self.wfile.write(f"{len(event):x}\r\n".encode() + event + b"\r\n")
+                    self.wfile.flush()
+                    time.sleep(0.05)
+                self.wfile.write(b"0\r\n\r\n")
+                return
+            time.sleep(delay)
+            self._json({'path': self.path, 'cards': ['The Star'] * 20})
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            time.sleep(delay)
+            self._json({'echo': payload})
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def legacy_app(upstream_url: str):
+    """The proxy as it was before: a fresh connection per call, body re-parsed"""
+    from flask import Flask, request
+
+    legacy = Flask('legacy_proxy')
+
+    @legacy.route('/api/<path:path>', methods=['GET', 'POST'])
+    def api_proxy(path):
+        fastapi_url = f'{upstream_url}/api/{path}'
+        if request.method == 'POST':
+            resp = requests.post(fastapi_url, json=request.get_json(),
+                                 headers={'Content-Type': 'application/json'})
+        else:
+            resp = requests.get(fastapi_url, params=request.args)
+        return resp.json(), resp.status_code
+
+    return legacy
+
+
+def serve(flask_app):
+    server = make_server('127.0.0.1', 0, flask_app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def measure(client: requests.Session, base: str, requests_count: int):
+    latencies = []
+    for i in range(requests_count):
+        start = time.perf_counter()
+        if i % 2:
+            response = client.post(f"{base}/api/nfc/daily_affirmation", json={'name': 'Nino', 'i': i})
+        else:
+            response = client.get(f"{base}/api/chat/history/s1", params={'limit': 20})
+        response.content
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.95)]
+
+
+def first_event(client: requests.Session, base: str) -> float:
+    start = time.perf_counter()
+    with client.get(f"{base}/api/stream", stream=True) as response:
+        next(response.iter_content(chunk_size=None))
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--upstream-delay', type=float, default=0.005, help="Upstream handler time (s)")
+    args = parser.parse_args()
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+
+    upstream = start_upstream(args.upstream_delay)
+    upstream_url = f"http://127.0.0.1:{upstream.server_port}"
+
+    os.environ['FASTAPI_URL'] = upstream_url
+    import app as frontend
+
+    targets = [
+        ('direct', upstream_url),
+        ('legacy proxy', serve(legacy_app(upstream_url))[1]),
+        ('pooled proxy', serve(frontend.app)[1]),
+    ]
+
+    client = requests.Session()
+    client.trust_env = False
+    print(f"{args.requests} sequential requests, upstream delay {args.upstream_delay * 1000:.0f}ms")
+    for label, base in targets:
+        measure(client, base, 20)  # warm up
+        p50, p95 = measure(client, base, args.requests)
+        print(f"  {label:<13}: p50 {p50 * 1000:6.2f}ms  p95 {p95 * 1000:6.2f}ms")
+
+    print("SSE first event (upstream sends one every 50ms):")
+    for label, base in (targets[0], targets[2]):
+        print(f"  {label:<13}: {first_event(client, base) * 1000:6.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
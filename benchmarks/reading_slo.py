@@ -0,0 +1,108 @@
+"""
+Reading latency SLO: quick readings when Claude is slow, full ones on the next tap.
+
+Runs ReadingService against the in-memory Firestore and a fake Claude that
+takes --llm seconds per reading. With the SLO below that, the first daily and
+three-card requests must come back near the SLO with a degraded reading of
+the same cards, the generation must finish in the background and fill the
+cache, and the next request must return the full reading. Without an SLO
+the first request waits for Claude.
+
+Exits non-zero if any check fails. Run from the repo root:
+    python -m benchmarks.reading_slo --llm 1.0 --slo 0.2
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+from api_v2.core.llm_metrics import reading_fallbacks
+from api_v2.core.loader import request_scope
+from api_v2.core.profile_cache import UserProfileCache
+from api_v2.core.repository import FirestoreRepository
+from api_v2.services.reading_service import ReadingService
+from benchmarks.fake_firestore import FakeFirestore
+
+
+class FakeClaude:
+    """Stands in for the LLM gateway: every reading takes `seconds`"""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.calls = 0
+
+    async def create(self, endpoint: str, **params):
+        self.calls += 1
+        await asyncio.sleep(self.seconds)
+        text = "[PAST]\nfull\n[/PAST]" if endpoint == 'three_card' else "[CARD_READING]\nfull\n[/CARD_READING]"
+        usage = type('Usage', (), {'input_tokens': 1, 'output_tokens': 1})()
+        return type('Message', (), {'content': [type('Block', (), {'text': text})()], 'usage': usage})()
+
+
+def cards(reading):
+    return reading.get('cardNames') or [reading['cardName']]
+
+
+async def tap(service: ReadingService, repo, kind: str, nfc_id: str, user: dict):
+    start = time.perf_counter()
+    with request_scope(repo):
+        if kind == 'daily':
+            reading = await service.generate_daily_reading({**user, 'nfc_id': nfc_id})
+        else:
+            reading = await service.generate_three_card_reading(nfc_id)
+    return reading, time.perf_counter() - start
+
+
+async def scenario(service: ReadingService, repo, kind: str, nfc_id: str, user: dict, llm: float, slo: float) -> bool:
+    first, first_seconds = await tap(service, repo, kind, nfc_id, user)
+    await asyncio.gather(*service._background)
+    second, second_seconds = await tap(service, repo, kind, nfc_id, user)
+    print(f"  {kind:<10} first {first_seconds * 1000:6.0f}ms degraded={first.get('degraded', False)!s:<5} "
+          f"next {second_seconds * 1000:6.0f}ms cached={second['cached']!s:<5} cards {cards(first)}")
+    if not slo:
+        return not first.get('degraded') and first_seconds >= llm
+    return (
+        first.get('degraded') is True
+        and first_seconds < min(slo * 2, llm)
+        and cards(first) == cards(second)
+        and second['cached'] and not second.get('degraded')
+    )
+
+
+async def run(llm: float, slo: float) -> bool:
+    db = FakeFirestore(latency=0)
+    user = {'name': 'Georgie', 'zodiacSign': 'Libra', 'language': 'en', 'preferences': {}}
+    for label in ('slo', 'wait'):
+        db.collection('nfc_users').document(f"nfc_{label}").set({**user, 'nfc_id': f"nfc_{label}"})
+    repo = FirestoreRepository(db, max_workers=4)
+    service = ReadingService(repo, UserProfileCache(repo))
+    service.llm = FakeClaude(llm)
+    service.lease = None
+
+    ok = True
+    for label, seconds in (('slo', slo), ('wait', 0)):
+        print(f"{label}: Claude {llm * 1000:.0f}ms, SLO {seconds * 1000:.0f}ms" if seconds else
+              f"{label}: Claude {llm * 1000:.0f}ms, no SLO")
+        service.slo_seconds = {'daily': seconds, 'three_card': seconds}
+        for kind in ('daily', 'three_card'):
+            ok &= await scenario(service, repo, kind, f"nfc_{label}", user, llm, seconds)
+    print(f"fallbacks: {reading_fallbacks.stats()}")
+    repo.shutdown()
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--llm', type=float, default=1.0, help="Seconds per fake Claude reading")
+    parser.add_argument('--slo', type=float, default=0.2)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    ok = asyncio.run(run(args.llm, args.slo))
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
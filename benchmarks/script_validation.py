@@ -0,0 +1,78 @@
+"""
+Reading language check: the old per-call character sets vs compiled ranges.
+
+  legacy    - get_language_config as it was: build a set of every character
+              in the script's ranges on each call, intersect with set(text.lower())
+  compiled  - api_v2.utils.script_validation (ranges merged once, bisected)
+
+Checks that both agree on every sample (including English text, which
+must fail). Exits non-zero on a disagreement.
+
+Run from the repo root:
+    python -m benchmarks.script_validation --repeat 5
+"""
+import argparse
+import sys
+import timeit
+
+from api_v2.utils.script_validation import SCRIPT_RANGES, get_validator
+
+# (language, script, min_chars, a reading-sized response)
+SAMPLES = [
+    ('ka', 'georgian', 10,
+     "[CARD_READING]\nვარსკვლავი ანათებს თქვენს გზას, მოაქვს იმედი და განახლება. "
+     "ენდეთ, რომ თქვენ გიძღვებათ განკურნებისა და შთაგონებისკენ. დღეს ღია იყავით "
+     "ახალი შესაძლებლობების მიმართ და მოუსმინეთ თქვენს შინაგან ხმას.\n[/CARD_READING]\n\n"
+     "[DAILY_AFFIRMATION]\nმე ვენდობი ჩემს წინ გადაშლილ გზას.\n[/DAILY_AFFIRMATION]"),
+    ('ja', 'japanese', 5,
+     "[CARD_READING]\n星のカードはあなたの道を照らし、希望と再生をもたらします。"
+     "あなたは癒しとインスピレーションへと導かれていることを信じてください。"
+     "今日は新しい可能性に心を開き、内なる声に耳を傾けましょう。\n[/CARD_READING]\n\n"
+     "[DAILY_AFFIRMATION]\n私は目の前に広がる道を信頼します。\n[/DAILY_AFFIRMATION]"),
+    ('zh', 'chinese', 5,
+     "[CARD_READING]\n星星牌照亮你的道路，带来希望与新生。相信你正被引导走向疗愈与灵感。"
+     "今天请向新的可能性敞开心扉，倾听你内心的声音。\n[/CARD_READING]\n\n"
+     "[DAILY_AFFIRMATION]\n我信任在我面前展开的道路，欢迎神圣的指引。\n[/DAILY_AFFIRMATION]"),
+    ('ka (English reply)', 'georgian', 10,
+     "[CARD_READING]\nThe Star shines upon your path, bringing hope and renewal. Trust that "
+     "you are being guided toward healing and inspiration.\n[/CARD_READING]"),
+]
+
+
+def legacy_is_valid(text: str, script: str, min_chars: int) -> bool:
+    chars = set()
+    for start, end in SCRIPT_RANGES[script]:
+        chars.update(chr(i) for i in range(start, end + 1))
+    return len(chars.intersection(set(text.lower()))) >= min_chars
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5, help="Concatenate each sample this many times")
+    parser.add_argument('--number', type=int, default=200)
+    args = parser.parse_args()
+
+    ok = True
+    print(f"Per response ({args.number} runs each, samples x{args.repeat}):")
+    for label, script, min_chars, sample in SAMPLES:
+        text = sample * args.repeat
+        validator = get_validator(script, min_chars)
+        results = (
+            legacy_is_valid(text, script, min_chars),
+            validator.is_valid(text),
+        )
+        ok = ok and len(set(results)) == 1
+        timings = [
+            timeit.timeit(lambda: legacy_is_valid(text, script, min_chars), number=args.number),
+            timeit.timeit(lambda: validator.is_valid(text), number=args.number),
+        ]
+        legacy, compiled = (t / args.number * 1e6 for t in timings)
+        print(f"  {label:<20} {len(text):5} chars  legacy {legacy:8.1f}us  compiled {compiled:6.1f}us  "
+              f"valid={results[1]}  agree={len(set(results)) == 1}")
+
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Two-server layout (Flask app.py + proxy -> uvicorn) vs single-process mode (SERVE_FRONTEND).
+
+Starts both layouts as real processes, then compares resident memory after
+startup and p50 latency of the page, a static file, /health and an /api call
+that does not touch Firestore (create_poster without a key -> 401).
+
+Needs the same environment as the app (FIREBASE_CREDENTIALS). Linux only (reads
+/proc for memory). Run from the repo root:
+    python -m benchmarks.single_process --requests 200
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import requests
+
+PATHS = [
+    ('GET', '/'),
+    ('GET', '/static/css/00-base/reset.css'),
+    ('GET', '/health'),
+    ('POST', '/api/admin/create_poster'),
+]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start(args, env_overrides) -> subprocess.Popen:
+    env = dict(os.environ, **env_overrides)
+    return subprocess.Popen(args, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def uvicorn(port: int, **env) -> subprocess.Popen:
+    return start([sys.executable, '-m', 'uvicorn', 'api_v2.main:app',
+                  '--host', '127.0.0.1', '--port', str(port), '--log-level', 'warning'], env)
+
+
+def wait_ready(base: str, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"{base}/health", timeout=1).ok:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"{base} did not start")
+
+
+def rss_mb(processes) -> float:
+    total = 0
+    for process in processes:
+        with open(f"/proc/{process.pid}/status") as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    total += int(line.split()[1])
+    return total / 1024
+
+
+def p50_ms(client: requests.Session, base: str, method: str, path: str, count: int) -> float:
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        client.request(method, f"{base}{path}").content
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=200)
+    args = parser.parse_args()
+
+    api_port, flask_port, single_port = free_port(), free_port(), free_port()
+    layouts = {
+        'two servers': [
+            uvicorn(api_port),
+            start([sys.executable, 'app.py'], {
+                'PORT': str(flask_port),
+                'FASTAPI_URL': f"http://127.0.0.1:{api_port}"
+            }),
+        ],
+        'single process': [uvicorn(single_port, SERVE_FRONTEND='true')],
+    }
+    bases = {
+        'two servers': f"http://127.0.0.1:{flask_port}",
+        'single process': f"http://127.0.0.1:{single_port}",
+    }
+
+    try:
+        wait_ready(f"http://127.0.0.1:{api_port}")
+        for base in bases.values():
+            wait_ready(base)
+
+        client = requests.Session()
+        client.trust_env = False
+        results = {}
+        for layout, base in bases.items():
+            for method, path in PATHS:
+                p50_ms(client, base, method, path, 10)  # warm up
+            results[layout] = (
+                rss_mb(layouts[layout]),
+                [p50_ms(client, base, method, path, args.requests) for method, path in PATHS]
+            )
+    finally:
+        for processes in layouts.values():
+            for process in processes:
+                process.terminate()
+                process.wait()
+
+    print(f"{'':<16}{'RSS':>9}" + ''.join(f"{path:>32}" for _, path in PATHS))
+    for layout, (rss, latencies) in results.items():
+        print(f"{layout:<16}{rss:7.0f}MB" + ''.join(f"{ms:30.2f}ms" for ms in latencies))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Static asset bytes and latency: Flask's send_from_directory vs the precompressed layer.
+
+Fetches every local JS/CSS file react.html references, first cold (full
+responses) and then as a repeat visit (If-None-Match with the ETag from the
+first load), through:
+  legacy   - send_from_directory (the previous app.py static route)
+  layer    - core/static_files.py via app.py (br/gzip siblings, startup ETags)
+
+Run `python -m api_v2.jobs.compress_static` first, then from the repo root:
+    python -m benchmarks.static_files --rounds 20
+"""
+import argparse
+import logging
+import re
+import statistics
+import threading
+import time
+
+import requests
+from werkzeug.serving import make_server
+
+ASSET = re.compile(r"""(?:src|href)=["'](?:\{\{ url_for\('static', filename='([^']+)'\) \}\}|/static/([^"']+))""")
+
+
+def page_assets():
+    with open('templates/react.html', encoding='utf-8') as f:
+        html = f.read()
+    return [a or b for a, b in ASSET.findall(html) if (a or b).endswith(('.js', '.css'))]
+
+
+def legacy_app():
+    from flask import Flask, send_from_directory
+
+    legacy = Flask('legacy_static', static_folder=None)
+
+    @legacy.route('/static/<path:path>')
+    def serve_static(path):
+        return send_from_directory('static', path)
+
+    return legacy
+
+
+def serve(flask_app):
+    server = make_server('127.0.0.1', 0, flask_app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+def visit(client, base, assets, etags=None):
+    """Load every asset once -> (wire bytes, seconds, etags)"""
+    total, seen = 0, {}
+    start = time.perf_counter()
+    for asset in assets:
+        headers = {'Accept-Encoding': 'br, gzip'}
+        if etags and etags.get(asset):
+            headers['If-None-Match'] = etags[asset]
+        response = client.get(f"{base}/static/{asset}", headers=headers, stream=True)
+        total += len(response.raw.read(decode_content=False))
+        seen[asset] = response.headers.get('ETag')
+    return total, time.perf_counter() - start, seen
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+
+    import app as frontend
+    assets = page_assets()
+    targets = [('legacy', serve(legacy_app())), ('layer', serve(frontend.app))]
+
+    client = requests.Session()
+    client.trust_env = False
+    print(f"{len(assets)} JS/CSS files referenced by react.html, {args.rounds} rounds")
+    for label, base in targets:
+        cold, warm = [], []
+        for _ in range(args.rounds):
+            cold_bytes, seconds, etags = visit(client, base, assets)
+            cold.append(seconds)
+            warm_bytes, seconds, _ = visit(client, base, assets, etags)
+            warm.append(seconds)
+        print(f"  {label:<7}: first visit {cold_bytes / 1024:7.1f} KB in {statistics.median(cold) * 1000:6.1f}ms"
+              f"  | repeat visit {warm_bytes / 1024:6.1f} KB in {statistics.median(warm) * 1000:6.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+TarotDeck: lookup/draw cost and a concurrency stress check.
+
+  legacy  - the previous deck: draw shuffles the shared card list in place and
+            slices it, get_card_by_name scans the list with .lower()
+  current - api_v2.utils.tarot_cards.TarotDeck (immutable, indexed, sampled)
+
+The stress check draws from one shared deck on many threads at once (with a
+tiny GIL switch interval to force interleaving) and verifies that every draw
+has distinct cards, the registry is unchanged, and each position is uniform
+over the deck (chi-square, p = 0.001). Exits non-zero if the current deck fails.
+
+Run from the repo root:
+    python -m benchmarks.tarot_deck --threads 16 --draws 20000
+"""
+import argparse
+import logging
+import random
+import sys
+import threading
+import timeit
+from collections import Counter
+
+from api_v2.utils.tarot_cards import MAJOR_ARCANA, TarotDeck
+
+# Chi-square critical values at p = 0.001, by degrees of freedom
+CHI2_CRITICAL = {21: 46.797}
+
+
+class LegacyDeck:
+    """The deck as it was: one shared list, shuffled in place on every draw"""
+
+    def __init__(self):
+        self.cards = MAJOR_ARCANA.copy()
+        self.current_spread = []
+
+    def draw_cards(self, count: int = 1):
+        random.shuffle(self.cards)
+        drawn_cards = self.cards[:count]
+        self.current_spread = drawn_cards
+        return drawn_cards
+
+    def get_card_by_name(self, name: str):
+        return next((card for card in self.cards if card["name"].lower() == name.lower()), None)
+
+
+def micro(deck, rounds: int):
+    names = [card['name'] for card in MAJOR_ARCANA]
+    lookup = timeit.timeit(lambda: [deck.get_card_by_name(name) for name in names], number=rounds)
+    draw = timeit.timeit(lambda: deck.draw_cards(3), number=rounds * len(names))
+    return lookup / (rounds * len(names)) * 1e9, draw / (rounds * len(names)) * 1e9
+
+
+def stress(deck, threads: int, draws: int):
+    """-> (draws with repeated cards, spreads clobbered by another thread, per-position Counters, unchanged)"""
+    before = list(deck.cards)
+    duplicates = clobbered = 0
+    positions = [Counter() for _ in range(3)]
+    lock = threading.Lock()
+    start = threading.Barrier(threads)
+
+    def worker():
+        nonlocal duplicates, clobbered
+        local_dupes = local_clobbered = 0
+        local = [Counter() for _ in range(3)]
+        start.wait()
+        for _ in range(draws):
+            drawn = deck.draw_cards(3)
+            names = [card['name'] for card in drawn]
+            if len(set(names)) != 3:
+                local_dupes += 1
+            if getattr(deck, 'current_spread', drawn) is not drawn:
+                local_clobbered += 1
+            for position, name in enumerate(names):
+                local[position][name] += 1
+        with lock:
+            duplicates += local_dupes
+            clobbered += local_clobbered
+            for total, part in zip(positions, local):
+                total.update(part)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    unchanged = isinstance(deck, TarotDeck) and list(deck.cards) == before
+    return duplicates, clobbered, positions, unchanged
+
+
+def chi_square(counts: Counter, total: int, size: int) -> float:
+    expected = total / size
+    return sum((counts.get(card['name'], 0) - expected) ** 2 / expected for card in MAJOR_ARCANA)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--draws', type=int, default=20000, help="Draws per thread")
+    parser.add_argument('--rounds', type=int, default=2000)
+    args = parser.parse_args()
+    logging.getLogger('api_v2.utils.tarot_cards').setLevel(logging.WARNING)
+
+    decks = [('legacy', LegacyDeck()), ('current', TarotDeck())]
+    print("Per call:")
+    for label, deck in decks:
+        lookup_ns, draw_ns = micro(deck, args.rounds)
+        print(f"  {label:<8}: get_card_by_name {lookup_ns:6.0f}ns  draw_cards(3) {draw_ns:6.0f}ns")
+
+    total = args.threads * args.draws
+    critical = CHI2_CRITICAL[len(MAJOR_ARCANA) - 1]
+    print(f"Stress: {args.threads} threads x {args.draws} draws of 3 on one shared deck")
+    ok = True
+    for label, deck in decks:
+        duplicates, clobbered, positions, unchanged = stress(deck, args.threads, args.draws)
+        chi = [chi_square(counts, total, len(MAJOR_ARCANA)) for counts in positions]
+        uniform = all(value < critical for value in chi)
+        print(f"  {label:<8}: repeated card {duplicates}/{total}  shared spread clobbered {clobbered}/{total}  "
+              f"chi2 per position {', '.join(f'{value:.1f}' for value in chi)} (< {critical}: {uniform})"
+              + (f"  registry unchanged: {unchanged}" if label == 'current' else ''))
+        if label == 'current':
+            ok = duplicates == 0 and uniform and unchanged
+
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
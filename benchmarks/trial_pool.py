@@ -0,0 +1,91 @@
+"""
+Anonymous trial readings: a fresh Claude call per visitor vs the ready pool.
+
+A fake Claude takes --llm seconds per reading. A burst of --visitors trial
+readings arrives (an event crowd scanning the poster), first without the
+pool, then with a pool warmed at startup. Checks that pooled readings come
+back without waiting for Claude, that the pool refills in the background
+after falling to its low watermark and never exceeds its size, and that a
+change of moon phase/season drops readings made for the old one.
+
+Exits non-zero if any check fails. Run from the repo root:
+    python -m benchmarks.trial_pool --visitors 12 --llm 0.5
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+
+from api_v2.core.reading_pool import ReadingPool
+from api_v2.services.reading_service import ReadingService
+from benchmarks.reading_slo import FakeClaude
+
+
+async def visit(service: ReadingService) -> float:
+    start = time.perf_counter()
+    await service.generate_trial_three_card_reading()
+    return time.perf_counter() - start
+
+
+async def settle(pool: ReadingPool):
+    while pool._tasks:
+        await asyncio.gather(*pool._tasks)
+
+
+async def run(visitors: int, llm: float, size: int, low: int) -> bool:
+    service = ReadingService(None, None)
+    service.llm = FakeClaude(llm)
+    ok = True
+
+    service.trial_pool = ReadingPool(service._generate_pooled_trial_reading, service._trial_pool_key, 0, 0)
+    fresh = [await visit(service) for _ in range(visitors)]
+
+    service.trial_pool = pool = ReadingPool(
+        service._generate_pooled_trial_reading, service._trial_pool_key, size, low, concurrency=2
+    )
+    pool.top_up()
+    await settle(pool)
+    warm = pool.stats()['ready']
+    peak = 0
+    pooled = []
+    for _ in range(visitors):
+        pooled.append(await visit(service))
+        peak = max(peak, pool.stats()['ready'] + pool.stats()['generating'])
+        # Visitors arrive a little faster than Claude refills
+        await asyncio.sleep(llm / 3)
+    hits = pool.stats()['hits']
+    await settle(pool)
+
+    for label, latencies in (('fresh call', fresh), ('pool', pooled)):
+        print(f"  {label:<10}: p50 {statistics.median(latencies) * 1000:7.1f}ms  "
+              f"max {max(latencies) * 1000:7.1f}ms over {visitors} visitors")
+    print(f"  pool warmed to {warm}/{size}, {hits} hits, peak {peak}, after the burst: {pool.stats()}")
+    ok &= warm == size and hits > size and peak <= size and pool.stats()['ready'] == size
+    ok &= statistics.median(pooled) < llm / 10
+
+    pool.context_key = lambda: ('Full Moon', 'Winter')
+    reading = pool.pop()
+    print(f"  context change: pop -> {reading is not None}, discarded {pool.stats()['discarded']}")
+    ok &= reading is None and pool.stats()['discarded'] == size
+    await settle(pool)
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--visitors', type=int, default=12)
+    parser.add_argument('--llm', type=float, default=0.5, help="Seconds per fake Claude reading")
+    parser.add_argument('--size', type=int, default=6)
+    parser.add_argument('--low-watermark', type=int, default=2)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    ok = asyncio.run(run(args.visitors, args.llm, args.size, args.low_watermark))
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
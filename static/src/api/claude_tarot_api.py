@@ -1,16 +1,16 @@
 import os
-from anthropic import Anthropic
 from datetime import datetime
 import logging
 from typing import Dict, List, Optional, Any
 from typing import Dict, List, Optional, Any, TypedDict
 from .tarot_cards import get_random_cards 
 from .language_config import get_language_config
+from api_v2.core.llm_gateway import get_sync_llm_gateway
+from api_v2.utils.numerology import date_number, get_numerology_engine
+from api_v2.utils.reading_sections import parse_sections
 from.cosmic_utils import calculate_moon_phase, get_current_season, calculate_numerology_day, get_day_energy
 import time
 
-client = Anthropic()
-
 class ColorDict(TypedDict):
     name: str
     value: str
@@ -304,132 +304,48 @@ class ClaudeTarotAPI:
             if not api_key:
                 raise ValueError("API key is required")
                 
-            self.client = Anthropic(api_key=api_key)
+            # Shared gateway: pooled client, timeouts, retries, circuit breaker
+            self.llm = get_sync_llm_gateway(api_key)
             self.model = "claude-3-5-sonnet-20241022"
             logger.info("Claude API initialized successfully")
         except Exception as e:
-            logger.error(f"Error initializing Anthropic client: {e}")
+            logger.error(f"Error initializing Claude gateway: {e}")
             raise
 
-    def get_language_config(iso_code: str) -> dict:
-        """Get comprehensive language configuration.
+    # Shared with language_config (script validators are compiled once there)
+    get_language_config = staticmethod(get_language_config)
+
+    def validate_reading_response(self, text: str, language: str) -> str:
+        """Enhanced validation with proper script checking"""
+        if not text:
+            logger.warning("Empty reading response received")
+            raise ValueError("Empty reading response")
+            
+        config = get_language_config(language)
+        logger.info(f"Validating {language} response with config: {config['claude_name']}")
         
-        Args:
-            iso_code (str): ISO language code (e.g. 'ka', 'ru', 'ko')
+        # Script validation for supported languages
+        validator = config['validator']
+        if validator:
+            matching_chars = validator.script_chars(text)
             
-        Returns:
-            dict: Language configuration including Claude name and validation settings
-        """
-        BASE_CONFIG = {
-            'en': {
-                'claude_name': 'English',
-                'script_validation': None,
-                'min_chars': 0,
-                'name': 'English'
-            },
-            'ka': {
-                'claude_name': 'Georgian', 
-                'script_validation': 'georgian',
-                'min_chars': 10,
-                'name': 'ქართული'
-            },
-            'ru': {
-                'claude_name': 'Russian',
-                'script_validation': 'cyrillic',
-                'min_chars': 10,
-                'name': 'Русский'
-            },
-            'ko': {
-                'claude_name': 'Korean',
-                'script_validation': 'hangul',
-                'min_chars': 10,
-                'name': '한국어'
-            },
-            'zh': {
-                'claude_name': 'Chinese',
-                'script_validation': 'chinese',
-                'min_chars': 5,
-                'name': '中文'
-            },
-            'ja': {
-                'claude_name': 'Japanese',
-                'script_validation': 'japanese',
-                'min_chars': 5,
-                'name': '日本語'
-            },
-            'es': {
-                'claude_name': 'Spanish',
-                'script_validation': None,
-                'min_chars': 0,
-                'name': 'Español'
-            },
-            'fr': {
-                'claude_name': 'French',
-                'script_validation': None,
-                'min_chars': 0,
-                'name': 'Français'
-            },
-            'de': {
-                'claude_name': 'German',
-                'script_validation': None,
-                'min_chars': 0,
-                'name': 'Deutsch'
-            }
-        }
-
-        # Unicode ranges for script validation
-        SCRIPT_RANGES = {
-            'georgian': [(0x10A0, 0x10FF)],  # Georgian
-            'cyrillic': [(0x0400, 0x04FF)],  # Cyrillic
-            'hangul': [(0xAC00, 0xD7AF)],    # Korean Hangul
-            'chinese': [(0x4E00, 0x9FFF)],   # Chinese
-            'japanese': [
-                (0x3040, 0x309F),  # Hiragana
-                (0x30A0, 0x30FF),  # Katakana
-                (0x4E00, 0x9FFF)   # Kanji
-            ]
-        }
-
-        def create_validation_set(script_type):
-            """Create a set of valid characters for a given script"""
-            if not script_type or script_type not in SCRIPT_RANGES:
-                return None
-                
-            chars = set()
-            for start, end in SCRIPT_RANGES[script_type]:
-                chars.update(chr(i) for i in range(start, end + 1))
-            return chars
-
-        # Get base config or default to English
-        config = BASE_CONFIG.get(iso_code.lower(), BASE_CONFIG['en'])
+            if len(matching_chars) < validator.min_chars:
+                logger.warning(
+                    f"Invalid {language} response detected - found only "
+                    f"{len(matching_chars)} script characters, minimum required: {validator.min_chars}"
+                )
+                raise ValueError(f"Invalid {language} response - insufficient script characters")
         
-        # Add validation set if script validation is specified
-        if config['script_validation']:
-            config['script_validation'] = create_validation_set(config['script_validation'])
-
-        return config
+        # Clean up any markdown or extra formatting
+        text = text.strip()
+        text = text.replace('```', '')
+        
+        return text
 
-    def get_numerology_insight(self, numbers: Dict) -> str:
-        """Generate numerology insight based on user's numbers"""
+    def get_numerology_insight(self, numbers: Dict, language: str = 'en') -> str:
+        """Numerology insight for the user's numbers and today (local engine, no Claude call)"""
         try:
-            prompt = f"""As a cosmic numerology expert, create a short, personalized insight combining the energies of these numbers:
-            - Favorite Number: {numbers.get('favoriteNumber')}
-            - Lucky Number: {numbers.get('luckyNumber')}
-            - Guidance Number: {numbers.get('guidanceNumber')}
-
-            Focus on the symbolic meaning and energy of these numbers in combination.
-            Keep the response mystical but concise (max 2 sentences).
-            Do not mention "favorite number", "lucky number", or "guidance number" in the response.
-            Instead, weave their meanings together into a unified cosmic message."""
-
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=150,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            return response.content[0].text.strip()
-
+            return get_numerology_engine().reading(numbers, date_number(datetime.now()), language)['insight']
         except Exception as e:
             logger.error(f"Error generating numerology insight: {e}")
             return "The cosmic numbers align to guide your path today."
@@ -538,7 +454,8 @@ class ClaudeTarotAPI:
                 3. Addresses their specific interests
                 4. Provides final guidance aligned with their zodiac qualities"""
 
-                response = self.client.messages.create(
+                response = self.llm.create(
+                    'legacy_three_card',
                     model=self.model,
                     max_tokens=2048,
                     messages=[{"role": "user", "content": prompt}]
@@ -643,7 +560,8 @@ class ClaudeTarotAPI:
             
             Keep each section mystical yet practical, entirely in {target_language}."""
 
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'legacy_single_card',
                 model=self.model,
                 max_tokens=1024,
                 messages=[{"role": "user", "content": prompt}]
@@ -660,41 +578,12 @@ class ClaudeTarotAPI:
             raise
 
 def extract_section(text: str, section_name: str) -> str:
-    """Extract content between section markers"""
-    start = f"[{section_name}]"
-    end = f"[/{section_name}]"
-    try:
-        return text.split(start)[1].split(end)[0].strip()
-    except:
+    """Extract content between section markers (use parse_sections for several)"""
+    content = parse_sections(text).get(section_name)
+    if content is None:
         logger.error(f"Failed to extract section {section_name}")
         return ""
-
-    def validate_reading_response(self, text: str, language: str) -> str:
-        """Enhanced validation with proper script checking"""
-        if not text:
-            logger.warning("Empty reading response received")
-            raise ValueError("Empty reading response")
-            
-        config = get_language_config(language)
-        logger.info(f"Validating {language} response with config: {config['claude_name']}")
-        
-        # Script validation for supported languages
-        if config['script_validation']:
-            text_chars = set(text.lower())
-            matching_chars = config['script_validation'].intersection(text_chars)
-            
-            if len(matching_chars) < config['min_chars']:
-                logger.warning(
-                    f"Invalid {language} response detected - found only "
-                    f"{len(matching_chars)} script characters, minimum required: {config['min_chars']}"
-                )
-                raise ValueError(f"Invalid {language} response - insufficient script characters")
-        
-        # Clean up any markdown or extra formatting
-        text = text.strip()
-        text = text.replace('```', '')
-        
-        return text
+    return content
 
     def handle_error_response(self, error: Exception, name: str, zodiac_sign: str) -> str:
         """Generate fallback interpretation for error cases"""
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 import math
 import ephem
 
@@ -6,9 +7,13 @@ def calculate_moon_phase(date=None):
     """Calculate current moon phase"""
     if date is None:
         date = datetime.now()
-        
+    return _moon_phase_for_day(date.date() if isinstance(date, datetime) else date)
+
+@lru_cache(maxsize=64)
+def _moon_phase_for_day(day):
+    """Moon phase name for a calendar day (ephem at midday) - computed once per day"""
     moon = ephem.Moon()
-    moon.compute(date)
+    moon.compute(datetime(day.year, day.month, day.day, 12))
     
     # Get illuminated percentage
     illuminated = moon.phase
@@ -49,64 +54,59 @@ def get_current_season(date=None):
     else:  # December 21 to March 20
         return "Winter"
 
+DAY_ENERGIES = {
+    'Monday': {
+        'planet': 'Moon',
+        'energy': 'intuition, emotions, and inner wisdom',
+        'focus': 'emotional healing and intuitive development'
+    },
+    'Tuesday': {
+        'planet': 'Mars',
+        'energy': 'action, courage, and determination',
+        'focus': 'initiative and breaking through obstacles'
+    },
+    'Wednesday': {
+        'planet': 'Mercury',
+        'energy': 'communication, intellect, and adaptability',
+        'focus': 'learning, writing, and social connections'
+    },
+    'Thursday': {
+        'planet': 'Jupiter',
+        'energy': 'growth, abundance, and wisdom',
+        'focus': 'expansion and spiritual development'
+    },
+    'Friday': {
+        'planet': 'Venus',
+        'energy': 'love, beauty, and harmony',
+        'focus': 'relationships and creative expression'
+    },
+    'Saturday': {
+        'planet': 'Saturn',
+        'energy': 'structure, discipline, and manifestation',
+        'focus': 'organization and long-term planning'
+    },
+    'Sunday': {
+        'planet': 'Sun',
+        'energy': 'vitality, confidence, and success',
+        'focus': 'personal power and achievement'
+    }
+}
+
 def get_day_energy(date=None):
     """Get cosmic energy for the day"""
     if date is None:
         date = datetime.now()
         
     weekday = date.strftime('%A')
-    day_energies = {
-        'Monday': {
-            'planet': 'Moon',
-            'energy': 'intuition, emotions, and inner wisdom',
-            'focus': 'emotional healing and intuitive development'
-        },
-        'Tuesday': {
-            'planet': 'Mars',
-            'energy': 'action, courage, and determination',
-            'focus': 'initiative and breaking through obstacles'
-        },
-        'Wednesday': {
-            'planet': 'Mercury',
-            'energy': 'communication, intellect, and adaptability',
-            'focus': 'learning, writing, and social connections'
-        },
-        'Thursday': {
-            'planet': 'Jupiter',
-            'energy': 'growth, abundance, and wisdom',
-            'focus': 'expansion and spiritual development'
-        },
-        'Friday': {
-            'planet': 'Venus',
-            'energy': 'love, beauty, and harmony',
-            'focus': 'relationships and creative expression'
-        },
-        'Saturday': {
-            'planet': 'Saturn',
-            'energy': 'structure, discipline, and manifestation',
-            'focus': 'organization and long-term planning'
-        },
-        'Sunday': {
-            'planet': 'Sun',
-            'energy': 'vitality, confidence, and success',
-            'focus': 'personal power and achievement'
-        }
-    }
-    return day_energies.get(weekday, {})
+    return DAY_ENERGIES.get(weekday, {})
 
 def calculate_numerology_day(date=None):
     """Calculate numerology day number"""
     if date is None:
         date = datetime.now()
         
-    # Add all numbers in date
-    day_num = sum(int(digit) for digit in date.strftime('%Y%m%d'))
-    
-    # Reduce to single digit
-    while day_num > 9:
-        day_num = sum(int(digit) for digit in str(day_num))
-        
-    return day_num
+    # Repeated digit sum of YYYYMMDD == its digital root
+    return 1 + (date.year * 10000 + date.month * 100 + date.day - 1) % 9
 
 def getLanguageForClaude(iso_code):
     """Convert ISO language code to Claude-friendly language name"""
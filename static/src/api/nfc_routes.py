@@ -12,8 +12,6 @@ import time
 from google.cloud import firestore
 from .claude_tarot_api import api_handler
 from.cosmic_utils import calculate_moon_phase, get_current_season, calculate_numerology_day, get_day_energy
-from anthropic import Anthropic
-client = Anthropic()
 
 load_dotenv()
 
@@ -187,23 +187,20 @@ MAJOR_ARCANA = [
 ]
 
 class TarotDeck:
+    """Shared, never mutated: draws sample copies, lookups use a name index"""
+
     def __init__(self):
-        self.cards = MAJOR_ARCANA.copy()
-        self.current_spread = []
+        self.cards = tuple(MAJOR_ARCANA)
+        self._by_name = {card["name"].lower(): card for card in self.cards}
         logger.info("Tarot deck initialized with %d cards", len(self.cards))
 
-    def shuffle(self) -> None:
-        random.shuffle(self.cards)
-        logger.debug("Deck shuffled")
-
     def draw_cards(self, count: int = 1) -> List[Dict]:
         try:
             if count > len(self.cards):
                 raise ValueError(f"Cannot draw {count} cards from a deck of {len(self.cards)} cards")
             
-            self.shuffle()
-            drawn_cards = self.cards[:count]
-            self.current_spread = drawn_cards
+            # Callers get copies - the shared deck is never shuffled in place
+            drawn_cards = [dict(card) for card in random.sample(self.cards, count)]
             
             logger.info(f"Drew {count} cards: {[card['name'] for card in drawn_cards]}")
             return drawn_cards
@@ -214,8 +211,7 @@ class TarotDeck:
 
     def get_card_by_name(self, name: str) -> Optional[Dict]:
         try:
-            return next((card for card in self.cards 
-                        if card["name"].lower() == name.lower()), None)
+            return self._by_name.get(name.lower())
         except Exception as e:
             logger.error(f"Error finding card {name}: {e}")
             return None
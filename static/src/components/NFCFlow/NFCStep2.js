@@ -120,36 +120,41 @@ const NFCStep2 = ({ userData, error, onError }) => {
     fetchDailyReading();
   }, [userData]);
 
-  // Parse interpretation into sections
-  const parseInterpretation = (interpretation) => {
-    if (!interpretation) return [];
+  // Reading sections - the API returns them pre-split (reading.sections);
+  // older cached readings only carry the marker-laden interpretation
+  const getSections = (reading) => {
+    if (!reading || !reading.interpretation) return [];
 
     const sections = [
       {
         id: 'reading',
         title: 'Card Reading',
         icon: '/static/icons/cards.svg',
-        regex: /\[CARD_READING\](.*?)(?=\[|$)/s
+        marker: 'CARD_READING'
       },
       {
         id: 'numerology',
         title: 'Numerology Insight',
         icon: '/static/icons/numbers.svg',
-        regex: /\[NUMEROLOGY_INSIGHT\](.*?)(?=\[|$)/s
+        marker: 'NUMEROLOGY_INSIGHT'
       },
       {
         id: 'affirmation',
         title: 'Daily Affirmation',
         icon: '/static/icons/heart.svg',
-        regex: /\[DAILY_AFFIRMATION\](.*?)(?=\[|$)/s
+        marker: 'DAILY_AFFIRMATION'
       }
     ];
 
     return sections.map(section => {
-      const match = interpretation.match(section.regex);
+      let content = reading.sections && reading.sections[section.marker];
+      if (!reading.sections) {
+        const match = reading.interpretation.match(new RegExp(`\\[${section.marker}\\](.*?)(?=\\[|$)`, 's'));
+        content = match ? match[1].trim() : '';
+      }
       return {
         ...section,
-        content: match ? match[1].trim() : ''
+        content: content || ''
       };
     }).filter(section => section.content);
   };
@@ -287,7 +292,7 @@ const NFCStep2 = ({ userData, error, onError }) => {
 
   // SUCCESS STATE - Display Reading
   if (readingData) {
-    const sections = parseInterpretation(readingData.interpretation);
+    const sections = getSections(readingData);
     const userName = userData.user_data&&name || userData.name || 'Cosmic Traveler';
 
     return React.createElement('div', { className: 'cosmic-reading-wrapper' },
@@ -310,13 +315,13 @@ const NFCStep2 = ({ userData, error, onError }) => {
           React.createElement('div', {
             className: `cosmic-card-container ${cardPulse ? 'cosmic-card-glow' : ''}`
           },
-            React.createElement('img', {
+            React.createElement(window.CardPicture, {
+              imageSet: readingData.cardImageSet,
               src: readingData.cardImage,
               alt: readingData.cardName,
               className: `cosmic-card-image ${cardPulse ? 'cosmic-card-pulse' : ''}`,
-              onError: (e) => {
+              onError: () => {
                 console.error('Image failed to load:', readingData.cardImage);
-                e.target.src = '/static/images/cards/card-back.jpg';
               }
             })
           )
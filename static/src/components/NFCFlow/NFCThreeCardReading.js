@@ -270,7 +270,8 @@ const NFCThreeCardReading = ({ userData, onError, onComplete }) => {
                   visibility: revealedCards[index] ? 'visible' : 'hidden'
                 }
               }, [
-                React.createElement('img', {
+                React.createElement(window.CardPicture, {
+                  imageSet: readingData.cardImageSets && readingData.cardImageSets[index],
                   src: cardImage,
                   alt: readingData.cardNames ? readingData.cardNames[index] : `${positions[index]} Card`,
                   style: {
@@ -279,9 +280,9 @@ const NFCThreeCardReading = ({ userData, onError, onComplete }) => {
                     objectFit: 'cover',
                     borderRadius: '10px'
                   },
-                  onError: (e) => {
+                  fallbackSrc: '/static/images/cards/fallback-card.jpg',
+                  onError: () => {
                     console.error(`Error loading card image: ${cardImage}`);
-                    e.target.src = '/static/images/cards/fallback-card.jpg';
                   }
                 })
               ])
@@ -347,19 +348,38 @@ const NFCThreeCardReading = ({ userData, onError, onComplete }) => {
           }, `Your cards: ${readingData.cardNames ? readingData.cardNames.join(', ') : 'Three cosmic forces'}`)
         ]),
         
-        // Reading interpretation
-        React.createElement('div', {
-          key: 'interpretation',
-          className: 'nfc-reading__section'
-        }, [
-          React.createElement('div', {
-            key: 'interpretation-content',
-            className: 'nfc-reading__section-content',
-            style: {
-              whiteSpace: 'pre-wrap'
-            }
-          }, readingData.interpretation || 'The cosmic forces reveal a connection between your past, present, and future. These cards suggest important energies at work in your life.')
-        ]),
+        // Reading interpretation - one block per section when the API sent them split
+        ...(readingData.sections && Object.keys(readingData.sections).length
+          ? Object.entries(readingData.sections).map(([marker, content]) =>
+              React.createElement('div', {
+                key: `section-${marker}`,
+                className: 'nfc-reading__section'
+              }, [
+                React.createElement('h3', {
+                  key: 'title',
+                  className: 'nfc-reading__section-title'
+                }, marker.charAt(0) + marker.slice(1).toLowerCase().replace(/_/g, ' ')),
+                React.createElement('div', {
+                  key: 'content',
+                  className: 'nfc-reading__section-content',
+                  style: {
+                    whiteSpace: 'pre-wrap'
+                  }
+                }, content)
+              ])
+            )
+          : [React.createElement('div', {
+              key: 'interpretation',
+              className: 'nfc-reading__section'
+            }, [
+              React.createElement('div', {
+                key: 'interpretation-content',
+                className: 'nfc-reading__section-content',
+                style: {
+                  whiteSpace: 'pre-wrap'
+                }
+              }, readingData.interpretation || 'The cosmic forces reveal a connection between your past, present, and future. These cards suggest important energies at work in your life.')
+            ])]),
         
         // Action buttons
         React.createElement('div', {
@@ -15,4 +15,46 @@ const OptimizedCardImage = ({ cardName, imagePath, className = '' }) => {
     );
   };
   
-  window.OptimizedCardImage = OptimizedCardImage;
\ No newline at end of file
+  // Responsive card art from a reading's cardImageSet / cardImageSets[i]:
+  // AVIF/WebP variants sized to the screen, blurred placeholder while loading.
+  // Falls back to the plain src (full JPEG) when the API sends no image set.
+  // On a load error it re-renders without <source>s - the browser keeps
+  // using the selected source, so swapping img.src alone does nothing -
+  // and shows fallbackSrc; onError is still called for logging.
+  const CardPicture = ({ imageSet, src, fallbackSrc = '/static/images/cards/card-back.jpg', style = {}, onError, ...imgProps }) => {
+    const [isLoaded, setIsLoaded] = React.useState(false);
+    const [failed, setFailed] = React.useState(false);
+    const set = failed ? { src: fallbackSrc } : (imageSet || { src });
+  
+    const handleError = (e) => {
+      if (onError) onError(e);
+      // Only once, so a missing fallback cannot loop
+      if (!failed) setFailed(true);
+    };
+  
+    return (
+      <picture>
+        {(set.sources || []).map(source => (
+          <source key={source.type} type={source.type} srcSet={source.srcset} sizes={set.sizes} />
+        ))}
+        <img
+          {...imgProps}
+          src={set.src || src}
+          width={set.width}
+          height={set.height}
+          decoding="async"
+          onLoad={() => setIsLoaded(true)}
+          onError={handleError}
+          style={{
+            ...style,
+            height: style.height || 'auto',
+            backgroundImage: !isLoaded && set.placeholder ? `url(${set.placeholder})` : undefined,
+            backgroundSize: 'cover'
+          }}
+        />
+      </picture>
+    );
+  };
+  
+  window.OptimizedCardImage = OptimizedCardImage;
+  window.CardPicture = CardPicture;
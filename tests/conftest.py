@@ -0,0 +1,44 @@
+"""
+Shared fixtures: the in-memory Firestore from benchmarks/ and a
+ReadingService whose Claude calls go to a fake that sleeps, then answers.
+"""
+import pytest
+
+from api_v2.core.profile_cache import UserProfileCache
+from api_v2.core.repository import FirestoreRepository
+from api_v2.services.reading_service import ReadingService
+from benchmarks.fake_firestore import FakeFirestore
+from benchmarks.reading_slo import FakeClaude
+
+USER = {'name': 'Georgie', 'zodiacSign': 'Libra', 'language': 'en', 'preferences': {}}
+
+
+@pytest.fixture
+def db():
+    return FakeFirestore(latency=0)
+
+
+@pytest.fixture
+def repo(db):
+    repository = FirestoreRepository(db, max_workers=4)
+    yield repository
+    repository.shutdown()
+
+
+@pytest.fixture
+def add_user(db):
+    """Register an NFC user; returns the userData the daily endpoint receives"""
+    def add(nfc_id: str, **fields) -> dict:
+        user = {**USER, **fields, 'nfc_id': nfc_id}
+        db.collection('nfc_users').document(nfc_id).set(user)
+        return user
+    return add
+
+
+@pytest.fixture
+def reading_service(repo):
+    service = ReadingService(repo, UserProfileCache(repo))
+    service.llm = FakeClaude(0.3)
+    service.lease = None
+    service.slo_seconds = {'daily': 0, 'three_card': 0}
+    return service
@@ -0,0 +1,66 @@
+import asyncio
+import time
+
+from api_v2.core.cache import TTLCache
+from api_v2.core.profile_cache import UserProfileCache
+
+
+def test_entries_expire_after_their_ttl():
+    cache = TTLCache(max_size=4, ttl_seconds=60)
+    cache.set('default', 1)
+    cache.set('short', 2, ttl_seconds=0.01)
+    time.sleep(0.02)
+
+    assert cache.get('default') == 1
+    assert cache.get('short') is None
+    assert cache.stats()['expirations'] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+    assert cache.stats()['evictions'] == 1
+
+
+def test_invalidate_and_clear():
+    cache = TTLCache()
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.invalidate('a')
+    assert cache.get('a') is None and cache.get('b') == 2
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_profile_cache_serves_repeats_until_invalidated(repo, db, add_user):
+    add_user('nfc_1', name='Georgie')
+    profiles = UserProfileCache(repo)
+
+    async def read_name():
+        return (await profiles.get('nfc_1'))['name']
+
+    assert asyncio.run(read_name()) == 'Georgie'
+    db.collection('nfc_users').document('nfc_1').set({'nfc_id': 'nfc_1', 'name': 'Nino'})
+    assert asyncio.run(read_name()) == 'Georgie'
+    profiles.invalidate('nfc_1')
+    assert asyncio.run(read_name()) == 'Nino'
+
+
+def test_profile_cache_returns_copies_and_skips_missing_users(repo, add_user):
+    profiles = UserProfileCache(repo)
+
+    async def main():
+        assert await profiles.get('nfc_1') is None
+        add_user('nfc_1')
+        # A fresh registration is seen at once
+        profile = await profiles.get('nfc_1')
+        profile['preferences']['color'] = 'red'
+        return await profiles.get('nfc_1')
+
+    assert asyncio.run(main())['preferences'] == {}
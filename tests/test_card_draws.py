@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from api_v2.core.config import settings
+from api_v2.core.profile_cache import UserProfileCache
+from api_v2.services.reading_service import ReadingService
+from api_v2.utils.tarot_cards import get_seeded_cards
+
+DAY = datetime(2025, 1, 31)
+
+
+def names(cards):
+    return [card['name'] for card in cards]
+
+
+def test_seeded_cards_are_a_function_of_key_and_parts():
+    draw = names(get_seeded_cards(3, 'secret', 'nfc_1', '2025-01-31', 'three_card'))
+    assert draw == names(get_seeded_cards(3, 'secret', 'nfc_1', '2025-01-31', 'three_card'))
+    assert len(set(draw)) == 3
+
+    others = [
+        names(get_seeded_cards(3, 'other secret', 'nfc_1', '2025-01-31', 'three_card')),
+        names(get_seeded_cards(3, 'secret', 'nfc_2', '2025-01-31', 'three_card')),
+        names(get_seeded_cards(3, 'secret', 'nfc_1', '2025-02-01', 'three_card')),
+    ]
+    assert any(other != draw for other in others)
+
+
+def test_every_worker_draws_the_same_spread(repo, monkeypatch):
+    monkeypatch.setattr(settings, 'SEEDED_CARD_DRAWS', True)
+    monkeypatch.setattr(settings, 'CARD_DRAW_SECRET', 'test-secret')
+    first = ReadingService(repo, UserProfileCache(repo))
+    second = ReadingService(repo, UserProfileCache(repo))
+
+    assert first.seeded_draws
+    assert names(first._draw_cards(3, 'three_card', 'nfc_1', DAY)) == \
+        names(second._draw_cards(3, 'three_card', 'nfc_1', DAY))
+    assert names(first._draw_cards(1, 'daily', 'nfc_1', DAY)) == \
+        names(get_seeded_cards(1, 'test-secret', 'nfc_1', '2025-01-31', 'daily'))
+
+
+def test_draws_are_random_without_a_secret(repo, monkeypatch):
+    monkeypatch.setattr(settings, 'SEEDED_CARD_DRAWS', True)
+    monkeypatch.setattr(settings, 'CARD_DRAW_SECRET', '')
+    service = ReadingService(repo, UserProfileCache(repo))
+
+    assert service.seeded_draws is False
+    draws = {tuple(names(service._draw_cards(3, 'three_card', 'nfc_1', DAY))) for _ in range(20)}
+    assert len(draws) > 1
@@ -0,0 +1,60 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from api_v2.core.profile_cache import UserProfileCache
+from api_v2.core.repository import FirestoreRepository
+from api_v2.services.rate_limiter_service import RateLimiterService
+
+
+def worker(db) -> RateLimiterService:
+    """One process's rate limiter: its own repository and profile cache"""
+    repo = FirestoreRepository(db, max_workers=2)
+    return RateLimiterService(repo, UserProfileCache(repo))
+
+
+def test_weekly_limit_is_seen_by_every_worker(db, add_user):
+    add_user('nfc_1')
+    first, second = worker(db), worker(db)
+
+    async def main():
+        # Both workers have the profile cached before the reading is taken
+        await first.profiles.get('nfc_1')
+        await second.profiles.get('nfc_1')
+        before = await second.check_weekly_limit('nfc_1')
+        await first.mark_weekly_reading_taken('nfc_1')
+        return before, await second.check_weekly_limit('nfc_1'), await first.check_weekly_limit('nfc_1')
+
+    before, other_worker, same_worker = asyncio.run(main())
+    assert before == (True, None)
+    assert other_worker == (False, "Weekly reading available in 7 day(s)")
+    assert same_worker == other_worker
+
+
+def test_weekly_limit_reopens_after_seven_days(db, add_user):
+    add_user('nfc_1', last_weekly_reading=datetime.now() - timedelta(days=5))
+    add_user('nfc_2', last_weekly_reading=(datetime.now() - timedelta(days=8)).isoformat())
+    limiter = worker(db)
+
+    assert asyncio.run(limiter.check_weekly_limit('nfc_1')) == (False, "Weekly reading available in 2 day(s)")
+    assert asyncio.run(limiter.check_weekly_limit('nfc_2')) == (True, None)
+
+
+def test_unknown_user_cannot_read(db):
+    limiter = worker(db)
+    assert asyncio.run(limiter.check_weekly_limit('nobody')) == (False, "User not found")
+    assert asyncio.run(limiter.check_daily_limit('nobody')) == (False, "User not found")
+
+
+def test_daily_limit_reads_the_latest_document(db, add_user):
+    add_user('nfc_1')
+    limiter = worker(db)
+
+    async def main():
+        before = await limiter.check_daily_limit('nfc_1')
+        await limiter.profiles.get('nfc_1')
+        db.collection('nfc_users').document('nfc_1').update({'last_daily_reading': datetime.now()})
+        return before, await limiter.check_daily_limit('nfc_1')
+
+    before, after = asyncio.run(main())
+    assert before == (True, None)
+    assert after[0] is False
@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+from api_v2.utils.chat_context import estimate_tokens
+from api_v2.utils.reading_prompts import (
+    CACHE_MIN_TOKENS,
+    READING_FORMATS,
+    READING_TYPES,
+    reading_prompt,
+    reading_system,
+    system_block
+)
+
+ENDPOINTS = sorted(set(READING_FORMATS) | set(READING_TYPES))
+
+
+@pytest.mark.parametrize('endpoint', ENDPOINTS)
+def test_cache_control_only_on_prefixes_long_enough_to_cache(endpoint):
+    for block in reading_system(endpoint):
+        if 'cache_control' in block:
+            assert estimate_tokens(block['text']) >= CACHE_MIN_TOKENS
+        else:
+            assert estimate_tokens(block['text']) < CACHE_MIN_TOKENS
+
+
+def test_system_block_marks_long_text():
+    assert 'cache_control' not in system_block("short")
+    assert system_block("word " * 4 * CACHE_MIN_TOKENS)['cache_control'] == {"type": "ephemeral"}
+
+
+@pytest.mark.skipif(not os.getenv('RUN_LIVE_TESTS'), reason="calls the Anthropic API (set RUN_LIVE_TESTS=1)")
+@pytest.mark.parametrize('endpoint', ENDPOINTS)
+def test_estimate_agrees_with_count_tokens(endpoint):
+    from anthropic import Anthropic
+
+    counted = Anthropic().messages.count_tokens(
+        model="claude-sonnet-4-20250514",
+        system=reading_prompt(endpoint),
+        messages=[{"role": "user", "content": "."}]
+    ).input_tokens
+    marked = any('cache_control' in block for block in reading_system(endpoint))
+    assert marked == (counted >= CACHE_MIN_TOKENS)
@@ -0,0 +1,56 @@
+import pytest
+
+from api_v2.utils.reading_sections import SectionStreamParser, parse_sections, with_sections
+
+READING = (
+    "[CARD_READING]\nThe Star shines on your path.\n[/CARD_READING]\n\n"
+    "[DAILY_AFFIRMATION]\nI trust the road ahead.\n[/DAILY_AFFIRMATION]"
+)
+
+
+def stream(text: str, size: int):
+    parser = SectionStreamParser()
+    sections = []
+    for i in range(0, len(text), size):
+        sections += parser.feed(text[i:i + size])
+    return sections + parser.close(), parser
+
+
+@pytest.mark.parametrize('size', [1, 3, 7, len(READING)])
+def test_sections_close_as_they_stream_in_any_chunking(size):
+    sections, parser = stream(READING, size)
+    assert sections == [
+        ('CARD_READING', 'The Star shines on your path.'),
+        ('DAILY_AFFIRMATION', 'I trust the road ahead.')
+    ]
+    assert parser.text == READING
+
+
+def test_section_is_pushed_before_the_stream_ends():
+    parser = SectionStreamParser()
+    assert parser.feed("[CARD_READING]\nThe Star") == []
+    assert parser.feed(" shines.\n[/CARD_READING]\n[DAILY_") == [('CARD_READING', 'The Star shines.')]
+    assert parser.feed("AFFIRMATION]\nI trust.") == []
+    assert parser.close() == [('DAILY_AFFIRMATION', 'I trust.')]
+
+
+def test_opening_markers_alone_split_sections():
+    text = "[WEEKLY_OVERVIEW]\nA calm week.\n[WEEKLY_CHALLENGE]\nRest more."
+    assert stream(text, 5)[0] == [('WEEKLY_OVERVIEW', 'A calm week.'), ('WEEKLY_CHALLENGE', 'Rest more.')]
+
+
+def test_brackets_that_are_not_markers_stay_in_the_text():
+    text = "[PAST]\nA [small] step, then [1] more.\n[/PAST]"
+    assert stream(text, 4)[0] == [('PAST', 'A [small] step, then [1] more.')]
+
+
+def test_parse_sections_and_stored_order():
+    assert list(parse_sections(READING)) == ['CARD_READING', 'DAILY_AFFIRMATION']
+    assert parse_sections(None) == {}
+
+    stored = {
+        'interpretation': READING,
+        'sections': {'DAILY_AFFIRMATION': 'I trust the road ahead.', 'CARD_READING': 'The Star shines on your path.'}
+    }
+    assert list(with_sections(stored)['sections']) == ['CARD_READING', 'DAILY_AFFIRMATION']
+    assert with_sections({'interpretation': READING})['sections'] == parse_sections(READING)
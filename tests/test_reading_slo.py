@@ -0,0 +1,104 @@
+"""Latency SLO: quick readings of the same cards, and the paths that wait instead"""
+import asyncio
+
+from api_v2.core.llm_metrics import reading_fallbacks
+from api_v2.core.loader import request_scope
+
+
+def outcomes(endpoint: str) -> dict:
+    return dict(reading_fallbacks.stats().get(endpoint, dict.fromkeys(reading_fallbacks.OUTCOMES, 0)))
+
+
+def recorded(before: dict, endpoint: str, outcome: str) -> int:
+    return outcomes(endpoint)[outcome] - before.get(outcome, 0)
+
+
+def cards(reading: dict):
+    return reading.get('cardNames') or [reading['cardName']]
+
+
+async def tap(service, repo, kind: str, user: dict) -> dict:
+    with request_scope(repo):
+        if kind == 'daily':
+            return await service.generate_daily_reading(user)
+        return await service.generate_three_card_reading(user['nfc_id'])
+
+
+def test_past_the_slo_a_quick_reading_of_the_same_cards(reading_service, repo, add_user):
+    user = add_user('nfc_1')
+    reading_service.slo_seconds = {'daily': 0.05, 'three_card': 0.05}
+
+    async def main(kind):
+        first = await tap(reading_service, repo, kind, user)
+        await asyncio.gather(*reading_service._background)
+        return first, await tap(reading_service, repo, kind, user)
+
+    for kind in ('daily', 'three_card'):
+        before = outcomes(kind)
+        first, second = asyncio.run(main(kind))
+        assert first['degraded'] is True
+        assert second['cached'] and not second.get('degraded')
+        assert cards(first) == cards(second)
+        assert recorded(before, kind, 'slo_fallbacks') == 1
+        assert recorded(before, kind, 'background_completed') == 1
+
+
+def test_requests_joining_a_generation_get_its_cards(reading_service, repo, add_user):
+    user = add_user('nfc_1')
+    reading_service.slo_seconds = {'daily': 0.05, 'three_card': 0.05}
+
+    async def main(kind):
+        taps = [tap(reading_service, repo, kind, user) for _ in range(3)]
+        readings = await asyncio.gather(*taps)
+        await asyncio.gather(*reading_service._background)
+        return readings, await tap(reading_service, repo, kind, user)
+
+    for kind in ('daily', 'three_card'):
+        calls = reading_service.llm.calls
+        readings, full = asyncio.run(main(kind))
+        assert reading_service.llm.calls == calls + 1
+        assert all(reading['degraded'] and cards(reading) == cards(full) for reading in readings)
+
+
+def test_without_a_quick_reading_in_the_language_it_waits(reading_service, repo, add_user):
+    user = add_user('nfc_1', language='xx')
+    reading_service.slo_seconds = {'daily': 0.05, 'three_card': 0.05}
+    before = outcomes('daily')
+
+    reading = asyncio.run(tap(reading_service, repo, 'daily', user))
+    assert not reading.get('degraded')
+    assert reading['sections']['CARD_READING'] == 'full'
+    assert recorded(before, 'daily', 'on_time') == 1
+
+
+def test_no_cards_drawn_yet_waits_and_counts_late(reading_service):
+    reading_service.slo_seconds = {'daily': 0.01}
+    before = outcomes('daily')
+
+    async def generation():
+        await asyncio.sleep(0.05)
+        return {'cardName': 'The Star'}
+
+    result = asyncio.run(reading_service._within_slo('daily', generation(), lambda: None))
+    assert result == {'cardName': 'The Star'}
+    assert recorded(before, 'daily', 'late') == 1
+
+
+def test_without_an_slo_it_waits_for_claude(reading_service, repo, add_user):
+    user = add_user('nfc_1')
+    reading = asyncio.run(tap(reading_service, repo, 'daily', user))
+    assert not reading.get('degraded')
+    assert reading['sections']['CARD_READING'] == 'full'
+
+
+def test_claude_errors_fall_back(reading_service, repo, add_user):
+    user = add_user('nfc_1')
+    before = outcomes('daily')
+
+    async def fail(endpoint, **params):
+        raise RuntimeError("overloaded")
+
+    reading_service.llm.create = fail
+    reading = asyncio.run(tap(reading_service, repo, 'daily', user))
+    assert reading['cardName']
+    assert recorded(before, 'daily', 'error_fallbacks') == 1
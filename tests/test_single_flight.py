@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from api_v2.core.loader import current_loader, request_scope
+from api_v2.core.single_flight import FirestoreLease, SingleFlight
+
+
+def test_concurrent_callers_share_one_generation():
+    flight = SingleFlight()
+    calls = []
+
+    async def generate():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {'reading': len(calls)}
+
+    async def main():
+        return await asyncio.gather(*[flight.do('key', generate) for _ in range(5)])
+
+    results = asyncio.run(main())
+    assert calls == [1]
+    assert all(result is results[0] for result in results)
+    assert flight.get('key') is None
+
+
+def test_failure_is_shared_and_forgotten():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def main():
+        results = await asyncio.gather(flight.do('key', fail), flight.do('key', fail), return_exceptions=True)
+        # The next call after a failure generates again
+        retry = await flight.do('key', lambda: asyncio.sleep(0, result='ok'))
+        return results, retry
+
+    results, retry = asyncio.run(main())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert retry == 'ok'
+
+
+def test_cancelled_caller_does_not_cancel_the_generation():
+    flight = SingleFlight()
+
+    async def generate():
+        await asyncio.sleep(0.05)
+        return 'done'
+
+    async def main():
+        first = asyncio.ensure_future(flight.do('key', generate))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await flight.do('key', generate)
+
+    assert asyncio.run(main()) == 'done'
+
+
+def test_shared_scratch_is_visible_to_joiners_until_done():
+    flight = SingleFlight()
+
+    async def generate():
+        flight.shared('key')['prepared'] = {'card': 'The Star'}
+        await asyncio.sleep(0.05)
+        return 'done'
+
+    async def main():
+        task = flight.start('key', generate)
+        await asyncio.sleep(0.01)
+        during = dict(flight.shared('key'))
+        await task
+        return during, flight.shared('key')
+
+    during, after = asyncio.run(main())
+    assert during == {'prepared': {'card': 'The Star'}}
+    assert after == {}
+
+
+def test_lease_wait_for_polls_past_the_request_loader(repo, db):
+    lease = FirestoreLease(repo, ttl_seconds=1, poll_interval=0.01)
+    ref = repo.document('daily_readings', 'nfc_1_2025-01-31_en')
+    polls = []
+
+    async def fetch():
+        polls.append(current_loader())
+        if len(polls) == 3:
+            db.collection('daily_readings').document('nfc_1_2025-01-31_en').set({'cardName': 'The Star'})
+        return await repo.load(ref)
+
+    async def main():
+        with request_scope(repo):
+            return await lease.wait_for(fetch)
+
+    assert asyncio.run(main()) == {'cardName': 'The Star'}
+    assert polls[-1] is None and len(polls) >= 3
+
+
+def test_lease_wait_for_gives_up_when_the_lease_would_expire(repo):
+    lease = FirestoreLease(repo, ttl_seconds=0.05, poll_interval=0.01)
+
+    async def fetch():
+        return None
+
+    assert asyncio.run(lease.wait_for(fetch)) is None
+
+
+def test_lease_errors_never_block_a_reading(repo):
+    # The in-memory client has no transactions, so acquiring fails
+    lease = FirestoreLease(repo)
+    assert asyncio.run(lease.acquire('daily:nfc_1:2025-01-31')) is True
+
+
+class LostLease:
+    """Another worker holds the lease and (maybe) writes its result"""
+
+    def __init__(self, existing):
+        self.existing = existing
+
+    async def acquire(self, key: str) -> bool:
+        return False
+
+    async def wait_for(self, fetch):
+        return self.existing
+
+    async def release(self, key: str):
+        raise AssertionError("released a lease it never held")
+
+
+@pytest.mark.parametrize('existing, expected', [
+    ({'cardName': 'The Star', 'cached': True}, {'cardName': 'The Star', 'cached': True}),
+    (None, {'cardName': 'generated here'}),
+])
+def test_losing_the_lease_waits_for_the_other_worker(reading_service, existing, expected):
+    reading_service.lease = LostLease(existing)
+
+    async def generate():
+        return {'cardName': 'generated here'}
+
+    async def fetch_existing():
+        return None
+
+    result = asyncio.run(reading_service._coalesce('daily', 'nfc_1', '2025-01-31', generate, fetch_existing))
+    assert result == expected